@@ -1,54 +1,133 @@
 
-from machine import Pin, PWM, I2C # type: ignore
+try:
+    from machine import Pin, PWM, I2C # type: ignore
+except ImportError:
+    # Host side (CPython): any object providing readfrom_mem / readfrom_mem_into / writeto_mem can be used, see simulator.py
+    Pin = PWM = I2C = None
 from register_definitions import *
-from config_file import bmi270_config_file
+from fifo import ParseFIFO, AssignFrameTimes
+from bitfields import ValidateFields, FieldRegisters, ApplyFields, CoalesceRegisters
+from features import ValidateFeatureFields, FeaturePages, ApplyFeatureFields
+from convert import AccelerometerScale, GyroscopeScale, ConvertBatch
 from time import sleep
+from ticks import ticks_us, ticks_diff
+from struct import unpack
+import sys
 
-class BMI270(None):
-    def __init__(self, serial_device : I2C) -> None:
+class BMI270(object):
+    def __init__(self, serial_device : I2C, shadow : bool = False, initialise : bool = True, address : int = I2C_PRIM_ADDR) -> None:
 
         self.serial_device : I2C = serial_device
+        self.address : int = address        # I2C_PRIM_ADDR (SDO low) or I2C_SEC_ADDR (SDO high)
         self.acc_range = (2 * GRAVITY)
         self.acc_odr = 100
         self.gyr_range = 1000
         self.gyr_odr = 200
+        self.acc_scale = AccelerometerScale(self.acc_range)
+        self.gyr_scale = GyroscopeScale(self.gyr_range)
+        self.acc_fifo_downs : int = 0       # FIFO_DOWNS, reset value: filtered data, no downsampling
+        self.gyr_fifo_downs : int = 0
+        self.acc_fifo_filtered : bool = True
+        self.gyr_fifo_filtered : bool = True
+        self.data_buffer : bytearray = bytearray(DATA_BURST_LENGTH)
+        self.aux_buffer : bytearray = None      # AUX_BURST_LENGTH, allocated by SetupMagnetometer
+        self.magnetometer = None
+        self.status_cache : int = 0         # interrupt status bits read by TakeInterruptStatus but not consumed yet
+        self.config_upload_time : float = 0.0
+
+        self.shadow : dict = None
+        if(shadow):
+            self.EnableShadow()
+
+        # initialise=False leaves the upload / default settings to the caller (e.g. asynchronous.AsyncBMI270)
+        if(initialise):
+            self.LoadConfiguration()
+            self.Initialise()
 
-        self.LoadConfiguration()
-        self.SetAccelerometerRange(ACC_RANGE_2G)
-        self.SetGyroscopeRange(GYR_RANGE_1000)
-        self.SetAccelerometerBWP(ACC_BWP_NORMAL)
-        self.SetGyroscopeBWP(GYR_BWP_NORMAL)
-        self.EnableAccelerometer()
-        self.EnableGyroscope()
+
+        return None
 
 
+    def Initialise(self) -> None:
+        """
+        Applies the default ranges / bandwidths and enables the accelerometer and gyroscope.
+        """
+        self.Configure(acc_range=ACC_RANGE_2G, gyr_range=GYR_RANGE_1000, acc_bwp=ACC_BWP_NORMAL, gyr_bwp=GYR_BWP_NORMAL, acc_en=1, gyr_en=1)
         return None
 
 
-    def LoadConfiguration(self) -> None:
+    def LoadConfiguration(self, burst_size : int = CONFIG_BURST_SIZE) -> float:
         """
         This function 'loads' / 'flashes' the sensor with the configuration file if the device has not already been configured previously.
+        The configuration module is only imported here and is released again once the upload is done.
+        The file is sent in bursts of "burst_size" bytes (any even size up to 8192 that the host bus supports), each preceded by a single INIT_ADDR_0 / INIT_ADDR_1 write.
+        Returns the bus time of the INIT_DATA bursts in seconds (0.0 when the device was already configured), also kept in "config_upload_time".
         """
+        for delay in self.ConfigurationSteps(burst_size):
+            if(delay):
+                sleep(delay)
 
-        internal_status : int = self.ReadRegister(INTERNAL_STATUS)
-        if(internal_status == 0x01):
-            return None
-        else:
-
-            self.WriteRegister(PWR_CONF, 0x00)
-            sleep(0.00045)
-            self.WriteRegister(INIT_CTRL, 0x00)
+        return self.config_upload_time
 
-            for B in range(256):
-                self.WriteRegister(INIT_ADDR_0, 0x00)
-                self.WriteRegister(INIT_ADDR_1, B)
-                self.WriteI2CBlock(I2C_PRIM_ADDR, INIT_DATA, bmi270_config_file[(B*32):((B+1)*32)])
-                sleep(0.000020)
 
-            self.WriteRegister(INIT_CTRL, 0x01)
-            sleep(0.02)
+    def ConfigurationSteps(self, burst_size : int = CONFIG_BURST_SIZE):
+        """
+        Generator performing the LoadConfiguration upload one bus step at a time. Each yielded value is the time in seconds the caller
+        must wait before resuming (0 after each burst), so a scheduler can interleave other work with the upload.
+        "config_upload_time" only counts the bursts themselves, not the time the caller spends elsewhere between steps.
+        A bus whose "max_write" cannot carry a 2-byte burst raises ValueError.
+        """
+        self.config_upload_time = 0.0
 
+        internal_status : int = self.ReadRegister(INTERNAL_STATUS)
+        if(internal_status == 0x01):
+            return
 
+        if((burst_size < 2) or (burst_size % 2)):
+            print("Invalid command / setting!")
+            return
+
+        max_write = getattr(self.serial_device, 'max_write', None)
+        if((max_write is not None) and (burst_size > max_write)):
+            if(max_write < 2):
+                raise ValueError("Bus max_write too small for the configuration upload: {}".format(max_write))
+            burst_size = max_write & ~1
+
+        self.WriteRegister(PWR_CONF, 0x00)
+        yield 0.00045
+        self.WriteRegister(INIT_CTRL, 0x00)
+
+        upload_us : int = 0
+        from config_file import bmi270_config_file
+        config = memoryview(bmi270_config_file)
+        combined : bool = hasattr(self.serial_device, 'writeto_mem_blocks')
+        for offset in range(0, len(config), burst_size):
+            word_address : int = offset >> 1
+            init_address : bytes = bytes(((word_address & LSB_MASK_8BIT), (word_address >> 4)))
+            start : int = ticks_us()
+            if(combined):
+                # one combined transaction (e.g. linux_i2c.LinuxI2C I2C_RDWR) instead of two
+                self.serial_device.writeto_mem_blocks(self.address, ((INIT_ADDR_0, init_address), (INIT_DATA, config[offset:(offset + burst_size)])))
+            else:
+                self.WriteRegisters(INIT_ADDR_0, init_address)
+                self.serial_device.writeto_mem(self.address, INIT_DATA, config[offset:(offset + burst_size)])
+            upload_us += ticks_diff(ticks_us(), start)
+            yield 0
+        self.config_upload_time = upload_us / 1000000
+
+        del config, bmi270_config_file
+        self.ReleaseConfiguration()
+
+        self.WriteRegister(INIT_CTRL, 0x01)
+        yield 0.02
+
+
+    def ReleaseConfiguration(self) -> None:
+        """
+        Drops the configuration module from sys.modules so the 8 KB blob can be garbage collected after the upload.
+        """
+        if('config_file' in sys.modules):
+            del sys.modules['config_file']
         return None
 
 
@@ -77,14 +156,113 @@ class BMI270(None):
     def ReadRegister(self, address : int) -> int:
         """
         Reads the value from register accessed with "address" and returns the value held within said register as a little-endian integer.
+        Configuration registers are served from the shadow cache when it is enabled.
+        """
+        if((self.shadow is not None) and (address in self.shadow)):
+            return self.shadow[address]
+
+        value : int = int.from_bytes(self.serial_device.readfrom_mem(self.address, address, 1), 'little')
+        if((self.shadow is not None) and self.IsShadowed(address)):
+            self.shadow[address] = value
+
+        return value
+
+    def ReadRegisters(self, address : int, length : int) -> bytes:
+        """
+        Reads "length" consecutive registers starting at "address" in a single burst transaction and returns the raw bytes.
         """
-        return int.from_bytes(self.serial_device.readfrom_mem(I2C_PRIM_ADDR, address, 1), 'little')
+        if((self.shadow is not None) and all(((address + i) in self.shadow) for i in range(length))):
+            return bytes(self.shadow[address + i] for i in range(length))
+
+        return self.serial_device.readfrom_mem(self.address, address, length)
 
     def WriteRegister(self, address : int, value : int) -> None:
         """
         Writes to register at "address" the data "value" an integer/byte value (assuming little-endian architecture).
         """
-        self.serial_device.writeto_mem(I2C_PRIM_ADDR, address, bytearray(int.to_bytes(value, 1, 'little')))
+        self.serial_device.writeto_mem(self.address, address, bytearray(int.to_bytes(value, 1, 'little')))
+        if(self.shadow is not None):
+            self.UpdateShadow(address, (value,))
+        return None
+
+    def WriteRegisters(self, address : int, data : bytes) -> None:
+        """
+        Writes "data" to consecutive registers starting at "address" in a single burst transaction.
+        """
+        self.serial_device.writeto_mem(self.address, address, data)
+        if(self.shadow is not None):
+            self.UpdateShadow(address, data)
+        return None
+
+
+    def EnableInstrumentation(self):
+        """
+        Routes every bus transaction through an instrumentation.InstrumentedBus (per-register counters, latency histograms)
+        and returns it; call stats() / reset() on it. Nothing is measured, and nothing is added to the bus path, until this is called.
+        """
+        from instrumentation import InstrumentedBus
+
+        if(not isinstance(self.serial_device, InstrumentedBus)):
+            self.serial_device = InstrumentedBus(self.serial_device)
+        return self.serial_device
+
+    def DisableInstrumentation(self) -> None:
+        if(hasattr(self.serial_device, 'stats')):
+            self.serial_device = self.serial_device.bus
+        return None
+
+
+    def IsShadowed(self, address : int) -> bool:
+        for (first, count) in SHADOW_BLOCKS:
+            if(first <= address < (first + count)):
+                return True
+        return False
+
+    def EnableShadow(self) -> None:
+        """
+        Enables the write-through shadow of the configuration registers (SHADOW_BLOCKS) and populates it with one burst read per block.
+        Read-modify-write updates of those registers then only cost the write transaction.
+        """
+        self.shadow = {}
+        self.SyncShadow()
+        return None
+
+    def DisableShadow(self) -> None:
+        self.shadow = None
+        return None
+
+    def InvalidateShadow(self) -> None:
+        """
+        Drops every cached value, registers are re-read from the device on their next access (e.g. after a soft reset or a power mode change done outside the driver).
+        """
+        if(self.shadow is not None):
+            self.shadow = {}
+        return None
+
+    def SyncShadow(self) -> None:
+        """
+        Re-reads every shadowed register from the device.
+        """
+        if(self.shadow is None):
+            return None
+
+        self.shadow = {}
+        for (first, count) in SHADOW_BLOCKS:
+            data : bytes = self.serial_device.readfrom_mem(self.address, first, count)
+            for i in range(count):
+                self.shadow[first + i] = data[i]
+
+        return None
+
+    def UpdateShadow(self, address : int, data) -> None:
+        if((address == CMD) and (data[0] == CMD_SOFT_RESET)):
+            self.InvalidateShadow()
+            return None
+
+        for i in range(len(data)):
+            if(self.IsShadowed(address + i)):
+                self.shadow[address + i] = data[i]
+
         return None
 
     def UNSIGNED_TO_SIGNED(self, integer : int, byte_count : int) -> int:
@@ -166,6 +344,63 @@ class BMI270(None):
         return None
 
 
+    def WaitAuxIdle(self, timeout_ms : int = 10) -> None:
+        start : int = ticks_us()
+        while(self.ReadRegister(STATUS) & STATUS_AUX_BUSY):
+            if((ticks_diff(ticks_us(), start) // 1000) > timeout_ms):
+                raise OSError("Auxiliary interface busy")
+        return None
+
+
+    def AuxWrite(self, register : int, value : int) -> None:
+        """
+        Writes one register of the aux device (manual mode): AUX_WR_DATA then AUX_WR_ADDR, which starts the transfer.
+        """
+        self.WriteRegister(AUX_WR_DATA, value)
+        self.WriteRegister(AUX_WR_ADDR, register)
+        self.WaitAuxIdle()
+        return None
+
+
+    def AuxRead(self, register : int, length : int = 1) -> bytes:
+        """
+        Reads 1, 2, 6 or 8 registers of the aux device (manual mode) through AUX_DATA_0 ...
+        """
+        if(length not in AUX_BURST_CODES):
+            raise ValueError("Aux reads are 1, 2, 6 or 8 bytes long")
+
+        self.Configure(aux_man_rd_burst=AUX_BURST_CODES[length])
+        self.WriteRegister(AUX_RD_ADDR, register)
+        self.WaitAuxIdle()
+        return self.ReadRegisters(AUX_DATA_0, length)
+
+
+    def SetupMagnetometer(self, magnetometer, odr : int = AUX_ODR_25, offset : int = 0) -> None:
+        """
+        Brings "magnetometer" (an auxiliary.Magnetometer) into continuous measurement through the aux interface, then hands the
+        aux port to the BMI270 in data mode: it reads the magnetometer at "odr" (AUX_ODR_*) on its own, so ReadAllData9Into and
+        the FIFO (fifo_aux_en) carry magnetometer samples without extra host transactions.
+        """
+        if(magnetometer.burst not in AUX_BURST_CODES):
+            raise ValueError("Unsupported aux burst length: {}".format(magnetometer.burst))
+
+        self.Configure(aux_en=1, aux_if_en=1, aux_dev_addr=magnetometer.address, aux_manual_en=1)
+        for (register, value, delay_ms) in magnetometer.setup:
+            self.AuxWrite(register, value)
+            if(delay_ms):
+                sleep(delay_ms / 1000)
+
+        self.WriteRegister(AUX_RD_ADDR, magnetometer.data_register)
+        self.WaitAuxIdle()
+        self.Configure(aux_rd_burst=AUX_BURST_CODES[magnetometer.burst], aux_odr=odr, aux_offset=offset, aux_manual_en=0)
+
+        self.magnetometer = magnetometer
+        if(self.aux_buffer is None):
+            self.aux_buffer = bytearray(AUX_BURST_LENGTH)
+
+        return None
+
+
     def EnableGyroscope(self) -> None:
         self.WriteRegister(PWR_CTRL, (self.ReadRegister(PWR_CTRL) | BIT_1))
         return None
@@ -181,7 +416,7 @@ class BMI270(None):
         return None
 
     def DisableAccelerometer(self) -> None:
-        self.WriteRegister(PWR_CTRL, (self.ReadRegsiter(PWR_CTRL) & ~BIT_2))
+        self.WriteRegister(PWR_CTRL, (self.ReadRegister(PWR_CTRL) & ~BIT_2))
         return None
 
     def EnableTemperature(self) -> None:
@@ -208,6 +443,355 @@ class BMI270(None):
         self.WriteRegister(FIFO_CONFIG_1, (self.ReadRegister(FIFO_CONFIG_1) & ~LAST_3_BITS))
         return None
 
+    def EnableFIFOSensorTime(self) -> None:
+        self.WriteRegister(FIFO_CONFIG_0, (self.ReadRegister(FIFO_CONFIG_0) | BIT_1))
+        return None
+
+    def DisableFIFOSensorTime(self) -> None:
+        self.WriteRegister(FIFO_CONFIG_0, (self.ReadRegister(FIFO_CONFIG_0) & ~BIT_1))
+        return None
+
+    def SetFIFOWatermark(self, level : int) -> None:
+        """
+        Sets the FIFO watermark level in bytes (FIFO_WTM_0 / FIFO_WTM_1 written in a single transaction).
+        """
+        if((level < 0) or (level > FIFO_SIZE)):
+            print("Invalid command / setting!")
+            return None
+
+        self.WriteRegisters(FIFO_WTM_0, bytes((level & 0xFF, (level >> 8) & 0x1F)))
+        return None
+
+    def FlushFIFO(self) -> None:
+        self.WriteRegister(CMD, CMD_FIFO_FLUSH)
+        return None
+
+    def ReadFIFOLength(self) -> int:
+        """
+        Returns the number of bytes currently held in the FIFO.
+        """
+        (fifo_length,) = unpack('<H', self.ReadRegisters(FIFO_LENGTH_0, 2))
+        return (fifo_length & FIFO_LENGTH_MASK)
+
+    def ReadFIFOData(self, length : int, chunk_size : int = FIFO_CHUNK_SIZE) -> bytearray:
+        """
+        Drains "length" bytes from FIFO_DATA using bursts of at most "chunk_size" bytes.
+        """
+        data : bytearray = bytearray(length)
+        view = memoryview(data)
+
+        for start in range(0, length, chunk_size):
+            self.serial_device.readfrom_mem_into(self.address, FIFO_DATA, view[start:(start + chunk_size)])
+
+        return data
+
+    def ReadFIFOFrames(self, chunk_size : int = FIFO_CHUNK_SIZE):
+        """
+        Generator draining the FIFO once and yielding its decoded FIFOFrame objects.
+        The frame layout (headered / headerless, enabled sensors, sensortime) is taken from FIFO_CONFIG_0 / FIFO_CONFIG_1.
+        """
+        (fifo_config_0, fifo_config_1) = self.ReadRegisters(FIFO_CONFIG_0, 2)
+        header : bool = bool(fifo_config_1 & BIT_4)
+
+        length : int = self.ReadFIFOLength()
+        if(length == 0):
+            return
+
+        # The sensortime frame is only appended once the FIFO has been read past its last data frame
+        if(header and (fifo_config_0 & BIT_1)):
+            length += (1 + FIFO_SENSORTIME_LENGTH)
+
+        data : bytearray = self.ReadFIFOData(length, chunk_size)
+
+        yield from ParseFIFO(data, header=header, acc=bool(fifo_config_1 & BIT_6), gyr=bool(fifo_config_1 & BIT_7), aux=bool(fifo_config_1 & BIT_5))
+
+    def ReadFIFOBatch(self, chunk_size : int = FIFO_CHUNK_SIZE, timestamps : bool = False) -> list:
+        """
+        Drains the FIFO once and returns its decoded FIFOFrame objects as a list.
+        With "timestamps" the data frames get their sensortime ("time") from the batch's sensortime frame, spaced at the effective FIFO rate.
+        """
+        frames : list = list(self.ReadFIFOFrames(chunk_size))
+        if(timestamps):
+            AssignFrameTimes(frames, self.FIFOFrameRate(frames))
+
+        return frames
+
+    def FIFORates(self) -> tuple:
+        """
+        Effective (accelerometer, gyroscope) FIFO rates in Hz: the ODR (filtered data) or the pre-filter rate (unfiltered data),
+        divided by the FIFO_DOWNS factor.
+        """
+        acc_rate : float = self.acc_odr if self.acc_fifo_filtered else ACC_UNFILTERED_RATE
+        gyr_rate : float = self.gyr_odr if self.gyr_fifo_filtered else GYR_UNFILTERED_RATE
+        return ((acc_rate / (1 << self.acc_fifo_downs)), (gyr_rate / (1 << self.gyr_fifo_downs)))
+
+    def FIFOFrameRate(self, frames : list) -> float:
+        """
+        Rate at which the FIFO produced "frames": that of the fastest sensor they carry.
+        """
+        (acc_rate, gyr_rate) = self.FIFORates()
+        rate : float = 0.0
+        for frame in frames:
+            if(frame.acc is not None):
+                rate = max(rate, acc_rate)
+            if(frame.gyr is not None):
+                rate = max(rate, gyr_rate)
+            if(rate == max(acc_rate, gyr_rate)):
+                break
+
+        return rate
+
+    def ConfigureFIFO(self, acc : bool = True, gyr : bool = True, aux : bool = False, header : bool = True, sensortime : bool = True,
+                      acc_downsampling : int = 1, gyr_downsampling : int = 1, acc_filtered : bool = True, gyr_filtered : bool = True,
+                      stop_on_full : bool = False) -> None:
+        """
+        Sets the FIFO frame composition (FIFO_CONFIG_0 / FIFO_CONFIG_1) and the per-sensor downsampling (FIFO_DOWNS) in one Configure
+        transaction. "acc_downsampling" / "gyr_downsampling" are powers of two up to 128 dividing the FIFO rate of filtered data (the ODR)
+        or of unfiltered data (ACC_UNFILTERED_RATE / GYR_UNFILTERED_RATE); the data registers keep the full ODR.
+        """
+        downs : list = []
+        for factor in (acc_downsampling, gyr_downsampling):
+            exponent : int = factor.bit_length() - 1
+            if((factor < 1) or (factor != (1 << exponent)) or (exponent > FIFO_DOWNS_MAX)):
+                raise ValueError("FIFO downsampling must be a power of two from 1 to {}: {}".format(1 << FIFO_DOWNS_MAX, factor))
+            downs.append(exponent)
+
+        self.Configure(fifo_acc_en=int(acc), fifo_gyr_en=int(gyr), fifo_aux_en=int(aux), fifo_header_en=int(header),
+                       fifo_time_en=int(sensortime), fifo_stop_on_full=int(stop_on_full), acc_fifo_downs=downs[0], gyr_fifo_downs=downs[1],
+                       acc_fifo_filt_data=int(acc_filtered), gyr_fifo_filt_data=int(gyr_filtered))
+        return None
+
+    def ConfigureInterrupt(self, pin : int = INT_PIN_1, data_ready : bool = False, watermark : bool = False, full : bool = False,
+                           active_high : bool = True, open_drain : bool = False, latched : bool = False) -> None:
+        """
+        Enables the INT1 / INT2 output ("pin") and maps the data-ready, FIFO watermark and FIFO full interrupts to it (INT_MAP_DATA).
+        The other pin's mapping is left untouched. Everything is committed through Configure.
+        """
+        if(pin not in (INT_PIN_1, INT_PIN_2)):
+            print("Invalid command / setting!")
+            return None
+
+        prefix : str = 'int{}_'.format(pin)
+        fields : dict = {
+            (prefix + 'output_en') : 1,
+            (prefix + 'lvl') : int(active_high),
+            (prefix + 'od') : int(open_drain),
+            (prefix + 'drdy') : int(data_ready),
+            (prefix + 'fwm') : int(watermark),
+            (prefix + 'ffull') : int(full),
+            'int_latch' : int(latched),
+        }
+        self.Configure(**fields)
+
+        return None
+
+    def ReadInterruptStatus(self) -> int:
+        """
+        Reads (and thereby clears) INT_STATUS_0 / INT_STATUS_1 in one burst and returns them as INT_STATUS_0 | (INT_STATUS_1 << 8), see the INT_STATUS_* definitions.
+        Bits an earlier TakeInterruptStatus read but did not consume are included.
+        """
+        (status,) = unpack('<H', self.ReadRegisters(INT_STATUS_0, 2))
+        status |= self.status_cache
+        self.status_cache = 0
+        return status
+
+    def TakeInterruptStatus(self, mask : int) -> int:
+        """
+        Like ReadInterruptStatus, but only consumes the bits in "mask": the others stay in "status_cache" for the next
+        ReadInterruptStatus / TakeInterruptStatus caller, so clear-on-read does not swallow them.
+        """
+        (status,) = unpack('<H', self.ReadRegisters(INT_STATUS_0, 2))
+        status |= self.status_cache
+        self.status_cache = status & ~mask
+        return (status & mask)
+
+    def ReadFeaturePage(self, page : int) -> bytes:
+        """
+        Selects feature page "page" (FEAT_PAGE) and reads its 16 bytes in one burst.
+        """
+        self.WriteRegister(FEAT_PAGE, page)
+        return self.ReadRegisters(FEATURES_0, FEATURE_PAGE_LENGTH)
+
+    def WriteFeaturePage(self, page : int, data) -> None:
+        self.WriteRegister(FEAT_PAGE, page)
+        self.WriteRegisters(FEATURES_0, data)
+        return None
+
+    def ConfigureFeatures(self, **fields) -> None:
+        """
+        Applies several feature settings (names from features.FEATURE_FIELDS) with one read and at most one write burst per page,
+        e.g. ConfigureFeatures(any_motion_threshold=170, any_motion_en=1). Advanced power save is suspended while the pages are
+        written (the feature engine ignores writes in that state) and restored afterwards.
+        """
+        if(not ValidateFeatureFields(fields)):
+            print("Invalid command / setting!")
+            return None
+
+        power_save : int = self.ReadRegister(PWR_CONF) & BIT_0
+        if(power_save):
+            self.WriteRegister(PWR_CONF, self.ReadRegister(PWR_CONF) & ~BIT_0)
+            sleep(0.00045)
+        try:
+            for page in FeaturePages(fields):
+                data : bytes = self.ReadFeaturePage(page)
+                new_data : bytearray = ApplyFeatureFields(page, data, fields)
+                if(new_data != data):
+                    self.WriteRegisters(FEATURES_0, new_data)
+        finally:
+            if(power_save):
+                self.WriteRegister(PWR_CONF, self.ReadRegister(PWR_CONF) | BIT_0)
+
+        return None
+
+    def MotionSettings(self, prefix : str, threshold : float, duration : float, axes : str, enable : bool) -> dict:
+        """
+        Converts a threshold in g and a duration in seconds to the any_motion_* / no_motion_* fields.
+        """
+        threshold_code : int = int(round(threshold / MOTION_THRESHOLD_RESOLUTION))
+        duration_code : int = int(round(duration / MOTION_DURATION_RESOLUTION))
+        if(not (0 <= threshold_code < 2048)):
+            raise ValueError("Motion threshold out of range (0 .. 1 g): {}".format(threshold))
+        if(not (0 <= duration_code < 8192)):
+            raise ValueError("Motion duration out of range (0 .. 163 s): {}".format(duration))
+
+        return {
+            (prefix + 'threshold') : threshold_code,
+            (prefix + 'duration') : duration_code,
+            (prefix + 'x') : int('x' in axes),
+            (prefix + 'y') : int('y' in axes),
+            (prefix + 'z') : int('z' in axes),
+            (prefix + 'en') : int(enable),
+        }
+
+    def ConfigureAnyMotion(self, threshold : float = 0.083, duration : float = 0.1, axes : str = 'xyz', enable : bool = True) -> None:
+        """
+        Any-motion: fires once the acceleration of one of "axes" changed by more than "threshold" g for "duration" seconds.
+        Needs the accelerometer enabled (at 50 Hz or more).
+        """
+        self.ConfigureFeatures(**self.MotionSettings('any_motion_', threshold, duration, axes, enable))
+        return None
+
+    def ConfigureNoMotion(self, threshold : float = 0.07, duration : float = 5.0, axes : str = 'xyz', enable : bool = True) -> None:
+        """
+        No-motion: fires once the acceleration of all "axes" stayed within "threshold" g for "duration" seconds.
+        """
+        self.ConfigureFeatures(**self.MotionSettings('no_motion_', threshold, duration, axes, enable))
+        return None
+
+    def EnableStepCounter(self, watermark : int = 0, detector : bool = False, activity : bool = False) -> None:
+        """
+        Starts the step counter; "watermark" (a multiple of STEP_WATERMARK_RESOLUTION steps, 0 for none) raises the step counter
+        interrupt every that many steps, "detector" raises it on every step instead, "activity" enables the activity output.
+        """
+        if(watermark % STEP_WATERMARK_RESOLUTION):
+            raise ValueError("Step watermark must be a multiple of {}".format(STEP_WATERMARK_RESOLUTION))
+
+        self.ConfigureFeatures(step_counter_en=1, step_counter_watermark=(watermark // STEP_WATERMARK_RESOLUTION),
+                               step_detector_en=int(detector), step_activity_en=int(activity))
+        return None
+
+    def DisableStepCounter(self) -> None:
+        self.ConfigureFeatures(step_counter_en=0, step_detector_en=0, step_activity_en=0)
+        return None
+
+    def ResetStepCounter(self) -> None:
+        self.ConfigureFeatures(step_counter_reset=1)
+        return None
+
+    def ConfigureWristGesture(self, enable : bool = True, right_arm : bool = False) -> None:
+        self.ConfigureFeatures(wrist_gesture_en=int(enable), wrist_gesture_arm=int(right_arm))
+        return None
+
+    def ReadFeatureOutputs(self) -> tuple:
+        """
+        Reads the output page in one burst and returns (step count, ACTIVITY_*, WRIST_GESTURE_*).
+        """
+        data : bytes = self.ReadFeaturePage(FEATURE_OUTPUT_PAGE)
+        (steps,) = unpack('<I', data[FEATURE_OUT_STEP_COUNT:(FEATURE_OUT_STEP_COUNT + 4)])
+        return (steps, data[FEATURE_OUT_ACTIVITY] & 0x03, data[FEATURE_OUT_WRIST_GESTURE] & FIRST_3_BITS)
+
+    def ReadStepCount(self) -> int:
+        return self.ReadFeatureOutputs()[0]
+
+    def ReadActivity(self) -> int:
+        return self.ReadFeatureOutputs()[1]
+
+    def ReadWristGesture(self) -> int:
+        return self.ReadFeatureOutputs()[2]
+
+    def MapFeatureInterrupt(self, pin : int = INT_PIN_1, any_motion : bool = False, no_motion : bool = False, step_counter : bool = False,
+                            activity : bool = False, wrist_gesture : bool = False, active_high : bool = True, open_drain : bool = False,
+                            latched : bool = False) -> None:
+        """
+        Enables the INT1 / INT2 output ("pin") and maps the feature interrupts to it (INT1_MAP_FEAT / INT2_MAP_FEAT), e.g. to wake the
+        host on any-motion and stop streaming on no-motion. The data interrupts (ConfigureInterrupt) are left untouched.
+        """
+        if(pin not in (INT_PIN_1, INT_PIN_2)):
+            print("Invalid command / setting!")
+            return None
+
+        prefix : str = 'int{}_'.format(pin)
+        fields : dict = {
+            (prefix + 'output_en') : 1,
+            (prefix + 'lvl') : int(active_high),
+            (prefix + 'od') : int(open_drain),
+            (prefix + 'any_motion') : int(any_motion),
+            (prefix + 'no_motion') : int(no_motion),
+            (prefix + 'step_counter') : int(step_counter),
+            (prefix + 'activity') : int(activity),
+            (prefix + 'wrist_gesture') : int(wrist_gesture),
+            'int_latch' : int(latched),
+        }
+        self.Configure(**fields)
+
+        return None
+
+    def ReadOffsets(self) -> tuple:
+        """
+        Reads OFFSET_0 .. OFFSET_6 in one burst and returns ((acc_x, acc_y, acc_z), (gyr_x, gyr_y, gyr_z)) as signed register values
+        (ACC_OFFSET_RESOLUTION g / GYR_OFFSET_RESOLUTION deg/s per LSB).
+        """
+        data : bytes = self.ReadRegisters(OFFSET_0, OFFSET_LENGTH)
+
+        acc_offsets : tuple = tuple(self.UNSIGNED_TO_SIGNED(value, 1) for value in data[0:3])
+        gyr_offsets : list = []
+        for axis in range(3):
+            value : int = data[3 + axis] | (((data[6] >> (2 * axis)) & 0x03) << 8)
+            gyr_offsets.append((value - 1024) if (value > GYR_OFFSET_MAX) else value)
+
+        return (acc_offsets, tuple(gyr_offsets))
+
+    def WriteOffsets(self, acc_offsets : tuple, gyr_offsets : tuple) -> None:
+        """
+        Writes the accelerometer (int8) and gyroscope (10-bit) offsets in one burst, keeping the gyr_off_en / gyr_gain_en bits of OFFSET_6.
+        The values are added to the sensor output once enabled with EnableOffsetCompensation; they are lost on power-down / soft reset.
+        """
+        for value in acc_offsets:
+            if(not (ACC_OFFSET_MIN <= value <= ACC_OFFSET_MAX)):
+                raise ValueError("Accelerometer offset out of range: {}".format(value))
+        for value in gyr_offsets:
+            if(not (GYR_OFFSET_MIN <= value <= GYR_OFFSET_MAX)):
+                raise ValueError("Gyroscope offset out of range: {}".format(value))
+
+        data : bytearray = bytearray(OFFSET_LENGTH)
+        data[6] = self.ReadRegister(OFFSET_6) & LAST_2_BITS
+        for axis in range(3):
+            data[axis] = acc_offsets[axis] & FULL_MASK_8BIT
+            value : int = gyr_offsets[axis] & 0x3FF
+            data[3 + axis] = value & FULL_MASK_8BIT
+            data[6] |= (value >> 8) << (2 * axis)
+
+        self.WriteRegisters(OFFSET_0, data)
+        return None
+
+    def EnableOffsetCompensation(self, accelerometer : bool = True, gyroscope : bool = True) -> None:
+        self.Configure(acc_off_en=int(accelerometer), gyr_off_en=int(gyroscope))
+        return None
+
+    def DisableOffsetCompensation(self) -> None:
+        self.Configure(acc_off_en=0, gyr_off_en=0)
+        return None
+
     def EnableAccelFilterPeformance(self) -> None:
         self.WriteRegister(ACC_CONF, (self.ReadRegister(ACC_CONF) | BIT_7))
         return None
@@ -233,19 +817,65 @@ class BMI270(None):
         return None
     
     
+    def Configure(self, **fields) -> None:
+        """
+        Applies several configuration bitfields (names from bitfields.FIELDS) as one transaction, e.g. Configure(acc_odr=ACC_ODR_1600, gyr_odr=GYR_ODR_3200).
+        The touched registers are read in contiguous bursts (or taken from the shadow cache), the final register image is computed
+        and only the changed registers are written back, one burst per contiguous block, in ascending address order.
+        """
+        if(not ValidateFields(fields)):
+            print("Invalid command / setting!")
+            return None
+
+        blocks : list = CoalesceRegisters(FieldRegisters(fields))
+
+        image : dict = {}
+        for (first, count) in blocks:
+            data : bytes = self.ReadRegisters(first, count)
+            for i in range(count):
+                image[first + i] = data[i]
+
+        new_image : dict = ApplyFields(image, fields)
+
+        for (first, count) in blocks:
+            changed : list = [register for register in range(first, (first + count)) if(new_image[register] != image[register])]
+            if(changed):
+                self.WriteRegisters(changed[0], bytes(new_image[register] for register in range(changed[0], (changed[-1] + 1))))
+
+        self.UpdateSettings(fields)
+
+        return None
+
+
+    def UpdateSettings(self, fields : dict) -> None:
+        """
+        Keeps the cached range / ODR / FIFO downsampling attributes and the precomputed LSB scale factors in step with the fields written by Configure.
+        """
+        if('acc_range' in fields):
+            self.acc_range = ACC_RANGE_VALUES.get(fields['acc_range'], self.acc_range)
+            self.acc_scale = AccelerometerScale(self.acc_range)
+        if('acc_odr' in fields):
+            self.acc_odr = ACC_ODR_VALUES.get(fields['acc_odr'], self.acc_odr)
+        if('gyr_range' in fields):
+            self.gyr_range = GYR_RANGE_VALUES.get(fields['gyr_range'], self.gyr_range)
+            self.gyr_scale = GyroscopeScale(self.gyr_range)
+        if('gyr_odr' in fields):
+            self.gyr_odr = GYR_ODR_VALUES.get(fields['gyr_odr'], self.gyr_odr)
+        if('acc_fifo_downs' in fields):
+            self.acc_fifo_downs = fields['acc_fifo_downs']
+        if('gyr_fifo_downs' in fields):
+            self.gyr_fifo_downs = fields['gyr_fifo_downs']
+        if('acc_fifo_filt_data' in fields):
+            self.acc_fifo_filtered = bool(fields['acc_fifo_filt_data'])
+        if('gyr_fifo_filt_data' in fields):
+            self.gyr_fifo_filtered = bool(fields['gyr_fifo_filt_data'])
+
+        return None
+
+
     def SetAccelerometerRange(self, new_range : int = ACC_RANGE_2G) -> None:
-        if(new_range == ACC_RANGE_2G):
-            self.WriteRegister(ACC_RANGE, ACC_RANGE_2G)
-            self.acc_range = (2 * GRAVITY)
-        elif(new_range == ACC_RANGE_4G):
-            self.WriteRegister(ACC_RANGE, ACC_RANGE_4G)
-            self.acc_range = (4 * GRAVITY)
-        elif(new_range == ACC_RANGE_8G):
-            self.WriteRegister(ACC_RANGE, ACC_RANGE_8G)
-            self.acc_range = (8 * GRAVITY)
-        elif(new_range == ACC_RANGE_16G):
-            self.WriteRegister(ACC_RANGE, ACC_RANGE_16G)
-            self.acc_range = (16 * GRAVITY)
+        if(new_range in ACC_RANGE_VALUES):
+            self.Configure(acc_range=new_range)
         else:
             print("Invalid command / setting!")
     
@@ -253,22 +883,8 @@ class BMI270(None):
     
 
     def SetGyroscopeRange(self, new_range : int = GYR_RANGE_2000) -> None:
-        
-        if(new_range == GYR_RANGE_2000):
-            self.WriteRegister(GYR_RANGE, GYR_RANGE_2000)
-            self.gyr_range = 2000
-        elif(new_range == GYR_RANGE_1000):
-            self.WriteRegister(GYR_RANGE, GYR_RANGE_1000)
-            self.gyr_range = 1000
-        elif(new_range == GYR_RANGE_500):
-            self.WriteRegister(GYR_RANGE, GYR_RANGE_500)
-            self.gyr_range = 500
-        elif(new_range == GYR_RANGE_250):
-            self.WriteRegister(GYR_RANGE_250)
-            self.gyr_range = 250
-        elif(new_range == GYR_RANGE_125):
-            self.WriteRegister(GYR_RANGE_125)
-            self.gyr_range = 125
+        if(new_range in GYR_RANGE_VALUES):
+            self.Configure(gyr_range=new_range)
         else:
             print("Invalid command / setting!")
 
@@ -277,27 +893,8 @@ class BMI270(None):
     
 
     def SetAccelerometerODR(self, ODR_VALUE : int) -> None:
-        if(ODR_VALUE == ACC_ODR_1600):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & MSB_MASK_8BIT) | ACC_ODR_1600))
-            self.acc_odr = 1600
-        elif(ODR_VALUE == ACC_ODR_800):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & MSB_MASK_8BIT) | ACC_ODR_800))
-            self.acc_odr = 800
-        elif(ODR_VALUE == ACC_ODR_400):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & MSB_MASK_8BIT) | ACC_ODR_400))
-            self.acc_odr = 400
-        elif(ODR_VALUE == ACC_ODR_200):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & MSB_MASK_8BIT) | ACC_ODR_200))
-            self.acc_odr = 200
-        elif(ODR_VALUE == ACC_ODR_100):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & MSB_MASK_8BIT) | ACC_ODR_100))
-            self.acc_odr = 100
-        elif(ODR_VALUE == ACC_ODR_50):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & MSB_MASK_8BIT) | ACC_ODR_50))
-            self.acc_odr = 50
-        elif(ODR_VALUE == ACC_ODR_25):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & MSB_MASK_8BIT) | ACC_ODR_25))
-            self.acc_odr = 25
+        if(ODR_VALUE in ACC_ODR_VALUES):
+            self.Configure(acc_odr=ODR_VALUE)
         else:
             print("Invalid command / setting!")
             
@@ -305,30 +902,8 @@ class BMI270(None):
 
   
     def SetGyroscopeODR(self, odr : int = GYR_ODR_200) -> None:      
-        if(odr == GYR_ODR_3200):
-            self.WriteRegister(GYR_CONF, ((self.ReadRegister(GYR_CONF) & MSB_MASK_8BIT) | GYR_ODR_3200))
-            self.gyr_odr = 3200
-        elif(odr == GYR_ODR_1600):
-            self.WriteRegister(GYR_CONF, ((self.ReadRegister(GYR_CONF) & MSB_MASK_8BIT) | GYR_ODR_1600))
-            self.gyr_odr = 1600
-        elif(odr == GYR_ODR_800):
-            self.WriteRegister(GYR_CONF, ((self.ReadRegister(GYR_CONF) & MSB_MASK_8BIT) | GYR_ODR_800))
-            self.gyr_odr = 800
-        elif(odr == GYR_ODR_400):
-            self.WriteRegister(GYR_CONF, ((self.ReadRegister(GYR_CONF) & MSB_MASK_8BIT) | GYR_ODR_400))
-            self.gyr_odr = 400
-        elif(odr == GYR_ODR_200):
-            self.WriteRegister(GYR_CONF, ((self.ReadRegister(GYR_CONF) & MSB_MASK_8BIT) | GYR_ODR_200))
-            self.gyr_odr = 200
-        elif(odr == GYR_ODR_100):
-            self.WriteRegister(GYR_CONF, ((self.ReadRegister(GYR_CONF) & MSB_MASK_8BIT) | GYR_ODR_100))
-            self.gyr_odr = 100
-        elif(odr == GYR_ODR_50):
-            self.WriteRegister(GYR_CONF, ((self.ReadRegister(GYR_CONF) & MSB_MASK_8BIT) | GYR_ODR_50))
-            self.gyr_odr = 50
-        elif(odr == GYR_ODR_25):
-            self.WriteRegister(GYR_CONF, ((self.ReadRegister(GYR_CONF) & MSB_MASK_8BIT) | GYR_ODR_25))
-            self.gyr_odr = 25
+        if(odr in GYR_ODR_VALUES):
+            self.Configure(gyr_odr=odr)
         else:
             print("Invalid command / setting!")
     
@@ -336,22 +911,8 @@ class BMI270(None):
 
 
     def SetAccelerometerBWP(self, bwp : int = ACC_BWP_NORMAL) -> None:
-        if(bwp == ACC_BWP_OSR4):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & LSB_MASK_8BIT_8) | (ACC_BWP_OSR4 << 4)))
-        elif(bwp == ACC_BWP_OSR2):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & LSB_MASK_8BIT_8) | (ACC_BWP_OSR2 << 4)))
-        elif(bwp == ACC_BWP_NORMAL):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & LSB_MASK_8BIT_8) | (ACC_BWP_NORMAL << 4)))
-        elif(bwp == ACC_BWP_CIC):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & LSB_MASK_8BIT_8) | (ACC_BWP_CIC << 4)))
-        elif(bwp == ACC_BWP_RES16):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & LSB_MASK_8BIT_8) | (ACC_BWP_RES16 << 4)))
-        elif(bwp == ACC_BWP_RES32):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & LSB_MASK_8BIT_8) | (ACC_BWP_RES32 << 4)))
-        elif(bwp == ACC_BWP_RES64):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & LSB_MASK_8BIT_8) | (ACC_BWP_RES64 << 4)))
-        elif(bwp == ACC_BWP_RES128):
-            self.WriteRegister(ACC_CONF, ((self.ReadRegister(ACC_CONF) & LSB_MASK_8BIT_8) | (ACC_BWP_RES128 << 4)))
+        if(ACC_BWP_OSR4 <= bwp <= ACC_BWP_RES128):
+            self.Configure(acc_bwp=bwp)
         else:
             print("Invalid command / setting!")
 
@@ -359,12 +920,8 @@ class BMI270(None):
 
 
     def SetGyroscopeBWP(self, bwp : int = GYR_BWP_NORMAL) -> None:
-        if(bwp == GYR_BWP_OSR4):
-            self.WriteRegister(GYR_CONF, ((self.ReadRegister(GYR_CONF) & LSB_MASK_8BIT_8) | (GYR_BWP_OSR4 << 4)))
-        elif(bwp == GYR_BWP_OSR2):
-            self.WriteRegister(GYR_CONF, ((self.ReadRegister(GYR_CONF) & LSB_MASK_8BIT_8) | (GYR_BWP_OSR2 << 4)))
-        elif(bwp == GYR_BWP_NORMAL):
-            self.WriteRegister(GYR_CONF, ((self.ReadRegister(GYR_CONF) & LSB_MASK_8BIT_8) | (GYR_BWP_NORMAL << 4)))
+        if(GYR_BWP_OSR4 <= bwp <= GYR_BWP_NORMAL):
+            self.Configure(gyr_bwp=bwp)
         else:
             print("Invalid setting / command !")
             
@@ -372,39 +929,34 @@ class BMI270(None):
 
 
     def RawAccelerometer_XData(self) -> int:
-        raw_acc_x_data : int = ((self.ReadRegister(ACC_X_15_8) << 8) | self.ReadRegister(ACC_X_7_0))
+        (raw_acc_x_data,) = unpack('<H', self.ReadRegisters(ACC_X_7_0, 2))
         return raw_acc_x_data
 
     def RawAccelerometer_YData(self) -> int:
-        raw_acc_y_data : int = ((self.ReadRegister(ACC_Y_15_8) << 8) | self.ReadRegister(ACC_Y_7_0))
+        (raw_acc_y_data,) = unpack('<H', self.ReadRegisters(ACC_Y_7_0, 2))
         return raw_acc_y_data
 
     def RawAccelerometer_ZData(self) -> int:
-        raw_acc_z_data : int = ((self.ReadRegister(ACC_Z_15_8) << 8) | self.ReadRegister(ACC_Z_7_0))
+        (raw_acc_z_data,) = unpack('<H', self.ReadRegisters(ACC_Z_7_0, 2))
         return raw_acc_z_data
 
     def RawAccelerometerData(self) -> tuple:
-        x_data = self.RawAccelerometer_XData()
-        y_data = self.RawAccelerometer_YData()
-        z_data = self.RawAccelerometer_ZData()
-
-        full_data = (x_data, y_data, z_data)
+        full_data : tuple = unpack('<3H', self.ReadRegisters(ACC_X_7_0, 6))
 
         return full_data
 
     def FormatRawAccelerometer(self, value : int) -> float:
         if(value > 32767):
-            new_value : float = (((value - 65536) / 32768) * self.acc_range)
-        else:
-            new_value : float =  ((value / 32768) * self.acc_range)
+            value -= 65536
 
-        return new_value
+        return (value * self.acc_scale)
 
 
     def FormatAccelerometerData(self) -> tuple:
-        new_x_data = self.FormatRawAccelerometer(value=self.RawAccelerometer_XData())
-        new_y_data = self.FormatRawAccelerometer(value=self.RawAccelerometer_YData())
-        new_z_data = self.FormatRawAccelerometer(value=self.RawAccelerometer_ZData())
+        (x_data, y_data, z_data) = self.RawAccelerometerData()
+        new_x_data = self.FormatRawAccelerometer(value=x_data)
+        new_y_data = self.FormatRawAccelerometer(value=y_data)
+        new_z_data = self.FormatRawAccelerometer(value=z_data)
 
         new_data_tuple : tuple = (new_x_data, new_y_data, new_z_data)
 
@@ -413,41 +965,44 @@ class BMI270(None):
 
 
     def RawGyroscope_XData(self) -> int:
-        raw_gyr_x_data : int = ((self.ReadRegister(GYR_X_15_8) << 8) | self.ReadRegister(GYR_Y_7_0))
+        (raw_gyr_x_data,) = unpack('<H', self.ReadRegisters(GYR_X_7_0, 2))
         return raw_gyr_x_data
 
     def RawGyroscope_YData(self) -> int:
-        raw_gyr_y_data : int = ((self.ReadRegister(GYR_Y_15_8) << 8) | self.ReadRegister(GYR_Y_7_0))
+        (raw_gyr_y_data,) = unpack('<H', self.ReadRegisters(GYR_Y_7_0, 2))
         return raw_gyr_y_data
 
     def RawGyroscope_ZData(self) -> int:
-        raw_gyr_z_data : int = ((self.ReadRegister(GYR_Z_15_8) << 8) | self.ReadRegister(GYR_Z_7_0))
+        (raw_gyr_z_data,) = unpack('<H', self.ReadRegisters(GYR_Z_7_0, 2))
         return raw_gyr_z_data
 
 
     def RawGyroscopeData(self) -> tuple:
-        x_data = self.RawGyroscope_XData()
-        y_data = self.RawGyroscope_YData()
-        z_data = self.RawGyroscope_ZData()
-
-        full_data = (x_data, y_data, z_data)
+        full_data : tuple = unpack('<3H', self.ReadRegisters(GYR_X_7_0, 6))
 
         return full_data
 
 
     def FormatRawGyroscope(self, value : int) -> float:
         if(value > 32767):
-            new_data = (1.2 * ((value - 65536) / 32768) * self.gyr_range)
-        else:
-            new_data = (1.2 * (value / 32768) * self.gyr_range)
+            value -= 65536
 
-        return new_data
+        return (value * self.gyr_scale)
+
+
+    def FormatBatch(self, raw) -> tuple:
+        """
+        Converts a block of raw samples of shape (N, 6) (acc x/y/z, gyr x/y/z) with the current ranges, see convert.ConvertBatch.
+        Returns (acc, gyr) in m/s^2 and deg/s.
+        """
+        return ConvertBatch(raw, self.acc_scale, self.gyr_scale)
 
 
     def FormatGyroscopeData(self) -> tuple:
-        new_x_data : float = self.FormatRawGyroscope(value=self.RawGyroscope_XData())
-        new_y_data : float = self.FormatRawGyroscope(value=self.RawGyroscope_YData())
-        new_z_data : float = self.FormatRawGyroscope(value=self.RawGyroscope_ZData())
+        (x_data, y_data, z_data) = self.RawGyroscopeData()
+        new_x_data : float = self.FormatRawGyroscope(value=x_data)
+        new_y_data : float = self.FormatRawGyroscope(value=y_data)
+        new_z_data : float = self.FormatRawGyroscope(value=z_data)
 
         format_gyro_data : tuple[float] = (new_x_data, new_y_data, new_z_data)
 
@@ -485,14 +1040,90 @@ class BMI270(None):
         return full_time
 
 
+    def RawAllData(self) -> tuple:
+        """
+        Reads the accelerometer, gyroscope and sensortime registers (0x0C - 0x1A) in a single burst transaction so that every axis comes from the same sample.
+        Returns ((acc_x, acc_y, acc_z), (gyr_x, gyr_y, gyr_z), sensortime) with the axes as signed integers.
+        """
+        (acc_x, acc_y, acc_z, gyr_x, gyr_y, gyr_z, time_lsw, time_msb) = unpack('<6hHB', self.ReadRegisters(DATA_REG, DATA_BURST_LENGTH))
+
+        full_data : tuple = ((acc_x, acc_y, acc_z), (gyr_x, gyr_y, gyr_z), ((time_msb << 16) | time_lsw))
+
+        return full_data
+
+
+    def ReadAllData(self) -> tuple:
+        """
+        Reads the accelerometer, gyroscope and sensortime in a single burst transaction.
+        Returns ((acc_x, acc_y, acc_z), (gyr_x, gyr_y, gyr_z), sensortime) with the accelerometer in m/s^2 and the gyroscope in deg/s.
+        """
+        (raw_acc, raw_gyr, sensor_time) = self.RawAllData()
 
+        acc_data : tuple = (self.FormatRawAccelerometer(raw_acc[0]), self.FormatRawAccelerometer(raw_acc[1]), self.FormatRawAccelerometer(raw_acc[2]))
+        gyr_data : tuple = (self.FormatRawGyroscope(raw_gyr[0]), self.FormatRawGyroscope(raw_gyr[1]), self.FormatRawGyroscope(raw_gyr[2]))
 
+        return (acc_data, gyr_data, sensor_time)
 
 
+    def ReadAllDataInto(self, acc_data, gyr_data) -> int:
+        """
+        Allocation-free variant of ReadAllData: bursts 0x0C - 0x1A into a preallocated buffer and writes the scaled
+        accelerometer (m/s^2) and gyroscope (deg/s) values into the preallocated 3-element buffers "acc_data" / "gyr_data" (e.g. array('f')).
+        Returns the sensortime.
+        """
+        buffer : bytearray = self.data_buffer
+        self.serial_device.readfrom_mem_into(self.address, DATA_REG, buffer)
 
+        for axis in range(3):
+            value : int = buffer[2 * axis] | (buffer[(2 * axis) + 1] << 8)
+            if(value > 32767):
+                value -= 65536
+            acc_data[axis] = value * self.acc_scale
 
+            value = buffer[(2 * axis) + 6] | (buffer[(2 * axis) + 7] << 8)
+            if(value > 32767):
+                value -= 65536
+            gyr_data[axis] = value * self.gyr_scale
 
+        return ((buffer[14] << 16) | (buffer[13] << 8) | buffer[12])
 
 
+    def ReadAllData9Into(self, acc_data, gyr_data, mag_data) -> int:
+        """
+        9 DoF variant of ReadAllDataInto once SetupMagnetometer has run: a single burst of 0x04 - 0x1A carries the aux data written
+        by the BMI270 in data mode along with the accelerometer, gyroscope and sensortime. "mag_data" receives the field in uT.
+        Returns the sensortime.
+        """
+        buffer : bytearray = self.aux_buffer
+        self.serial_device.readfrom_mem_into(self.address, AUX_DATA_0, buffer)
+        self.magnetometer.DecodeInto(buffer, 0, mag_data)
+
+        for axis in range(3):
+            value : int = buffer[(2 * axis) + 8] | (buffer[(2 * axis) + 9] << 8)
+            if(value > 32767):
+                value -= 65536
+            acc_data[axis] = value * self.acc_scale
+
+            value = buffer[(2 * axis) + 14] | (buffer[(2 * axis) + 15] << 8)
+            if(value > 32767):
+                value -= 65536
+            gyr_data[axis] = value * self.gyr_scale
+
+        return ((buffer[22] << 16) | (buffer[21] << 8) | buffer[20])
+
+
+    def ReadRawInto(self, raw_data) -> int:
+        """
+        Allocation-free burst of 0x0C - 0x1A that writes the six signed raw axes (acc_x, acc_y, acc_z, gyr_x, gyr_y, gyr_z)
+        into the preallocated buffer "raw_data" (e.g. array('h', 6 * [0])). Returns the sensortime.
+        """
+        buffer : bytearray = self.data_buffer
+        self.serial_device.readfrom_mem_into(self.address, DATA_REG, buffer)
 
+        for index in range(6):
+            value : int = buffer[2 * index] | (buffer[(2 * index) + 1] << 8)
+            if(value > 32767):
+                value -= 65536
+            raw_data[index] = value
 
+        return ((buffer[14] << 16) | (buffer[13] << 8) | buffer[12])
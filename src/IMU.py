@@ -1,52 +1,244 @@
 
 
-from machine import Pin, PWM, I2C  # type: ignore
+try:
+    from machine import Pin, PWM, I2C  # type: ignore
+except ImportError:
+    Pin = PWM = I2C = None
 from BMI270 import BMI270
 from register_definitions import *
-from config_file import bmi270_config_file
 from math import cos, sin, tan, degrees, radians
 from filter import Fusion
+from timestamp import SensorClock
+from interrupts import InterruptFlag
+from ringbuffer import RingBuffer, POLICY_OVERWRITE
+from array import array
 
 
 
-class IMU(None):
-    def __init__(self, sclpin=1, sdapin=0, sample_rate=100) -> None:
+class IMU(object):
+    def __init__(self, sclpin=1, sdapin=0, sample_rate=100, serial_device=None, initialise=True, address=I2C_PRIM_ADDR, bus=None, calibration=None) -> None:
 
-        self.serial_device : I2C = I2C(0, scl=Pin(sclpin), sda=Pin(sdapin))
-        self.BMI270 = BMI270(serial_device = self.serial_device)
+        if((serial_device is None) and (I2C is None)):
+            # Linux host: /dev/i2c-<bus>, the header I2C bus on Raspberry Pi-style boards by default (bus 0 is reserved for HAT EEPROMs)
+            from linux_i2c import LinuxI2C
+            serial_device = LinuxI2C(1 if (bus is None) else bus)
+        if(serial_device is None):
+            serial_device = I2C((0 if (bus is None) else bus), scl=Pin(sclpin), sda=Pin(sdapin))
+        self.serial_device : I2C = serial_device
+        self.BMI270 = BMI270(serial_device = self.serial_device, initialise = initialise, address = address)
+        if(calibration is not None):
+            # offsets saved by calibration.SaveCalibration, restored into the OFFSET registers at boot
+            from calibration import ApplyCalibration, LoadCalibration
+            ApplyCalibration(self.BMI270, LoadCalibration(calibration))
 
         self.sample_rate = sample_rate
-        self.address = I2C_PRIM_ADDR
-        self.acc_data = (0, 0, 0)
-        self.gyro_data = (0, 0, 0)
+        self.address = address
+        self.acc_data = array('f', (0, 0, 0))      # preallocated, updated in place
+        self.gyro_data = array('f', (0, 0, 0))
+        self.sensor_time = 0
+        self.clock = SensorClock(default_dt=(1 / sample_rate))
+        self.psi_clock = SensorClock(default_dt=(1 / sample_rate))     # UpdatePsi's own reads, so each path measures its own interval
+        self.dt = self.clock.dt
         self.yaw = 0
         self.angle = 0.0
         self.matrix_z = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
 
 
-        self.filter = Fusion()
+        self.filter = Fusion(allocation_free=True)
+        self.interrupt = None
+        self.watermark = 0
+        self.acquisition = None
+        self.mag_data = None
+        self.governor = None
         
         return None
 
 
     def UpdateAccelerometer(self) -> None:
-        self.acc_data = self.BMI270.FormatAccelerometerData()
-        self.gyro_data = self.BMI270.FormatGyroscopeData()
-        self.filter.update(self.acc_data, self.gyro_data, dt=0.01)
+        if(self.mag_data is not None):
+            self.sensor_time = self.BMI270.ReadAllData9Into(self.acc_data, self.gyro_data, self.mag_data)
+            self.dt = self.clock.Update(self.sensor_time)
+            self.filter.update_mag(self.acc_data, self.gyro_data, self.mag_data, self.dt)
+        else:
+            self.sensor_time = self.BMI270.ReadAllDataInto(self.acc_data, self.gyro_data)
+            self.dt = self.clock.Update(self.sensor_time)
+            self.filter.update_into(self.acc_data, self.gyro_data, self.dt)
+
+        if(self.governor is not None):
+            self.governor.Update()
+
+        return None
+
+
+
+    def EnableGovernor(self, source : str = 'energy', **settings):
+        """
+        Hands the power mode to a governor.PowerGovernor ("settings" are its thresholds / profiles), updated after every sample
+        or FIFO drain. The sample rate, clock default step and FIFO watermark then follow the active profile.
+        """
+        from governor import PowerGovernor
+
+        self.governor = PowerGovernor(self, source=source, **settings)
+        self.governor.Start()
+
+        return self.governor
+
+
+
+    def DisableGovernor(self) -> None:
+        self.governor = None
+        return None
+
+
+
+    def EnableMagnetometer(self, magnetometer = None, odr : int = AUX_ODR_25) -> None:
+        """
+        Sets up a magnetometer on the BMI270 aux port (auxiliary.BMM150 by default) and switches UpdateAccelerometer to
+        9 DoF: one burst read per sample and Fusion.update_mag.
+        """
+        if(magnetometer is None):
+            from auxiliary import BMM150
+            magnetometer = BMM150()
+
+        self.BMI270.SetupMagnetometer(magnetometer, odr)
+        self.mag_data = array('f', (0, 0, 0))
+
+        return None
+
+
+
+    def EnableInterrupt(self, pin, watermark : int = 0, interrupt_pin : int = INT_PIN_1) -> None:
+        """
+        Switches to interrupt-driven acquisition: "pin" is the host pin (machine.Pin, interrupts.EventPin, simulator.SimulatedPin)
+        wired to the sensor's INT1 / INT2 output ("interrupt_pin"). Without a "watermark" every data-ready edge triggers one sample read,
+        with a watermark (in bytes) the FIFO is enabled and drained each time it crosses that level.
+        """
+        if(watermark):
+            self.BMI270.Configure(fifo_acc_en=1, fifo_gyr_en=1, fifo_aux_en=0, fifo_header_en=1)
+            self.BMI270.SetFIFOWatermark(watermark)
+            self.BMI270.FlushFIFO()
+            self.BMI270.ConfigureInterrupt(interrupt_pin, watermark=True)
+        else:
+            self.BMI270.ConfigureInterrupt(interrupt_pin, data_ready=True)
+
+        self.watermark = watermark
+        self.interrupt = InterruptFlag(pin)
+
+        return None
+
+
+
+    def Poll(self) -> bool:
+        """
+        Reads new data only when the interrupt pin has fired since the last call. Returns True when data was processed.
+        """
+        if((self.interrupt is None) or (not self.interrupt.Clear())):
+            return False
+
+        if(self.watermark):
+            self.UpdateFIFO()
+        else:
+            self.UpdateAccelerometer()
+
+        return True
+
+
+
+    def UpdateFIFO(self) -> int:
+        """
+        Drains the FIFO and runs the filter over every gyroscope frame (holding the latest accelerometer frame). The time between
+        the sensortime frames of this drain and the previous one ("clock") is spread evenly over the drain's gyroscope frames;
+        the first drain, or one without a sensortime frame (fifo_time_en off, headerless mode), uses the nominal gyroscope FIFO rate.
+        Returns the number of samples processed.
+        """
+        samples : list = []
+        last_acc : tuple = None
+        gyr_frames : int = 0
+        sensor_time : int = None
+        for frame in self.BMI270.ReadFIFOFrames():
+            if(frame.acc is not None):
+                last_acc = frame.acc
+            if(frame.gyr is not None):
+                gyr_frames += 1
+                if(last_acc is not None):
+                    samples.append(last_acc + frame.gyr)
+            if(frame.kind == FIFO_FRAME_SENSORTIME):
+                sensor_time = frame.value
+
+        elapsed : float = None
+        if(sensor_time is not None):
+            first : bool = self.clock.last_time is None
+            self.clock.Update(sensor_time)
+            self.sensor_time = sensor_time
+            if(not first):
+                elapsed = self.clock.dt
+
+        if(not samples):
+            return 0
+
+        if((elapsed is not None) and (elapsed > 0)):
+            self.dt = elapsed / gyr_frames
+        else:
+            self.dt = 1 / self.BMI270.FIFORates()[1]     # gyroscope FIFO rate, after FIFO_DOWNS
+        (acc, gyr) = self.BMI270.FormatBatch(samples)
+        self.filter.update_batch(acc, gyr, self.dt)
+
+        for axis in range(3):
+            self.acc_data[axis] = acc[-1][axis]
+            self.gyro_data[axis] = gyr[-1][axis]
+
+        if(self.governor is not None):
+            self.governor.Update()
+
+        return len(samples)
+
+
+
+    def StartAcquisition(self, capacity : int = 256, policy : str = POLICY_OVERWRITE, timeout_ms : int = None) -> RingBuffer:
+        """
+        Hands the bus to a background acquisition.AcquisitionThread (paced by the data-ready interrupt when EnableInterrupt was
+        called without a watermark, by "sample_rate" otherwise) and returns the ring buffer it fills. Consumers call AddReader() on it.
+        """
+        from acquisition import AcquisitionThread
+
+        if(self.acquisition is not None):
+            return self.acquisition.ring
+
+        interrupt = self.interrupt if (not self.watermark) else None
+        ring : RingBuffer = RingBuffer(capacity, policy=policy, timeout_ms=timeout_ms)
+        self.acquisition = AcquisitionThread(self.BMI270, ring, sample_rate=self.sample_rate, interrupt=interrupt)
+        self.acquisition.Start()
+
+        return ring
+
+
+
+    def StopAcquisition(self) -> None:
+        if(self.acquisition is not None):
+            self.acquisition.Stop()
+            self.acquisition = None
 
         return None
 
 
 
-    def UpdatePsi(self, dt : float = 0.01) -> None:
-        omega_psi : float = self.BMI270.FormatGyroscopeData()[2] * dt
+    def UpdatePsi(self, dt : float = None) -> None:
+        """
+        Integrates the gyroscope Z rate into "angle". Without an explicit "dt" the step is measured with the sensortime read in the same burst,
+        against the previous UpdatePsi read ("psi_clock", independent of UpdateAccelerometer's clock).
+        """
+        if(dt is None):
+            self.sensor_time = self.BMI270.ReadAllDataInto(self.acc_data, self.gyro_data)
+            omega_psi : float = self.gyro_data[2] * self.psi_clock.Update(self.sensor_time)
+        else:
+            omega_psi : float = self.BMI270.FormatGyroscopeData()[2] * dt
         self.angle += omega_psi
         
         return None
 
 
 
-    def UpdateMatrix(self, dt : float = 0.01) -> None:
+    def UpdateMatrix(self, dt : float = None) -> None:
         self.UpdatePsi(dt=dt)
 
         cos_psi : float = cos(radians(self.angle))
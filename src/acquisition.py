@@ -0,0 +1,122 @@
+# -------------------------------------------------
+# BACKGROUND ACQUISITION
+# -------------------------------------------------
+# A reader thread that owns the bus and pushes raw samples (acc_x, acc_y, acc_z, gyr_x, gyr_y, gyr_z as int16 plus the
+# sensortime) into a ringbuffer.RingBuffer, so that consumers running at their own pace (logging, fusion, networking)
+# never stall the sensor timing. While the thread runs nothing else may use the BMI270 / bus.
+#
+#   ring = RingBuffer(512, policy=POLICY_OVERWRITE)
+#   reader = ring.AddReader()
+#   thread = AcquisitionThread(imu.BMI270, ring, sample_rate=200)
+#   thread.Start()
+#   for (data, times) in reader.Snapshot():
+#       ...
+#   reader.Release(count)
+
+from array import array
+from ringbuffer import RingBuffer
+from ticks import ticks_us, ticks_diff, ticks_add
+
+try:
+    import _thread
+except ImportError:
+    _thread = None
+
+try:
+    from time import sleep_us   # type: ignore
+except ImportError:
+    from time import sleep
+    def sleep_us(us : int) -> None:
+        sleep(us / 1000000)
+
+
+class AcquisitionThread(object):
+    """
+    Reads one burst per data-ready edge of "interrupt" (interrupts.InterruptFlag) or, without one, every 1 / "sample_rate" s.
+    Bus errors are counted in "errors" and the loop keeps going.
+    """
+    def __init__(self, sensor, ring : RingBuffer, sample_rate : float = 100, interrupt = None) -> None:
+        if(_thread is None):
+            raise OSError("Threads are not available on this port")
+
+        self.sensor = sensor
+        self.ring : RingBuffer = ring
+        self.period_us : int = int(1000000 / sample_rate)
+        self.interrupt = interrupt
+        self.raw_data = array('h', [0] * 6)
+
+        self.running : bool = False
+        self.stopped : bool = True
+        self.reads : int = 0
+        self.errors : int = 0
+
+        return None
+
+
+    def Start(self) -> None:
+        if(self.running):
+            return None
+
+        self.running = True
+        self.stopped = False
+        _thread.start_new_thread(self.Run, ())
+
+        return None
+
+
+    def Stop(self, timeout_ms : int = 1000) -> bool:
+        """
+        Asks the thread to finish and waits for it. Returns True when it has exited.
+        """
+        self.running = False
+
+        start : int = ticks_us()
+        while(not self.stopped):
+            if((ticks_diff(ticks_us(), start) // 1000) >= timeout_ms):
+                return False
+            sleep_us(1000)
+
+        return True
+
+
+    def Run(self) -> None:
+        try:
+            deadline : int = ticks_us()
+            while(self.running):
+                if(self.interrupt is not None):
+                    if(not self.interrupt.Wait(timeout_ms=100)):
+                        continue
+                    self.interrupt.Clear()
+                else:
+                    deadline = ticks_add(deadline, self.period_us)
+                    delay : int = ticks_diff(deadline, ticks_us())
+                    if(delay > 0):
+                        sleep_us(delay)
+                    else:
+                        deadline = ticks_us()   # fell behind, do not try to catch up with a burst of reads
+
+                self.Acquire()
+        finally:
+            self.stopped = True
+
+        return None
+
+
+    def Acquire(self) -> bool:
+        try:
+            sensor_time : int = self.sensor.ReadRawInto(self.raw_data)
+        except OSError:
+            self.errors += 1
+            return False
+
+        self.reads += 1
+
+        return self.ring.Put(self.raw_data, sensor_time)
+
+
+    def Stats(self) -> dict:
+        stats : dict = self.ring.Stats()
+        stats['reads'] = self.reads
+        stats['errors'] = self.errors
+
+        return stats
@@ -0,0 +1,137 @@
+# -------------------------------------------------
+# ASYNCIO / UASYNCIO FACADE
+# -------------------------------------------------
+# Cooperative wrappers around BMI270 and IMU: the configuration upload yields to the scheduler between bursts and samples are
+# awaited (data-ready / FIFO watermark interrupt, or the sample period) instead of polled. Runs under uasyncio on the board and
+# under asyncio on CPython against simulator.VirtualI2C.
+#
+#   imu = AsyncIMU(IMU(serial_device=bus, initialise=False))
+#   await imu.init()
+#   async for (acc, gyr, sensor_time) in imu.stream():
+#       ...
+
+try:
+    import uasyncio as asyncio     # type: ignore
+except ImportError:
+    import asyncio
+
+from BMI270 import BMI270
+from register_definitions import *
+
+
+class AsyncBMI270(object):
+    """
+    Awaitable front end of a BMI270 created with initialise=False.
+    """
+    def __init__(self, sensor : BMI270) -> None:
+        self.sensor : BMI270 = sensor
+        return None
+
+
+    async def init(self, burst_size : int = CONFIG_BURST_SIZE) -> float:
+        """
+        Uploads the configuration (yielding to other coroutines after every burst and during the required waits),
+        then applies the default settings. Returns the bus time of the upload in seconds (the awaited waits excluded).
+        """
+        for delay in self.sensor.ConfigurationSteps(burst_size):
+            await asyncio.sleep(delay)
+
+        self.sensor.Initialise()
+
+        return self.sensor.config_upload_time
+
+
+    async def ReadAllData(self) -> tuple:
+        await asyncio.sleep(0)
+        return self.sensor.ReadAllData()
+
+
+    async def ReadFIFOBatch(self) -> list:
+        await asyncio.sleep(0)
+        return self.sensor.ReadFIFOBatch()
+
+
+class AsyncIMU(object):
+    """
+    Awaitable front end of an IMU. stream() is an async iterator over samples that waits on the IMU's interrupt pin when
+    IMU.EnableInterrupt was called, and on the sample period otherwise.
+    """
+    def __init__(self, imu, poll_ms : int = 1) -> None:
+        self.imu = imu
+        self.device : AsyncBMI270 = AsyncBMI270(imu.BMI270)
+        self.poll_ms : int = poll_ms
+        self.flag = None
+
+        return None
+
+
+    async def init(self, burst_size : int = CONFIG_BURST_SIZE) -> float:
+        return await self.device.init(burst_size)
+
+
+    def stream(self) -> 'SampleStream':
+        return SampleStream(self)
+
+
+    def AttachFlag(self) -> None:
+        """
+        On uasyncio, wakes the waiting coroutine straight from the pin IRQ through a ThreadSafeFlag instead of polling.
+        """
+        interrupt = self.imu.interrupt
+        if((interrupt is None) or (not hasattr(asyncio, 'ThreadSafeFlag')) or (self.flag is not None)):
+            return None
+
+        self.flag = asyncio.ThreadSafeFlag()
+        handler = interrupt.Handler
+        flag = self.flag
+
+        def Handler(pin) -> None:
+            handler(pin)
+            flag.set()
+
+        interrupt.SetHandler(Handler)     # keeps the rising / falling trigger chosen by InterruptFlag
+
+        return None
+
+
+    async def WaitForData(self) -> None:
+        interrupt = self.imu.interrupt
+        if(interrupt is None):
+            await asyncio.sleep(1 / self.imu.sample_rate)
+            return None
+
+        self.AttachFlag()
+        while(not interrupt.Ready()):
+            if(self.flag is not None):
+                await self.flag.wait()
+            else:
+                await asyncio.sleep(self.poll_ms / 1000)
+
+        return None
+
+
+class SampleStream(object):
+    """
+    Async iterator returned by AsyncIMU.stream, yields (acc, gyr, sensor_time) after each processed update
+    (one sample in data-ready / polling mode, the last sample of the drained block in FIFO watermark mode).
+    """
+    def __init__(self, owner : AsyncIMU) -> None:
+        self.owner : AsyncIMU = owner
+        return None
+
+
+    def __aiter__(self) -> 'SampleStream':
+        return self
+
+
+    async def __anext__(self) -> tuple:
+        imu = self.owner.imu
+        while(True):
+            await self.owner.WaitForData()
+            if(imu.interrupt is None):
+                imu.UpdateAccelerometer()
+                break
+            if(imu.Poll()):
+                break
+
+        return (tuple(imu.acc_data), tuple(imu.gyro_data), imu.sensor_time)
@@ -0,0 +1,99 @@
+# -------------------------------------------------
+# AUXILIARY MAGNETOMETERS
+# -------------------------------------------------
+# Descriptions of magnetometers wired to the BMI270 aux port (ASDx / ASCx). BMI270.SetupMagnetometer writes "setup" through the
+# aux interface in manual mode, then switches to data mode: the BMI270 reads "burst" bytes from "data_register" at the aux ODR
+# by itself and places them in AUX_DATA_0 .. AUX_DATA_7 (and in the FIFO when fifo_aux_en is set), so the host gets
+# 9 DoF samples from one burst (BMI270.ReadAllData9Into) without a second device on its bus.
+# DecodeInto returns the field in the BMI270 frame, ready for Fusion.update_mag: "axes" / "signs" describe how the
+# magnetometer is mounted relative to the BMI270 (BMI270 axis i = signs[i] * magnetometer axis axes[i]).
+
+from struct import unpack_from
+
+
+# BMM150
+BMM150_ADDRESS          = 0x10
+BMM150_DATA_X           = 0x42      # DATAX_LSB .. RHALL_MSB, 8 bytes
+BMM150_POWER_CONTROL    = 0x4B
+BMM150_OP_MODE          = 0x4C
+BMM150_REP_XY           = 0x51
+BMM150_REP_Z            = 0x52
+BMM150_RESOLUTION       = 0.3       # uT per LSB (nominal)
+# Both packages with pin 1 in the same corner: X is shared, the BMM150 Y / Z point opposite to the BMI270's
+BMM150_AXES : tuple     = (0, 1, 2)
+BMM150_SIGNS : tuple    = (1, -1, -1)
+BMM150_SETUP : tuple = (
+    (BMM150_POWER_CONTROL, 0x01, 3),    # power on (sleep mode), 3 ms start-up
+    (BMM150_REP_XY, 0x04, 0),           # regular preset: 9 repetitions X / Y
+    (BMM150_REP_Z, 0x0E, 0),            # 15 repetitions Z
+    (BMM150_OP_MODE, 0x38, 0),          # normal mode, 30 Hz
+)
+
+
+class Magnetometer(object):
+    """
+    "address": 7-bit I2C address on the aux bus, "setup": (register, value, delay_ms) writes bringing it into continuous
+    measurement, "data_register" / "burst": what the BMI270 reads in data mode, "scale": uT per LSB after DecodeInto,
+    "axes" / "signs": the magnetometer axis and sign giving each BMI270 axis.
+    """
+    def __init__(self, name : str, address : int, setup : tuple, data_register : int, burst : int, scale : float,
+                 axes : tuple = (0, 1, 2), signs : tuple = (1, 1, 1)) -> None:
+        if(sorted(axes) != [0, 1, 2]):
+            raise ValueError("Axes must be a permutation of (0, 1, 2): {}".format(axes))
+        if(any(sign not in (1, -1) for sign in signs)):
+            raise ValueError("Signs must be 1 or -1: {}".format(signs))
+
+        self.name : str = name
+        self.address : int = address
+        self.setup : tuple = setup
+        self.data_register : int = data_register
+        self.burst : int = burst
+        self.scale : float = scale
+        self.axes : tuple = tuple(axes)
+        self.signs : tuple = tuple(signs)
+        self.gains : tuple = tuple(sign * scale for sign in signs)     # sign and scale folded, one multiply per axis
+
+        return None
+
+
+    def RemapInto(self, x : int, y : int, z : int, mag_data) -> None:
+        """
+        Writes the raw magnetometer axes, scaled and rotated into the BMI270 frame, into "mag_data".
+        """
+        raw : tuple = (x, y, z)
+        (ax, ay, az) = self.axes
+        (gx, gy, gz) = self.gains
+        mag_data[0] = raw[ax] * gx
+        mag_data[1] = raw[ay] * gy
+        mag_data[2] = raw[az] * gz
+
+        return None
+
+
+    def DecodeInto(self, data, offset : int, mag_data) -> None:
+        """
+        Writes the (x, y, z) field in uT, in the BMI270 frame, from the aux bytes at data[offset:] into the 3-element buffer "mag_data".
+        """
+        (x, y, z) = unpack_from('<3h', data, offset)
+        self.RemapInto(x, y, z, mag_data)
+
+        return None
+
+
+class BMM150(Magnetometer):
+    """
+    Bosch BMM150 in normal mode at 30 Hz (regular preset). X / Y are 13-bit and Z 15-bit, left-aligned in DATAX .. DATAZ.
+    The factory trim compensation (temperature / hall resistance) is not applied: the field is scaled with the nominal
+    0.3 uT per LSB, which is enough for heading correction in the fusion filter. The default "axes" / "signs" assume both
+    chips mounted with pin 1 in the same corner; other layouts pass their own.
+    """
+    def __init__(self, address : int = BMM150_ADDRESS, axes : tuple = BMM150_AXES, signs : tuple = BMM150_SIGNS) -> None:
+        Magnetometer.__init__(self, 'BMM150', address, BMM150_SETUP, BMM150_DATA_X, 8, BMM150_RESOLUTION, axes, signs)
+        return None
+
+
+    def DecodeInto(self, data, offset : int, mag_data) -> None:
+        (x, y, z) = unpack_from('<3h', data, offset)
+        self.RemapInto((x >> 3), (y >> 3), (z >> 1), mag_data)
+
+        return None
@@ -0,0 +1,265 @@
+# -------------------------------------------------
+# BENCHMARKS
+# -------------------------------------------------
+# Runs on the board (MicroPython) or on a host (CPython). Heap figures are only taken on MicroPython (gc.mem_free): CPython
+# object allocation says nothing about the board's heap, so they are None there.
+# Bus figures are taken against simulator.VirtualI2C with a configurable per-transaction latency and bus frequency.
+# Results are written as JSON; a previous run can be passed with --compare to flag regressions (exit status 1).
+#
+#   python benchmark.py [--latency 0.0001] [--frequency 400000] [--output results.json] [--compare baseline.json] [--tolerance 0.1]
+
+import gc
+import sys
+from array import array
+from filter import Fusion
+from ticks import ticks_us, ticks_diff
+from register_definitions import *
+
+try:
+    import json
+except ImportError:
+    import ujson as json    # type: ignore
+
+MICROPYTHON : bool = (sys.implementation.name == 'micropython')
+
+
+def FusionHeapGrowth(updates : int = 1000) -> dict:
+    """
+    Heap bytes taken per call of Fusion.update (tuple inputs) and Fusion.update_into (preallocated buffers), measured with
+    gc.mem_free while garbage collection is disabled. update_into saves the tuple / generator / quaternion allocations of update;
+    its own figure is 0 only on ports with immediate floats (see Fusion.update_into). MicroPython only: returns None elsewhere.
+    """
+    if(not MICROPYTHON):
+        return None
+
+    results : dict = {}
+
+    acc = array('f', (0.1, -0.2, 9.8))
+    gyr = array('f', (1.0, -2.0, 3.0))
+    acc_tuple : tuple = tuple(acc)
+    gyr_tuple : tuple = tuple(gyr)
+
+    for (name, fusion, call) in (
+            ('update', Fusion(), lambda f: f.update(acc_tuple, gyr_tuple, 0.01)),
+            ('update_into', Fusion(allocation_free=True), lambda f: f.update_into(acc, gyr, 0.01))):
+        call(fusion)    # warm up (one-off conversions, caches)
+
+        gc.collect()
+        gc.disable()
+        before : int = gc.mem_free()     # type: ignore
+        for _ in range(updates):
+            call(fusion)
+        after : int = gc.mem_free()      # type: ignore
+        gc.enable()
+
+        results[name] = {'growth_per_update' : ((before - after) / updates)}
+
+    return results
+
+
+def _Sensor(latency : float = 0.0, frequency : int = None, clock = None) -> tuple:
+    """
+    A configured BMI270 on a fresh VirtualI2C; returns (sensor, bus, virtual device).
+    """
+    from BMI270 import BMI270
+    from simulator import VirtualI2C, VirtualBMI270
+
+    device = VirtualBMI270(configured=True) if (clock is None) else VirtualBMI270(configured=True, clock=clock)
+    bus = VirtualI2C(device, latency=latency, frequency=frequency)
+    sensor = BMI270(serial_device=bus)
+
+    return (sensor, bus, device)
+
+
+def _Time(call, repeats : int) -> float:
+    """
+    Average duration of "call()" in microseconds.
+    """
+    call()
+    start : int = ticks_us()
+    for _ in range(repeats):
+        call()
+
+    return (ticks_diff(ticks_us(), start) / repeats)
+
+
+def BusCost(latency : float = 0.0, frequency : int = None, fifo_samples : int = 100) -> dict:
+    """
+    Transactions and bytes read per sample (one accelerometer + gyroscope set) for every read API, FIFO drains included.
+    """
+    (sensor, bus, device) = _Sensor(latency, frequency)
+    raw = array('h', [0] * 6)
+    acc = array('f', (0, 0, 0))
+    gyr = array('f', (0, 0, 0))
+
+    apis : tuple = (
+        ('RawAccelerometerData + RawGyroscopeData', lambda: (sensor.RawAccelerometerData(), sensor.RawGyroscopeData())),
+        ('FormatAccelerometerData + FormatGyroscopeData', lambda: (sensor.FormatAccelerometerData(), sensor.FormatGyroscopeData())),
+        ('ReadAllData', sensor.ReadAllData),
+        ('ReadAllDataInto', lambda: sensor.ReadAllDataInto(acc, gyr)),
+        ('ReadRawInto', lambda: sensor.ReadRawInto(raw)),
+    )
+
+    results : dict = {}
+    for (name, call) in apis:
+        bus.ResetCounters()
+        call()
+        results[name] = {'transactions' : bus.transactions, 'bytes' : bus.bytes_read + bus.bytes_written}
+
+    # FIFO: let the virtual device produce "fifo_samples" gyroscope frames, then drain them
+    now : list = [0.0]
+    (sensor, bus, device) = _Sensor(latency, frequency, clock=lambda: now[0])
+    for (header, name) in ((1, 'ReadFIFOBatch (headered)'), (0, 'ReadFIFOBatch (headerless)')):
+        sensor.Configure(fifo_acc_en=1, fifo_gyr_en=1, fifo_aux_en=0, fifo_header_en=header)
+        sensor.FlushFIFO()
+        now[0] += fifo_samples / sensor.FIFORates()[1]
+        bus.ResetCounters()
+        frames : list = sensor.ReadFIFOBatch()
+        samples : int = max(1, sum(1 for frame in frames if frame.gyr is not None))
+        results[name] = {'transactions' : bus.transactions / samples, 'bytes' : (bus.bytes_read + bus.bytes_written) / samples}
+
+    return results
+
+
+def ConfigurationUpload(latency : float = 0.0, frequency : int = None, burst_sizes : tuple = (32, 256, CONFIG_BURST_SIZE * 32)) -> dict:
+    """
+    Bus time of the INIT_DATA bursts, transactions and bytes of LoadConfiguration for each burst size.
+    """
+    from BMI270 import BMI270
+    from simulator import VirtualI2C, VirtualBMI270
+
+    results : dict = {}
+    for burst_size in burst_sizes:
+        bus = VirtualI2C(VirtualBMI270(), latency=latency, frequency=frequency)
+        sensor = BMI270(serial_device=bus, initialise=False)
+        bus.ResetCounters()
+        sensor.LoadConfiguration(burst_size)
+        results[str(burst_size)] = {'seconds' : sensor.config_upload_time, 'transactions' : bus.transactions, 'bytes' : bus.bytes_read + bus.bytes_written}
+
+    return results
+
+
+def CallTimes(latency : float = 0.0, frequency : int = None, repeats : int = 1000) -> dict:
+    """
+    Microseconds per call of the conversion and fusion entry points (bus time included where the call reads the sensor).
+    """
+    from IMU import IMU
+
+    (sensor, bus, device) = _Sensor(latency, frequency)
+    imu = IMU(serial_device=bus)
+    fusion = Fusion()
+    acc : tuple = (0.1, -0.2, 9.8)
+    gyr : tuple = (1.0, -2.0, 3.0)
+
+    return {
+        'FormatAccelerometerData' : _Time(sensor.FormatAccelerometerData, repeats),
+        'FormatGyroscopeData' : _Time(sensor.FormatGyroscopeData, repeats),
+        'Fusion.update' : _Time(lambda: fusion.update(acc, gyr, 0.01), repeats),
+        'IMU.UpdateMatrix' : _Time(imu.UpdateMatrix, repeats),
+        'IMU.UpdateAccelerometer' : _Time(imu.UpdateAccelerometer, repeats),
+    }
+
+
+def MaxODR(latency : float = 0.0, frequency : int = None, repeats : int = 500, fifo_samples : int = 100) -> dict:
+    """
+    Highest sample rate (Hz) the host keeps up with while reading and fusing every sample: one register burst per sample
+    (IMU.UpdateAccelerometer) and FIFO drains of "fifo_samples" samples (IMU.UpdateFIFO).
+    """
+    from IMU import IMU
+
+    (sensor, bus, device) = _Sensor(latency, frequency)
+    imu = IMU(serial_device=bus)
+    register_us : float = _Time(imu.UpdateAccelerometer, repeats)
+
+    now : list = [0.0]
+    (sensor, bus, device) = _Sensor(latency, frequency, clock=lambda: now[0])
+    imu = IMU(serial_device=bus)
+    imu.BMI270.Configure(fifo_acc_en=1, fifo_gyr_en=1, fifo_aux_en=0, fifo_header_en=1)
+    imu.BMI270.FlushFIFO()
+    (drained, elapsed) = (0, 0)
+    for _ in range(max(1, repeats // fifo_samples)):
+        now[0] += fifo_samples / imu.BMI270.FIFORates()[1]
+        device.Update()     # the virtual device produces the frames outside the timed host work
+        start : int = ticks_us()
+        drained += imu.UpdateFIFO()
+        elapsed += ticks_diff(ticks_us(), start)
+    fifo_us : float = elapsed / max(1, drained)
+
+    return {'register' : (1000000 / register_us), 'fifo' : (1000000 / fifo_us) if fifo_us else None}
+
+
+def RunAll(latency : float = 0.0, frequency : int = None) -> dict:
+    return {
+        'settings' : {'latency' : latency, 'frequency' : frequency, 'implementation' : sys.implementation.name},
+        'bus_cost' : BusCost(latency, frequency),
+        'configuration_upload' : ConfigurationUpload(latency, frequency),
+        'call_us' : CallTimes(latency, frequency),
+        'max_odr' : MaxODR(latency, frequency),
+        'heap' : FusionHeapGrowth(),
+    }
+
+
+# Figures where a larger value is an improvement, everything else is a cost
+HIGHER_IS_BETTER : tuple = ('max_odr',)
+
+
+def _Flatten(results : dict, prefix : str = '') -> dict:
+    flat : dict = {}
+    for (key, value) in results.items():
+        name : str = prefix + key
+        if(isinstance(value, dict)):
+            flat.update(_Flatten(value, name + '/'))
+        elif(isinstance(value, (int, float)) and (not isinstance(value, bool))):
+            flat[name] = value
+
+    return flat
+
+
+def Compare(results : dict, baseline : dict, tolerance : float = 0.1) -> list:
+    """
+    Returns (figure, baseline, current) for every figure that got worse by more than "tolerance" (relative).
+    """
+    regressions : list = []
+    current : dict = _Flatten(results)
+    for (name, old) in _Flatten(baseline).items():
+        if(name.startswith('settings/') or (name not in current)):
+            continue
+        new = current[name]
+        if(name.split('/')[0] in HIGHER_IS_BETTER):
+            worse : bool = new < (old * (1 - tolerance))
+        else:
+            worse : bool = new > (old * (1 + tolerance))
+        if(worse):
+            regressions.append((name, old, new))
+
+    return regressions
+
+
+def _Arguments(argv : list) -> dict:
+    options : dict = {'--latency' : '0', '--frequency' : None, '--output' : None, '--compare' : None, '--tolerance' : '0.1'}
+    for index in range(1, len(argv) - 1, 2):
+        if(argv[index] not in options):
+            raise ValueError("Unknown option: {}".format(argv[index]))
+        options[argv[index]] = argv[index + 1]
+
+    return options
+
+
+if(__name__ == '__main__'):
+    options : dict = _Arguments(sys.argv)
+    results : dict = RunAll(float(options['--latency']), int(options['--frequency']) if options['--frequency'] else None)
+
+    text : str = json.dumps(results)
+    if(options['--output']):
+        with open(options['--output'], 'w') as output:
+            output.write(text)
+    else:
+        print(text)
+
+    if(options['--compare']):
+        with open(options['--compare']) as previous:
+            regressions : list = Compare(results, json.loads(previous.read()), float(options['--tolerance']))
+        for (name, old, new) in regressions:
+            print("REGRESSION {} : {} -> {}".format(name, old, new))
+        if(regressions):
+            sys.exit(1)
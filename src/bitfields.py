@@ -0,0 +1,147 @@
+# -------------------------------------------------
+# REGISTER BITFIELDS
+# -------------------------------------------------
+# Table-driven description of the configuration bitfields, used by BMI270.Configure to build the final register image
+# and commit it with as few bus transactions as possible.
+
+from register_definitions import *
+
+
+# name : (register, shift, width)
+FIELDS : dict = {
+    # ACC_CONF / ACC_RANGE
+    'acc_odr'           : (ACC_CONF, 0, 4),
+    'acc_bwp'           : (ACC_CONF, 4, 3),
+    'acc_filter_perf'   : (ACC_CONF, 7, 1),
+    'acc_range'         : (ACC_RANGE, 0, 2),
+
+    # GYR_CONF / GYR_RANGE
+    'gyr_odr'           : (GYR_CONF, 0, 4),
+    'gyr_bwp'           : (GYR_CONF, 4, 2),
+    'gyr_noise_perf'    : (GYR_CONF, 6, 1),
+    'gyr_filter_perf'   : (GYR_CONF, 7, 1),
+    'gyr_range'         : (GYR_RANGE, 0, 3),
+
+    # FIFO_DOWNS / FIFO_CONFIG_0 / FIFO_CONFIG_1
+    'gyr_fifo_downs'    : (FIFO_DOWNS, 0, 3),
+    'gyr_fifo_filt_data': (FIFO_DOWNS, 3, 1),
+    'acc_fifo_downs'    : (FIFO_DOWNS, 4, 3),
+    'acc_fifo_filt_data': (FIFO_DOWNS, 7, 1),
+    'fifo_stop_on_full' : (FIFO_CONFIG_0, 0, 1),
+    'fifo_time_en'      : (FIFO_CONFIG_0, 1, 1),
+    'fifo_header_en'    : (FIFO_CONFIG_1, 4, 1),
+    'fifo_aux_en'       : (FIFO_CONFIG_1, 5, 1),
+    'fifo_acc_en'       : (FIFO_CONFIG_1, 6, 1),
+    'fifo_gyr_en'       : (FIFO_CONFIG_1, 7, 1),
+
+    # AUX_CONF / AUX_DEV_ID / AUX_IF_CONF / IF_CONF
+    'aux_odr'           : (AUX_CONF, 0, 4),
+    'aux_offset'        : (AUX_CONF, 4, 4),
+    'aux_dev_addr'      : (AUX_DEV_ID, 1, 7),
+    'aux_rd_burst'      : (AUX_IF_CONF, 0, 2),
+    'aux_man_rd_burst'  : (AUX_IF_CONF, 2, 2),
+    'aux_fcu_write_en'  : (AUX_IF_CONF, 6, 1),
+    'aux_manual_en'     : (AUX_IF_CONF, 7, 1),
+    'aux_if_en'         : (IF_CONF, 5, 1),
+
+    # INT1_IO_CTRL / INT2_IO_CTRL / INT_LATCH / INT_MAP_DATA
+    'int1_lvl'          : (INT1_IO_CTRL, 1, 1),
+    'int1_od'           : (INT1_IO_CTRL, 2, 1),
+    'int1_output_en'    : (INT1_IO_CTRL, 3, 1),
+    'int2_lvl'          : (INT2_IO_CTRL, 1, 1),
+    'int2_od'           : (INT2_IO_CTRL, 2, 1),
+    'int2_output_en'    : (INT2_IO_CTRL, 3, 1),
+    'int_latch'         : (INT_LATCH, 0, 1),
+    'int1_ffull'        : (INT_MAP_DATA, 0, 1),
+    'int1_fwm'          : (INT_MAP_DATA, 1, 1),
+    'int1_drdy'         : (INT_MAP_DATA, 2, 1),
+    'int2_ffull'        : (INT_MAP_DATA, 4, 1),
+    'int2_fwm'          : (INT_MAP_DATA, 5, 1),
+    'int2_drdy'         : (INT_MAP_DATA, 6, 1),
+
+    # INT1_MAP_FEAT / INT2_MAP_FEAT
+    'int1_sig_motion'   : (INT1_MAP_FEAT, 0, 1),
+    'int1_step_counter' : (INT1_MAP_FEAT, 1, 1),
+    'int1_activity'     : (INT1_MAP_FEAT, 2, 1),
+    'int1_wrist_wakeup' : (INT1_MAP_FEAT, 3, 1),
+    'int1_wrist_gesture': (INT1_MAP_FEAT, 4, 1),
+    'int1_no_motion'    : (INT1_MAP_FEAT, 5, 1),
+    'int1_any_motion'   : (INT1_MAP_FEAT, 6, 1),
+    'int2_sig_motion'   : (INT2_MAP_FEAT, 0, 1),
+    'int2_step_counter' : (INT2_MAP_FEAT, 1, 1),
+    'int2_activity'     : (INT2_MAP_FEAT, 2, 1),
+    'int2_wrist_wakeup' : (INT2_MAP_FEAT, 3, 1),
+    'int2_wrist_gesture': (INT2_MAP_FEAT, 4, 1),
+    'int2_no_motion'    : (INT2_MAP_FEAT, 5, 1),
+    'int2_any_motion'   : (INT2_MAP_FEAT, 6, 1),
+
+    # NV_CONF / OFFSET_6
+    'acc_off_en'        : (NV_CONF, 3, 1),
+    'gyr_off_en'        : (OFFSET_6, 6, 1),
+    'gyr_gain_en'       : (OFFSET_6, 7, 1),
+
+    # PWR_CONF / PWR_CTRL
+    'adv_power_save'    : (PWR_CONF, 0, 1),
+    'fifo_self_wakeup'  : (PWR_CONF, 1, 1),
+    'fup_en'            : (PWR_CONF, 2, 1),
+    'aux_en'            : (PWR_CTRL, 0, 1),
+    'gyr_en'            : (PWR_CTRL, 1, 1),
+    'acc_en'            : (PWR_CTRL, 2, 1),
+    'temp_en'           : (PWR_CTRL, 3, 1),
+}
+
+# Registers left between two touched registers that may be read back and rewritten unchanged to merge them into one burst
+MAX_REGISTER_GAP = 1
+
+
+def ValidateFields(fields : dict) -> bool:
+    """
+    Returns True when every field name is known and every value fits in its bitfield.
+    """
+    for (name, value) in fields.items():
+        if(name not in FIELDS):
+            return False
+        width : int = FIELDS[name][2]
+        if((value < 0) or (value >= (1 << width))):
+            return False
+
+    return True
+
+
+def FieldRegisters(fields : dict) -> list:
+    """
+    Returns the sorted list of registers touched by "fields".
+    """
+    return sorted(set(FIELDS[name][0] for name in fields))
+
+
+def ApplyFields(image : dict, fields : dict) -> dict:
+    """
+    Returns a copy of the register "image" ({register : value}) with "fields" applied.
+    """
+    new_image : dict = dict(image)
+    for (name, value) in fields.items():
+        (register, shift, width) = FIELDS[name]
+        mask : int = ((1 << width) - 1) << shift
+        new_image[register] = (new_image[register] & ~mask & FULL_MASK_8BIT) | ((value << shift) & mask)
+
+    return new_image
+
+
+def ReadField(image : dict, name : str) -> int:
+    (register, shift, width) = FIELDS[name]
+    return (image[register] >> shift) & ((1 << width) - 1)
+
+
+def CoalesceRegisters(registers, max_gap : int = MAX_REGISTER_GAP) -> list:
+    """
+    Groups sorted register addresses into (first, count) bursts, merging registers separated by at most "max_gap" untouched registers.
+    """
+    blocks : list = []
+    for register in registers:
+        if(blocks and ((register - (blocks[-1][0] + blocks[-1][1])) <= max_gap)):
+            blocks[-1][1] = (register - blocks[-1][0]) + 1
+        else:
+            blocks.append([register, 1])
+
+    return [tuple(block) for block in blocks]
@@ -0,0 +1,127 @@
+# -------------------------------------------------
+# OFFSET CALIBRATION
+# -------------------------------------------------
+# Fast offset compensation (FOC): averages a stationary window collected through the FIFO, turns the residual bias into
+# OFFSET_0 .. OFFSET_6 register values and enables the in-silicon correction (NV_CONF.acc_off_en, OFFSET_6.gyr_off_en),
+# so the data registers and the FIFO already carry corrected values and the host does no per-sample bias math.
+# The offsets are volatile: save them once and restore them at boot.
+#
+#   calibration = PerformFOC(sensor)                # sensor lying still, Z up
+#   SaveCalibration(calibration, 'bmi270.json')
+#   ...
+#   ApplyCalibration(sensor, LoadCalibration('bmi270.json'))
+
+from register_definitions import *
+from ticks import ticks_us, ticks_diff
+
+try:
+    import json
+except ImportError:
+    import ujson as json    # type: ignore
+
+try:
+    from time import sleep_ms   # type: ignore
+except ImportError:
+    from time import sleep
+    def sleep_ms(ms : int) -> None:
+        sleep(ms / 1000)
+
+
+def CollectStationary(sensor, samples : int = FOC_SAMPLES, timeout_ms : int = 5000) -> tuple:
+    """
+    Collects "samples" accelerometer and gyroscope frames through the headered FIFO (drained as it fills, so the window
+    may exceed the FIFO size) and returns their raw means ((acc_x, acc_y, acc_z), (gyr_x, gyr_y, gyr_z)).
+    The FIFO configuration is restored and the FIFO flushed afterwards.
+    """
+    saved : bytes = sensor.ReadRegisters(FIFO_CONFIG_0, 2)
+    sensor.Configure(fifo_acc_en=1, fifo_gyr_en=1, fifo_aux_en=0, fifo_header_en=1)
+    sensor.FlushFIFO()
+
+    acc_sum : list = [0, 0, 0]
+    gyr_sum : list = [0, 0, 0]
+    (acc_count, gyr_count) = (0, 0)
+    start : int = ticks_us()
+    try:
+        while((acc_count < samples) or (gyr_count < samples)):
+            if((ticks_diff(ticks_us(), start) // 1000) > timeout_ms):
+                raise OSError("Timed out collecting calibration samples ({} / {} of {})".format(acc_count, gyr_count, samples))
+            sleep_ms(10)
+            for frame in sensor.ReadFIFOFrames():
+                if((frame.acc is not None) and (acc_count < samples)):
+                    for axis in range(3):
+                        acc_sum[axis] += frame.acc[axis]
+                    acc_count += 1
+                if((frame.gyr is not None) and (gyr_count < samples)):
+                    for axis in range(3):
+                        gyr_sum[axis] += frame.gyr[axis]
+                    gyr_count += 1
+    finally:
+        sensor.WriteRegisters(FIFO_CONFIG_0, saved)
+        sensor.FlushFIFO()
+
+    return (tuple(value / samples for value in acc_sum), tuple(value / samples for value in gyr_sum))
+
+
+def _Clamp(value : float, low : int, high : int) -> int:
+    return max(low, min(high, int(round(value))))
+
+
+def PerformFOC(sensor, samples : int = FOC_SAMPLES, gravity : tuple = (0.0, 0.0, 1.0), accelerometer : bool = True, gyroscope : bool = True,
+               timeout_ms : int = 5000) -> dict:
+    """
+    Runs the fast offset compensation with the sensor at rest, "gravity" being the expected accelerometer reading in g
+    (default: lying flat, Z up). Writes and enables the offsets and returns the calibration ({'acc_offset', 'gyr_offset'} in register LSB).
+    If the run fails (e.g. the OSError of a CollectStationary timeout), the previous offsets and compensation state are restored
+    before the error propagates.
+    """
+    saved_offsets : bytes = sensor.ReadRegisters(OFFSET_0, OFFSET_LENGTH)     # OFFSET_6 also holds gyr_off_en / gyr_gain_en
+    saved_nv_conf : int = sensor.ReadRegister(NV_CONF)                        # acc_off_en
+    calibration : dict = None
+    try:
+        (acc_offsets, gyr_offsets) = sensor.ReadOffsets()
+        sensor.DisableOffsetCompensation()
+        (acc_mean, gyr_mean) = CollectStationary(sensor, samples, timeout_ms)
+
+        if(accelerometer):
+            g_per_lsb : float = (sensor.acc_range / GRAVITY) / 32768
+            acc_offsets = tuple(_Clamp((gravity[axis] - (acc_mean[axis] * g_per_lsb)) / ACC_OFFSET_RESOLUTION, ACC_OFFSET_MIN, ACC_OFFSET_MAX) for axis in range(3))
+        if(gyroscope):
+            dps_per_lsb : float = sensor.gyr_range / 32768     # true full scale, the offset register unit is one LSB at 2000 deg/s
+            gyr_offsets = tuple(_Clamp(-(gyr_mean[axis] * dps_per_lsb) / GYR_OFFSET_RESOLUTION, GYR_OFFSET_MIN, GYR_OFFSET_MAX) for axis in range(3))
+
+        result : dict = {'acc_offset' : list(acc_offsets), 'gyr_offset' : list(gyr_offsets)}
+        ApplyCalibration(sensor, result)
+        calibration = result
+    finally:
+        if(calibration is None):
+            sensor.WriteRegisters(OFFSET_0, saved_offsets)
+            sensor.WriteRegister(NV_CONF, saved_nv_conf)
+
+    return calibration
+
+
+def ApplyCalibration(sensor, calibration : dict) -> None:
+    """
+    Writes the offsets of "calibration" and enables the compensation (e.g. at boot, from LoadCalibration).
+    """
+    sensor.WriteOffsets(tuple(calibration['acc_offset']), tuple(calibration['gyr_offset']))
+    sensor.EnableOffsetCompensation()
+
+    return None
+
+
+def SaveCalibration(calibration : dict, path : str) -> None:
+    with open(path, 'w') as output:
+        output.write(json.dumps(calibration))
+
+    return None
+
+
+def LoadCalibration(path : str) -> dict:
+    with open(path) as source:
+        calibration : dict = json.loads(source.read())
+
+    if((len(calibration.get('acc_offset', ())) != 3) or (len(calibration.get('gyr_offset', ())) != 3)):
+        raise ValueError("Invalid calibration file: {}".format(path))
+
+    return calibration
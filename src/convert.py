@@ -0,0 +1,51 @@
+# -------------------------------------------------
+# BATCH CONVERSION
+# -------------------------------------------------
+# Converts blocks of raw samples (FIFO drains, recorded logs) to SI units in one operation.
+# Uses NumPy when it is available (CPython), otherwise a pure-Python loop (MicroPython).
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def AccelerometerScale(acc_range : float) -> float:
+    """
+    Returns the m/s^2 per LSB factor for an accelerometer full-scale range given in m/s^2 (BMI270.acc_range).
+    """
+    return (acc_range / 32768)
+
+
+def GyroscopeScale(gyr_range : float) -> float:
+    """
+    Returns the deg/s per LSB factor for a gyroscope full-scale range given in deg/s (BMI270.gyr_range).
+    """
+    return (1.2 * gyr_range / 32768)
+
+
+def ConvertBatch(raw, acc_scale : float, gyr_scale : float) -> tuple:
+    """
+    Converts raw samples of shape (N, 6) ordered (acc_x, acc_y, acc_z, gyr_x, gyr_y, gyr_z) to (acc, gyr).
+    With NumPy "raw" may be any array-like (unsigned register values wrap to int16) and the results are (N, 3) float arrays,
+    without NumPy "raw" is a sequence of 6-sequences and the results are lists of 3-tuples.
+    """
+    if(np is not None):
+        data = np.asarray(raw)
+        if(data.dtype != np.int16):
+            data = data.astype(np.int16)
+        data = data.reshape(-1, 6)
+
+        scale = np.array((acc_scale, acc_scale, acc_scale, gyr_scale, gyr_scale, gyr_scale))
+        scaled = data * scale
+
+        return (scaled[:, :3], scaled[:, 3:])
+
+    acc_data : list = []
+    gyr_data : list = []
+    for sample in raw:
+        values : list = [(v - 65536) if (v > 32767) else v for v in sample]
+        acc_data.append((values[0] * acc_scale, values[1] * acc_scale, values[2] * acc_scale))
+        gyr_data.append((values[3] * gyr_scale, values[4] * gyr_scale, values[5] * gyr_scale))
+
+    return (acc_data, gyr_data)
@@ -0,0 +1,91 @@
+# -------------------------------------------------
+# FEATURE ENGINE
+# -------------------------------------------------
+# The configuration file uploaded by BMI270.LoadConfiguration runs the on-chip features (any-motion, no-motion, step
+# detector / counter, activity, wrist gestures). Their settings live in feature pages: FEAT_PAGE selects a page and
+# FEATURES_0 .. 0x3F is a 16 byte window onto it, made of little-endian 16-bit words. Page 0 holds the outputs
+# (step count, activity, gesture), the other pages the configuration words described below.
+#
+# Like bitfields.FIELDS this table drives BMI270.ConfigureFeatures, which reads each touched page in one burst,
+# applies the fields and writes the page back in one burst when it changed:
+#
+#   sensor.ConfigureAnyMotion(threshold=0.08, duration=0.1)
+#   sensor.MapFeatureInterrupt(INT_PIN_1, any_motion=True, no_motion=True)
+#   ...
+#   if(sensor.ReadInterruptStatus() & INT_STATUS_ANY_MOTION):
+
+from register_definitions import *
+
+
+# name : (page, word offset in bytes, shift, width)
+FEATURE_FIELDS : dict = {
+    # Any-motion (page 1)
+    'any_motion_duration'   : (1, 0x0C, 0, 13),
+    'any_motion_x'          : (1, 0x0C, 13, 1),
+    'any_motion_y'          : (1, 0x0C, 14, 1),
+    'any_motion_z'          : (1, 0x0C, 15, 1),
+    'any_motion_threshold'  : (1, 0x0E, 0, 11),
+    'any_motion_en'         : (1, 0x0E, 15, 1),
+
+    # No-motion (page 2)
+    'no_motion_duration'    : (2, 0x00, 0, 13),
+    'no_motion_x'           : (2, 0x00, 13, 1),
+    'no_motion_y'           : (2, 0x00, 14, 1),
+    'no_motion_z'           : (2, 0x00, 15, 1),
+    'no_motion_threshold'   : (2, 0x02, 0, 11),
+    'no_motion_en'          : (2, 0x02, 15, 1),
+
+    # Wrist gesture / step counter (page 6)
+    'wrist_gesture_arm'     : (6, 0x00, 4, 1),      # 0: left, 1: right
+    'wrist_gesture_en'      : (6, 0x00, 5, 1),
+    'step_counter_watermark': (6, 0x0C, 0, 10),     # STEP_WATERMARK_RESOLUTION steps per LSB, 0: no watermark interrupt
+    'step_counter_reset'    : (6, 0x0C, 10, 1),
+    'step_detector_en'      : (6, 0x0C, 11, 1),
+    'step_counter_en'       : (6, 0x0C, 12, 1),
+    'step_activity_en'      : (6, 0x0C, 13, 1),
+}
+
+
+def ValidateFeatureFields(fields : dict) -> bool:
+    """
+    Returns True when every feature name is known and every value fits in its bitfield.
+    """
+    for (name, value) in fields.items():
+        if(name not in FEATURE_FIELDS):
+            return False
+        width : int = FEATURE_FIELDS[name][3]
+        if((value < 0) or (value >= (1 << width))):
+            return False
+
+    return True
+
+
+def FeaturePages(fields : dict) -> list:
+    """
+    Returns the sorted list of feature pages touched by "fields".
+    """
+    return sorted(set(FEATURE_FIELDS[name][0] for name in fields))
+
+
+def ApplyFeatureFields(page : int, data, fields : dict) -> bytearray:
+    """
+    Returns a copy of the page contents "data" with the "fields" belonging to "page" applied.
+    """
+    new_data : bytearray = bytearray(data)
+    for (name, value) in fields.items():
+        (field_page, offset, shift, width) = FEATURE_FIELDS[name]
+        if(field_page != page):
+            continue
+        mask : int = ((1 << width) - 1) << shift
+        word : int = new_data[offset] | (new_data[offset + 1] << 8)
+        word = (word & ~mask & 0xFFFF) | ((value << shift) & mask)
+        new_data[offset] = word & FULL_MASK_8BIT
+        new_data[offset + 1] = word >> 8
+
+    return new_data
+
+
+def ReadFeatureField(page_data, name : str) -> int:
+    (_, offset, shift, width) = FEATURE_FIELDS[name]
+    word : int = page_data[offset] | (page_data[offset + 1] << 8)
+    return (word >> shift) & ((1 << width) - 1)
@@ -0,0 +1,170 @@
+# -------------------------------------------------
+# FIFO FRAME PARSER
+# -------------------------------------------------
+
+from struct import unpack_from
+from register_definitions import *
+
+
+class FIFOFrame(object):
+    """
+    A single decoded FIFO frame.
+    "kind" is one of the FIFO_FRAME_* definitions. Data frames carry signed (x, y, z) tuples in "acc" / "gyr" (None when the frame did not carry that sensor)
+    and the raw 8 aux bytes in "aux". Sensortime, skip and config frames carry their payload in "value".
+    "time" is the sensortime of a data frame once AssignFrameTimes has run (None otherwise).
+    """
+    __slots__ = ('kind', 'acc', 'gyr', 'aux', 'value', 'time')
+
+    def __init__(self, kind : str, acc : tuple = None, gyr : tuple = None, aux : bytes = None, value = None) -> None:
+        self.kind = kind
+        self.acc = acc
+        self.gyr = gyr
+        self.aux = aux
+        self.value = value
+        self.time = None
+
+        return None
+
+    def __repr__(self) -> str:
+        if(self.kind == FIFO_FRAME_DATA):
+            return "FIFOFrame(acc={}, gyr={}, aux={})".format(self.acc, self.gyr, self.aux)
+
+        return "FIFOFrame({}={})".format(self.kind, self.value)
+
+
+def ParseFIFO(data, header : bool = True, acc : bool = True, gyr : bool = True, aux : bool = False):
+    """
+    Generator decoding the bytes drained from FIFO_DATA into FIFOFrame objects.
+    In headered mode the frame layout is read from each header byte, in headerless mode it is fixed by the "acc" / "gyr" / "aux" enables of FIFO_CONFIG_1.
+    Parsing stops at the first over-read / empty frame or at a truncated frame.
+    """
+    if(header):
+        yield from _ParseHeadered(data)
+    else:
+        yield from _ParseHeaderless(data, acc, gyr, aux)
+
+
+def _ParseHeadered(data):
+    length : int = len(data)
+    index : int = 0
+
+    while(index < length):
+        header : int = data[index] & FIFO_HEADER_MASK
+        index += 1
+
+        if((header & FIFO_HEADER_MODE_MASK) == FIFO_HEADER_REGULAR):
+            if(header == FIFO_HEADER_EMPTY):
+                return
+
+            frame_length : int = 0
+            if(header & FIFO_HEADER_AUX):
+                frame_length += FIFO_AUX_LENGTH
+            if(header & FIFO_HEADER_GYR):
+                frame_length += FIFO_GYR_LENGTH
+            if(header & FIFO_HEADER_ACC):
+                frame_length += FIFO_ACC_LENGTH
+            if((index + frame_length) > length):
+                return
+
+            # Frame payload order is aux, gyroscope, accelerometer
+            aux_data = None
+            gyr_data = None
+            acc_data = None
+            if(header & FIFO_HEADER_AUX):
+                aux_data = bytes(data[index:(index + FIFO_AUX_LENGTH)])
+                index += FIFO_AUX_LENGTH
+            if(header & FIFO_HEADER_GYR):
+                gyr_data = unpack_from('<3h', data, index)
+                index += FIFO_GYR_LENGTH
+            if(header & FIFO_HEADER_ACC):
+                acc_data = unpack_from('<3h', data, index)
+                index += FIFO_ACC_LENGTH
+
+            yield FIFOFrame(FIFO_FRAME_DATA, acc_data, gyr_data, aux_data)
+
+        elif(header == FIFO_HEADER_SENSORTIME):
+            if((index + FIFO_SENSORTIME_LENGTH) > length):
+                return
+            sensor_time : int = (data[index + 2] << 16) | (data[index + 1] << 8) | data[index]
+            index += FIFO_SENSORTIME_LENGTH
+            yield FIFOFrame(FIFO_FRAME_SENSORTIME, value=sensor_time)
+
+        elif(header == FIFO_HEADER_SKIP):
+            if((index + FIFO_SKIP_LENGTH) > length):
+                return
+            skipped : int = data[index]
+            index += FIFO_SKIP_LENGTH
+            yield FIFOFrame(FIFO_FRAME_SKIP, value=skipped)
+
+        elif(header == FIFO_HEADER_CONFIG):
+            if((index + FIFO_CONFIG_LENGTH) > length):
+                return
+            config : bytes = bytes(data[index:(index + FIFO_CONFIG_LENGTH)])
+            index += FIFO_CONFIG_LENGTH
+            yield FIFOFrame(FIFO_FRAME_CONFIG, value=config)
+
+        else:
+            # Unknown header, the rest of the buffer cannot be framed reliably
+            return
+
+
+def _ParseHeaderless(data, acc : bool, gyr : bool, aux : bool):
+    frame_length : int = 0
+    if(aux):
+        frame_length += FIFO_AUX_LENGTH
+    if(gyr):
+        frame_length += FIFO_GYR_LENGTH
+    if(acc):
+        frame_length += FIFO_ACC_LENGTH
+    if(frame_length == 0):
+        return
+
+    length : int = len(data)
+    index : int = 0
+
+    while((index + frame_length) <= length):
+        if(unpack_from('<H', data, index)[0] == FIFO_OVER_READ):
+            return
+
+        aux_data = None
+        gyr_data = None
+        acc_data = None
+        if(aux):
+            if(unpack_from('<H', data, index)[0] != FIFO_AUX_DUMMY):
+                aux_data = bytes(data[index:(index + FIFO_AUX_LENGTH)])
+            index += FIFO_AUX_LENGTH
+        if(gyr):
+            gyr_data = unpack_from('<3h', data, index)
+            if((gyr_data[0] & 0xFFFF) == FIFO_GYR_DUMMY):
+                gyr_data = None
+            index += FIFO_GYR_LENGTH
+        if(acc):
+            acc_data = unpack_from('<3h', data, index)
+            if((acc_data[0] & 0xFFFF) == FIFO_ACC_DUMMY):
+                acc_data = None
+            index += FIFO_ACC_LENGTH
+
+        yield FIFOFrame(FIFO_FRAME_DATA, acc_data, gyr_data, aux_data)
+
+
+def AssignFrameTimes(frames : list, frame_rate : float) -> int:
+    """
+    Sets "time" on the data frames of one drained batch, taking the batch's sensortime frame as the time of its last data frame
+    and stepping back 1 / "frame_rate" (the effective FIFO rate, see BMI270.FIFORates) per frame. Returns the number of frames
+    timestamped, 0 when the batch has no sensortime frame (fifo_time_en off, headerless mode) or the rate is unknown.
+    """
+    sensor_time = None
+    for frame in frames:
+        if(frame.kind == FIFO_FRAME_SENSORTIME):
+            sensor_time = frame.value
+    if((sensor_time is None) or (frame_rate <= 0)):
+        return 0
+
+    ticks_per_frame : float = 1 / (frame_rate * SENSORTIME_RESOLUTION)
+    count : int = 0
+    for frame in reversed(frames):
+        if(frame.kind == FIFO_FRAME_DATA):
+            frame.time = (sensor_time - int(round(count * ticks_per_frame))) & SENSORTIME_MASK
+            count += 1
+
+    return count
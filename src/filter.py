@@ -22,19 +22,32 @@ except ImportError:
     import time
 
 from math import sqrt, atan2, asin, degrees, radians
+from array import array
+
+try:
+    from micropython import native
+except ImportError:
+    def native(f):      # CPython: no code emitter, run as plain bytecode
+        return f
+
+_D2R = radians(1)
 
 class Fusion(object):
     '''
     Class provides sensor fusion allowing heading, pitch and roll to be extracted. This uses the Madgwick algorithm.
     The update method must be called peiodically. The calculations take 1.6mS on the Pyboard.
     '''
-    def __init__(self, timediff=None):
-        self.q = [1.0, 0.0, 0.0, 0.0]       # vector to hold quaternion
+    def __init__(self, timediff=None, allocation_free=False):
+        if allocation_free:
+            self.q = array('d', (1.0, 0.0, 0.0, 0.0))  # preallocated quaternion (double where the port has it), updated in place by update_into
+        else:
+            self.q = [1.0, 0.0, 0.0, 0.0]       # vector to hold quaternion
         GyroMeasError = radians(40)         # Original code indicates this leads to a 2 sec response time
         self.beta = sqrt(3.0 / 4.0) * GyroMeasError  # compute beta (see README)
         self.pitch = 0
         self.heading = 0
         self.roll = 0
+        self.yaw = 0
 
     def update(self, accel, gyro, dt=0.01):    # 3-tuples (x, y, z) for accel, gyro
         ax, ay, az = accel                  # Units G (but later normalised)
@@ -94,3 +107,268 @@ class Fusion(object):
         # self.pitch = degrees(-asin(2.0 * (self.q[1] * self.q[3] - self.q[0] * self.q[2])))
         # self.roll = degrees(atan2(2.0 * (self.q[0] * self.q[1] + self.q[2] * self.q[3]),
         #     self.q[0] * self.q[0] - self.q[1] * self.q[1] - self.q[2] * self.q[2] + self.q[3] * self.q[3]))
+
+    def update_mag(self, accel, gyro, mag, dt=0.01):    # 3-tuples (x, y, z) for accel, gyro and mag
+        '''
+        9 degrees of freedom update (Madgwick MARG): the magnetometer also corrects heading drift. Magnetometer units are
+        irrelevant (normalised). Falls back to the 6 DoF update when the magnetometer reads zero.
+        '''
+        mx, my, mz = mag
+        if mx == 0 and my == 0 and mz == 0:
+            return self.update(accel, gyro, dt)
+        ax, ay, az = accel                  # Units G (but later normalised)
+        gx, gy, gz = (radians(x) for x in gyro) # Units deg/s
+        q1, q2, q3, q4 = (self.q[x] for x in range(4))   # short name local variable for readability
+        # Auxiliary variables to avoid repeated arithmetic
+        _2q1 = 2 * q1
+        _2q2 = 2 * q2
+        _2q3 = 2 * q3
+        _2q4 = 2 * q4
+        _2q1q3 = 2 * q1 * q3
+        _2q3q4 = 2 * q3 * q4
+        q1q1 = q1 * q1
+        q1q2 = q1 * q2
+        q1q3 = q1 * q3
+        q1q4 = q1 * q4
+        q2q2 = q2 * q2
+        q2q3 = q2 * q3
+        q2q4 = q2 * q4
+        q3q3 = q3 * q3
+        q3q4 = q3 * q4
+        q4q4 = q4 * q4
+
+        # Normalise accelerometer measurement
+        norm = sqrt(ax * ax + ay * ay + az * az)
+        if (norm == 0):
+            return # handle NaN
+        norm = 1 / norm        # use reciprocal for division
+        ax *= norm
+        ay *= norm
+        az *= norm
+
+        # Normalise magnetometer measurement
+        norm = 1 / sqrt(mx * mx + my * my + mz * mz)
+        mx *= norm
+        my *= norm
+        mz *= norm
+
+        # Reference direction of Earth's magnetic field
+        _2q1mx = 2 * q1 * mx
+        _2q1my = 2 * q1 * my
+        _2q1mz = 2 * q1 * mz
+        _2q2mx = 2 * q2 * mx
+        hx = mx * q1q1 - _2q1my * q4 + _2q1mz * q3 + mx * q2q2 + _2q2 * my * q3 + _2q2 * mz * q4 - mx * q3q3 - mx * q4q4
+        hy = _2q1mx * q4 + my * q1q1 - _2q1mz * q2 + _2q2mx * q3 - my * q2q2 + my * q3q3 + _2q3 * mz * q4 - my * q4q4
+        _2bx = sqrt(hx * hx + hy * hy)
+        _2bz = -_2q1mx * q3 + _2q1my * q2 + mz * q1q1 + _2q2mx * q4 - mz * q2q2 + _2q3 * my * q4 - mz * q3q3 + mz * q4q4
+        _4bx = 2 * _2bx
+        _4bz = 2 * _2bz
+
+        # Gradient decent algorithm corrective step
+        s1 = (-_2q3 * (2 * q2q4 - _2q1q3 - ax) + _2q2 * (2 * q1q2 + _2q3q4 - ay) - _2bz * q3 * (_2bx * (0.5 - q3q3 - q4q4)
+             + _2bz * (q2q4 - q1q3) - mx) + (-_2bx * q4 + _2bz * q2) * (_2bx * (q2q3 - q1q4) + _2bz * (q1q2 + q3q4) - my)
+             + _2bx * q3 * (_2bx * (q1q3 + q2q4) + _2bz * (0.5 - q2q2 - q3q3) - mz))
+
+        s2 = (_2q4 * (2 * q2q4 - _2q1q3 - ax) + _2q1 * (2 * q1q2 + _2q3q4 - ay) - 4 * q2 * (1 - 2 * q2q2 - 2 * q3q3 - az)
+             + _2bz * q4 * (_2bx * (0.5 - q3q3 - q4q4) + _2bz * (q2q4 - q1q3) - mx) + (_2bx * q3 + _2bz * q1) * (_2bx * (q2q3 - q1q4)
+             + _2bz * (q1q2 + q3q4) - my) + (_2bx * q4 - _4bz * q2) * (_2bx * (q1q3 + q2q4) + _2bz * (0.5 - q2q2 - q3q3) - mz))
+
+        s3 = (-_2q1 * (2 * q2q4 - _2q1q3 - ax) + _2q4 * (2 * q1q2 + _2q3q4 - ay) - 4 * q3 * (1 - 2 * q2q2 - 2 * q3q3 - az)
+             + (-_4bx * q3 - _2bz * q1) * (_2bx * (0.5 - q3q3 - q4q4) + _2bz * (q2q4 - q1q3) - mx)
+             + (_2bx * q2 + _2bz * q4) * (_2bx * (q2q3 - q1q4) + _2bz * (q1q2 + q3q4) - my)
+             + (_2bx * q1 - _4bz * q3) * (_2bx * (q1q3 + q2q4) + _2bz * (0.5 - q2q2 - q3q3) - mz))
+
+        s4 = (_2q2 * (2 * q2q4 - _2q1q3 - ax) + _2q3 * (2 * q1q2 + _2q3q4 - ay) + (-_4bx * q4 + _2bz * q2) * (_2bx * (0.5 - q3q3 - q4q4)
+              + _2bz * (q2q4 - q1q3) - mx) + (-_2bx * q1 + _2bz * q3) * (_2bx * (q2q3 - q1q4) + _2bz * (q1q2 + q3q4) - my)
+              + _2bx * q2 * (_2bx * (q1q3 + q2q4) + _2bz * (0.5 - q2q2 - q3q3) - mz))
+
+        norm = sqrt(s1 * s1 + s2 * s2 + s3 * s3 + s4 * s4)
+        if (norm == 0):
+            norm = 1
+        norm = 1 / norm    # normalise step magnitude
+        s1 *= norm
+        s2 *= norm
+        s3 *= norm
+        s4 *= norm
+
+        # Compute rate of change of quaternion
+        qDot1 = 0.5 * (-q2 * gx - q3 * gy - q4 * gz) - self.beta * s1
+        qDot2 = 0.5 * (q1 * gx + q3 * gz - q4 * gy) - self.beta * s2
+        qDot3 = 0.5 * (q1 * gy - q2 * gz + q4 * gx) - self.beta * s3
+        qDot4 = 0.5 * (q1 * gz + q2 * gy - q3 * gx) - self.beta * s4
+
+        # Integrate to yield quaternion
+        q1 += qDot1 * dt
+        q2 += qDot2 * dt
+        q3 += qDot3 * dt
+        q4 += qDot4 * dt
+        norm = 1 / sqrt(q1 * q1 + q2 * q2 + q3 * q3 + q4 * q4)    # normalise quaternion
+        if isinstance(self.q, array):       # keep the preallocated quaternion of allocation_free instances
+            self.q[0] = q1 * norm
+            self.q[1] = q2 * norm
+            self.q[2] = q3 * norm
+            self.q[3] = q4 * norm
+        else:
+            self.q = q1 * norm, q2 * norm, q3 * norm, q4 * norm
+
+        self.yaw = atan2(2.0*(self.q[1]*self.q[2] + self.q[3]*self.q[0]), self.q[3]*self.q[3] - self.q[0]*self.q[0] - self.q[1]*self.q[1] + self.q[2]*self.q[2])
+
+    def update_batch(self, accel, gyro, dt=0.01, trajectory=False):
+        '''
+        Runs the update recurrence over a block of samples (e.g. a FIFO drain or a decoded log) in one loop with local state.
+        accel, gyro: equal length sequences of 3-tuples or (N, 3) NumPy arrays (same units as update). dt: a scalar or a sequence with one dt per sample.
+        Returns the final quaternion, or (quaternion, list of per-sample quaternions) when trajectory is True.
+        '''
+        if hasattr(accel, 'tolist'):       # NumPy blocks (BMI270.FormatBatch): Python floats are much faster per element
+            accel = accel.tolist()
+            gyro = gyro.tolist()
+        if hasattr(dt, 'tolist'):
+            dt = dt.tolist()
+        q1, q2, q3, q4 = self.q
+        beta = self.beta
+        d2r = radians(1)
+        dts = None if isinstance(dt, (int, float)) else dt
+        path = [] if trajectory else None
+        for i in range(len(accel)):
+            ax, ay, az = accel[i]
+            gx, gy, gz = gyro[i]
+            gx *= d2r
+            gy *= d2r
+            gz *= d2r
+            if dts is not None:
+                dt = dts[i]
+
+            norm = sqrt(ax * ax + ay * ay + az * az)
+            if (norm == 0):
+                if trajectory:
+                    path.append((q1, q2, q3, q4))
+                continue # handle NaN
+            norm = 1 / norm
+            ax *= norm
+            ay *= norm
+            az *= norm
+
+            _2q1 = 2 * q1
+            _2q2 = 2 * q2
+            _2q3 = 2 * q3
+            _2q4 = 2 * q4
+            _4q1 = 4 * q1
+            _4q2 = 4 * q2
+            _4q3 = 4 * q3
+            _8q2 = 8 * q2
+            _8q3 = 8 * q3
+            q1q1 = q1 * q1
+            q2q2 = q2 * q2
+            q3q3 = q3 * q3
+            q4q4 = q4 * q4
+
+            s1 = _4q1 * q3q3 + _2q3 * ax + _4q1 * q2q2 - _2q2 * ay
+            s2 = _4q2 * q4q4 - _2q4 * ax + 4 * q1q1 * q2 - _2q1 * ay - _4q2 + _8q2 * q2q2 + _8q2 * q3q3 + _4q2 * az
+            s3 = 4 * q1q1 * q3 + _2q1 * ax + _4q3 * q4q4 - _2q4 * ay - _4q3 + _8q3 * q2q2 + _8q3 * q3q3 + _4q3 * az
+            s4 = 4 * q2q2 * q4 - _2q2 * ax + 4 * q3q3 * q4 - _2q3 * ay
+            norm = beta / sqrt(s1 * s1 + s2 * s2 + s3 * s3 + s4 * s4)    # normalise step magnitude, folded with beta
+
+            qDot1 = 0.5 * (-q2 * gx - q3 * gy - q4 * gz) - norm * s1
+            qDot2 = 0.5 * (q1 * gx + q3 * gz - q4 * gy) - norm * s2
+            qDot3 = 0.5 * (q1 * gy - q2 * gz + q4 * gx) - norm * s3
+            qDot4 = 0.5 * (q1 * gz + q2 * gy - q3 * gx) - norm * s4
+
+            q1 += qDot1 * dt
+            q2 += qDot2 * dt
+            q3 += qDot3 * dt
+            q4 += qDot4 * dt
+            norm = 1 / sqrt(q1 * q1 + q2 * q2 + q3 * q3 + q4 * q4)    # normalise quaternion
+            q1 *= norm
+            q2 *= norm
+            q3 *= norm
+            q4 *= norm
+            if trajectory:
+                path.append((q1, q2, q3, q4))
+
+        if isinstance(self.q, array):       # keep the preallocated quaternion of allocation_free instances
+            self.q[0] = q1
+            self.q[1] = q2
+            self.q[2] = q3
+            self.q[3] = q4
+        else:
+            self.q = q1, q2, q3, q4
+        self.yaw = atan2(2.0*(q2*q3 + q4*q1), q4*q4 - q1*q1 - q2*q2 + q3*q3)
+        if trajectory:
+            return self.q, path
+        return self.q
+
+    @native
+    def update_into(self, accel, gyro, dt):
+        '''
+        Variant of update for the periodic hot path: accel and gyro are preallocated buffers (e.g. array('f')), the quaternion
+        is kept in a preallocated array('d') and written in place, and no tuples, lists or generators are created.
+        It is not allocation-free on every port: the float arithmetic itself allocates where floats are boxed (object
+        representation A / B, most boards), only ports with immediate floats (C / D) run it without heap growth.
+        benchmark.FusionHeapGrowth measures it on the board. yaw is refreshed like in update.
+        '''
+        q = self.q
+        if not isinstance(q, array):
+            q = self.q = array('d', q)      # one-off conversion after update() stored a tuple
+        ax = accel[0]
+        ay = accel[1]
+        az = accel[2]
+        gx = gyro[0] * _D2R
+        gy = gyro[1] * _D2R
+        gz = gyro[2] * _D2R
+        q1 = q[0]
+        q2 = q[1]
+        q3 = q[2]
+        q4 = q[3]
+
+        norm = sqrt(ax * ax + ay * ay + az * az)
+        if (norm == 0):
+            return # handle NaN
+        norm = 1 / norm
+        ax *= norm
+        ay *= norm
+        az *= norm
+
+        _2q1 = 2 * q1
+        _2q2 = 2 * q2
+        _2q3 = 2 * q3
+        _2q4 = 2 * q4
+        _4q1 = 4 * q1
+        _4q2 = 4 * q2
+        _4q3 = 4 * q3
+        _8q2 = 8 * q2
+        _8q3 = 8 * q3
+        q1q1 = q1 * q1
+        q2q2 = q2 * q2
+        q3q3 = q3 * q3
+        q4q4 = q4 * q4
+
+        s1 = _4q1 * q3q3 + _2q3 * ax + _4q1 * q2q2 - _2q2 * ay
+        s2 = _4q2 * q4q4 - _2q4 * ax + 4 * q1q1 * q2 - _2q1 * ay - _4q2 + _8q2 * q2q2 + _8q2 * q3q3 + _4q2 * az
+        s3 = 4 * q1q1 * q3 + _2q1 * ax + _4q3 * q4q4 - _2q4 * ay - _4q3 + _8q3 * q2q2 + _8q3 * q3q3 + _4q3 * az
+        s4 = 4 * q2q2 * q4 - _2q2 * ax + 4 * q3q3 * q4 - _2q3 * ay
+        norm = self.beta / sqrt(s1 * s1 + s2 * s2 + s3 * s3 + s4 * s4)    # normalise step magnitude, folded with beta
+
+        qDot1 = 0.5 * (-q2 * gx - q3 * gy - q4 * gz) - norm * s1
+        qDot2 = 0.5 * (q1 * gx + q3 * gz - q4 * gy) - norm * s2
+        qDot3 = 0.5 * (q1 * gy - q2 * gz + q4 * gx) - norm * s3
+        qDot4 = 0.5 * (q1 * gz + q2 * gy - q3 * gx) - norm * s4
+
+        q1 += qDot1 * dt
+        q2 += qDot2 * dt
+        q3 += qDot3 * dt
+        q4 += qDot4 * dt
+        norm = 1 / sqrt(q1 * q1 + q2 * q2 + q3 * q3 + q4 * q4)    # normalise quaternion
+        q1 *= norm
+        q2 *= norm
+        q3 *= norm
+        q4 *= norm
+        q[0] = q1
+        q[1] = q2
+        q[2] = q3
+        q[3] = q4
+        self.yaw = atan2(2.0*(q2*q3 + q4*q1), q4*q4 - q1*q1 - q2*q2 + q3*q3)
+
+    def update_yaw(self):
+        q = self.q
+        self.yaw = atan2(2.0*(q[1]*q[2] + q[3]*q[0]), q[3]*q[3] - q[0]*q[0] - q[1]*q[1] + q[2]*q[2])
+        return self.yaw
@@ -0,0 +1,257 @@
+# -------------------------------------------------
+# POWER GOVERNOR
+# -------------------------------------------------
+# Moves an IMU between the low-power, normal and performance profiles from its motion state, so a device lying still
+# is sampled (and read over the bus) at a fraction of the full rate. Each profile sets the ODRs / filter modes / advanced
+# power save in one Configure transaction, the FIFO watermark (when the IMU drains the FIFO) and the host filter rate.
+#
+# The motion state comes either from the host signal (SOURCE_ENERGY: smoothed gyroscope magnitude plus the accelerometer's
+# deviation from 1 g, computed from the samples the IMU already read) or from the on-chip any / no-motion detectors
+# (SOURCE_FEATURES: no sample inspection needed to fall asleep or wake up; normal <-> performance still follows the host
+# signal). With a host "pin" wired to the INT line the detectors are mapped to, INT_STATUS is only read after that pin fired,
+# otherwise at most every "status_period" s; the other status bits are left to their owners (BMI270.TakeInterruptStatus).
+# Transitions use separate enter / exit levels and a minimum dwell time, waking up is immediate.
+#
+#   governor = imu.EnableGovernor(source=SOURCE_FEATURES, pin=Pin(21, Pin.IN), interrupt_pin=INT_PIN_2)
+#   while(True):
+#       imu.Poll()              # or imu.UpdateAccelerometer(), both call governor.Update()
+#   print(governor.Stats())
+
+from register_definitions import *
+from ticks import ticks_us, ticks_diff
+
+try:
+    from time import sleep_us   # type: ignore
+except ImportError:
+    from time import sleep
+    def sleep_us(us : int) -> None:
+        sleep(us / 1000000)
+
+
+SOURCE_ENERGY           = 'energy'
+SOURCE_FEATURES         = 'features'
+GOVERNOR_MODES          = (LOW_POWER_MODE, NORMAL_MODE, PERFORMANCE_MODE)
+FIFO_FRAME_LENGTH       = 1 + FIFO_ACC_LENGTH + FIFO_GYR_LENGTH     # headered accelerometer + gyroscope frame
+ACC_ACTIVITY_WEIGHT     = 10.0      # deg/s of activity per m/s^2 of accelerometer deviation from 1 g
+MOTION_STATUS           = INT_STATUS_ANY_MOTION | INT_STATUS_NO_MOTION
+
+# mode : Configure fields, host sample rate (Hz), FIFO latency (s, sets the watermark when the IMU drains the FIFO)
+GOVERNOR_PROFILES : dict = {
+    LOW_POWER_MODE : {
+        'fields' : {'acc_odr' : ACC_ODR_50, 'acc_bwp' : ACC_BWP_OSR2, 'acc_filter_perf' : 0, 'gyr_odr' : GYR_ODR_25,
+                    'gyr_noise_perf' : 0, 'gyr_filter_perf' : 0, 'adv_power_save' : 1},
+        'sample_rate' : 25,
+        'latency' : 1.0,
+    },
+    NORMAL_MODE : {
+        'fields' : {'acc_odr' : ACC_ODR_100, 'acc_bwp' : ACC_BWP_NORMAL, 'acc_filter_perf' : 1, 'gyr_odr' : GYR_ODR_200,
+                    'gyr_noise_perf' : 0, 'gyr_filter_perf' : 1, 'adv_power_save' : 0},
+        'sample_rate' : 200,
+        'latency' : 0.1,
+    },
+    PERFORMANCE_MODE : {
+        'fields' : {'acc_odr' : ACC_ODR_400, 'acc_bwp' : ACC_BWP_NORMAL, 'acc_filter_perf' : 1, 'gyr_odr' : GYR_ODR_400,
+                    'gyr_noise_perf' : 1, 'gyr_filter_perf' : 1, 'adv_power_save' : 0},
+        'sample_rate' : 400,
+        'latency' : 0.05,
+    },
+}
+
+
+class PowerGovernor(object):
+    """
+    Activity levels are in deg/s: performance is entered above "active_level" and left below active_level * "hysteresis",
+    low power is entered after "idle_time" s below "idle_level" and left above idle_level / "hysteresis". A mode is kept at
+    least "dwell_time" s before stepping down. Must not be used while a background acquisition thread owns the bus.
+    For SOURCE_FEATURES, "pin" is the host pin on the sensor's "interrupt_pin" output (use the line the data interrupts are not on).
+    """
+    def __init__(self, imu, source : str = SOURCE_ENERGY, profiles : dict = None, active_level : float = 60.0, idle_level : float = 3.0,
+                 hysteresis : float = 0.5, idle_time : float = 2.0, dwell_time : float = 1.0, smoothing : float = 0.1,
+                 pin = None, interrupt_pin : int = INT_PIN_2, status_period : float = 0.5) -> None:
+        if(source not in (SOURCE_ENERGY, SOURCE_FEATURES)):
+            raise ValueError("Unknown motion source: {}".format(source))
+        if(not (0.0 < hysteresis <= 1.0)):
+            raise ValueError("Hysteresis must be in (0, 1]: {}".format(hysteresis))
+
+        self.imu = imu
+        self.sensor = imu.BMI270
+        self.source : str = source
+        self.profiles : dict = profiles if (profiles is not None) else GOVERNOR_PROFILES
+        self.active_level : float = active_level
+        self.idle_level : float = idle_level
+        self.hysteresis : float = hysteresis
+        self.idle_time : float = idle_time
+        self.dwell_time : float = dwell_time
+        self.smoothing : float = smoothing
+        self.pin = pin
+        self.interrupt_pin : int = interrupt_pin
+        self.status_period : float = status_period
+        self.interrupt = None
+        self.status_age : float = 0.0
+
+        self.mode : str = None
+        self.activity : float = 0.0
+        self.chip_still : bool = False     # SOURCE_FEATURES: no-motion reported and no any-motion since
+        self.still_time : float = 0.0
+        self.mode_time : float = 0.0
+        self.last_update : int = None
+        self.ResetStats()
+
+        return None
+
+
+    def Start(self, mode : str = NORMAL_MODE) -> None:
+        """
+        Applies "mode" and, for SOURCE_FEATURES, arms the on-chip any / no-motion detectors (no-motion after "idle_time").
+        """
+        if(self.source == SOURCE_FEATURES):
+            self.sensor.ConfigureAnyMotion()
+            self.sensor.ConfigureNoMotion(duration=self.idle_time)
+            if(self.pin is not None):
+                from interrupts import InterruptFlag
+                self.sensor.MapFeatureInterrupt(self.interrupt_pin, any_motion=True, no_motion=True)
+                self.interrupt = InterruptFlag(self.pin)
+            self.sensor.TakeInterruptStatus(MOTION_STATUS)
+
+        self.SetMode(mode)
+        self.last_update = ticks_us()
+
+        return None
+
+
+    def SetMode(self, mode : str) -> None:
+        """
+        Applies the profile of "mode": sensor settings in one Configure transaction, then the FIFO watermark and the host rates.
+        """
+        if(mode not in self.profiles):
+            raise ValueError("Unknown power mode: {}".format(mode))
+        if(mode == self.mode):
+            return None
+
+        profile : dict = self.profiles[mode]
+        sample_rate : float = profile['sample_rate']
+        if((self.mode is not None) and self.profiles[self.mode]['fields'].get('adv_power_save')):
+            # register writes need 1 ms spacing in advanced power save, leave it before the burst
+            self.sensor.Configure(adv_power_save=0)
+            sleep_us(450)
+        self.sensor.Configure(**profile['fields'])
+
+        if(self.imu.watermark):
+            watermark : int = min(FIFO_SIZE - (2 * FIFO_FRAME_LENGTH), max(FIFO_FRAME_LENGTH, int(sample_rate * profile['latency']) * FIFO_FRAME_LENGTH))
+            self.sensor.SetFIFOWatermark(watermark)
+            self.imu.watermark = watermark
+
+        self.imu.sample_rate = sample_rate
+        self.imu.clock.default_dt = 1 / sample_rate
+        self.imu.psi_clock.default_dt = 1 / sample_rate
+
+        if(self.mode is not None):
+            self.transitions += 1
+        self.mode = mode
+        self.mode_time = 0.0
+
+        return None
+
+
+    def Activity(self) -> float:
+        """
+        Smoothed activity of the IMU's latest sample: |gyroscope| in deg/s plus the weighted |accelerometer| deviation from 1 g.
+        """
+        (acc, gyr) = (self.imu.acc_data, self.imu.gyro_data)
+        rate : float = ((gyr[0] * gyr[0]) + (gyr[1] * gyr[1]) + (gyr[2] * gyr[2])) ** 0.5
+        deviation : float = abs((((acc[0] * acc[0]) + (acc[1] * acc[1]) + (acc[2] * acc[2])) ** 0.5) - GRAVITY)
+        self.activity += self.smoothing * ((rate + (ACC_ACTIVITY_WEIGHT * deviation)) - self.activity)
+
+        return self.activity
+
+
+    def Target(self, dt : float) -> str:
+        """
+        The mode the motion state asks for, before the dwell time is applied.
+        """
+        mode : str = self.mode
+        if(self.source == SOURCE_FEATURES):
+            status : int = self.MotionStatus(dt)
+            if(status & INT_STATUS_ANY_MOTION):
+                self.chip_still = False
+            elif(status & INT_STATUS_NO_MOTION):
+                self.chip_still = True
+            if(self.chip_still):
+                return LOW_POWER_MODE   # until the chip reports motion, the samples are not inspected
+            if(mode == LOW_POWER_MODE):
+                mode = NORMAL_MODE
+
+        activity : float = self.Activity()
+        self.still_time = (self.still_time + dt) if (activity < self.idle_level) else 0.0
+
+        if(mode == PERFORMANCE_MODE):
+            return mode if (activity >= (self.active_level * self.hysteresis)) else NORMAL_MODE
+        if(activity >= self.active_level):
+            return PERFORMANCE_MODE
+        if(mode == LOW_POWER_MODE):
+            return mode if (activity <= (self.idle_level / self.hysteresis)) else NORMAL_MODE
+        if((self.source == SOURCE_ENERGY) and (self.still_time >= self.idle_time)):
+            return LOW_POWER_MODE
+
+        return NORMAL_MODE
+
+
+    def MotionStatus(self, dt : float) -> int:
+        """
+        The any / no-motion status bits, read from the sensor only after the feature pin fired (or every "status_period" s without one).
+        """
+        if(self.interrupt is not None):
+            if(not self.interrupt.Clear()):
+                return 0
+        else:
+            self.status_age += dt
+            if(self.status_age < self.status_period):
+                return 0
+            self.status_age = 0.0
+
+        return self.sensor.TakeInterruptStatus(MOTION_STATUS)
+
+
+    def Update(self) -> str:
+        """
+        Accounts the time since the last call to the current mode and switches mode when the motion state asks for it
+        (stepping down only after "dwell_time"). Call once per processed sample / FIFO drain; returns the current mode.
+        """
+        if(self.mode is None):
+            self.Start()
+            return self.mode
+
+        now : int = ticks_us()
+        dt : float = ticks_diff(now, self.last_update) / 1000000
+        self.last_update = now
+        self.time[self.mode] += dt
+        self.mode_time += dt
+
+        target : str = self.Target(dt)
+        if(target != self.mode):
+            stepping_down : bool = GOVERNOR_MODES.index(target) < GOVERNOR_MODES.index(self.mode)
+            if((not stepping_down) or (self.mode_time >= self.dwell_time)):
+                self.SetMode(target)
+
+        return self.mode
+
+
+    def ResetStats(self) -> None:
+        self.time : dict = {mode : 0.0 for mode in GOVERNOR_MODES}
+        self.transitions : int = 0
+
+        return None
+
+
+    def Stats(self) -> dict:
+        """
+        Seconds spent in each mode, their share of the total, the number of mode switches and the current mode / activity.
+        """
+        total : float = sum(self.time.values())
+        return {
+            'mode' : self.mode,
+            'activity' : self.activity,
+            'transitions' : self.transitions,
+            'time' : dict(self.time),
+            'fraction' : {mode : ((seconds / total) if total else 0.0) for (mode, seconds) in self.time.items()},
+        }
@@ -0,0 +1,142 @@
+# -------------------------------------------------
+# BUS INSTRUMENTATION
+# -------------------------------------------------
+# InstrumentedBus wraps a transport (machine.I2C, LinuxI2C, SPITransport, VirtualI2C) and counts transactions, bytes and
+# time per register, with log2 latency histograms per direction. BMI270.EnableInstrumentation swaps it in front of the
+# bus and DisableInstrumentation removes it again, so there is no cost at all while it is disabled. Every register access
+# (ReadRegister(s), WriteRegister(s), WriteI2CBlock, data / FIFO bursts, configuration upload) goes through the bus and is covered.
+#
+#   bus = sensor.EnableInstrumentation()
+#   ...
+#   print(bus.stats())
+#   bus.reset()
+
+from array import array
+from ticks import ticks_us, ticks_diff
+
+
+# Histogram bucket n counts transactions that took less than 2 ** n us, the last bucket everything slower
+HISTOGRAM_BUCKETS = 16
+
+# Per-register counters, in this order
+REGISTER_TRANSACTIONS   = 0
+REGISTER_BYTES_READ     = 1
+REGISTER_BYTES_WRITTEN  = 2
+REGISTER_TIME_US        = 3
+REGISTER_MAX_US         = 4
+
+
+def _Bucket(duration : int) -> int:
+    bucket : int = 0
+    while((duration > 0) and (bucket < (HISTOGRAM_BUCKETS - 1))):
+        duration >>= 1
+        bucket += 1
+
+    return bucket
+
+
+class InstrumentedBus(object):
+    """
+    machine.I2C compatible proxy; attributes it does not define (max_write, scan, counters of simulated buses) are forwarded to "bus".
+    """
+    def __init__(self, bus) -> None:
+        self.bus = bus
+        if(hasattr(bus, 'writeto_mem_blocks')):
+            self.writeto_mem_blocks = self._writeto_mem_blocks
+        self.reset()
+
+        return None
+
+
+    def __getattr__(self, name : str):
+        return getattr(self.bus, name)
+
+
+    def reset(self) -> None:
+        self.registers : dict = {}
+        self.histograms : dict = {'read' : array('L', [0] * HISTOGRAM_BUCKETS), 'write' : array('L', [0] * HISTOGRAM_BUCKETS)}
+
+        return None
+
+
+    def Record(self, kind : str, register : int, read : int, written : int, start : int) -> None:
+        duration : int = ticks_diff(ticks_us(), start)
+
+        counters = self.registers.get(register)
+        if(counters is None):
+            counters = array('L', [0] * 5)
+            self.registers[register] = counters
+        counters[REGISTER_TRANSACTIONS] += 1
+        counters[REGISTER_BYTES_READ] += read
+        counters[REGISTER_BYTES_WRITTEN] += written
+        counters[REGISTER_TIME_US] += duration
+        if(duration > counters[REGISTER_MAX_US]):
+            counters[REGISTER_MAX_US] = duration
+
+        self.histograms[kind][_Bucket(duration)] += 1
+
+        return None
+
+
+    def readfrom_mem(self, addr : int, memaddr : int, nbytes : int, addrsize : int = 8) -> bytes:
+        start : int = ticks_us()
+        data : bytes = self.bus.readfrom_mem(addr, memaddr, nbytes, addrsize=addrsize)
+        self.Record('read', memaddr, nbytes, 0, start)
+
+        return data
+
+
+    def readfrom_mem_into(self, addr : int, memaddr : int, buf, addrsize : int = 8) -> None:
+        start : int = ticks_us()
+        self.bus.readfrom_mem_into(addr, memaddr, buf, addrsize=addrsize)
+        self.Record('read', memaddr, len(buf), 0, start)
+
+        return None
+
+
+    def writeto_mem(self, addr : int, memaddr : int, buf, addrsize : int = 8) -> None:
+        start : int = ticks_us()
+        self.bus.writeto_mem(addr, memaddr, buf, addrsize=addrsize)
+        self.Record('write', memaddr, 0, len(buf), start)
+
+        return None
+
+
+    def _writeto_mem_blocks(self, addr : int, blocks) -> None:
+        """
+        One combined transaction, accounted to the first register of the group.
+        """
+        start : int = ticks_us()
+        self.bus.writeto_mem_blocks(addr, blocks)
+        self.Record('write', blocks[0][0], 0, sum(len(buf) for (_, buf) in blocks), start)
+
+        return None
+
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the counters: totals, per-register figures and the latency histograms (bucket n: under 2 ** n us).
+        """
+        registers : dict = {}
+        (transactions, read, written, time_us) = (0, 0, 0, 0)
+        for (register, counters) in self.registers.items():
+            registers[register] = {
+                'transactions' : counters[REGISTER_TRANSACTIONS],
+                'bytes_read' : counters[REGISTER_BYTES_READ],
+                'bytes_written' : counters[REGISTER_BYTES_WRITTEN],
+                'time_us' : counters[REGISTER_TIME_US],
+                'max_us' : counters[REGISTER_MAX_US],
+            }
+            transactions += counters[REGISTER_TRANSACTIONS]
+            read += counters[REGISTER_BYTES_READ]
+            written += counters[REGISTER_BYTES_WRITTEN]
+            time_us += counters[REGISTER_TIME_US]
+
+        return {
+            'transactions' : transactions,
+            'bytes_read' : read,
+            'bytes_written' : written,
+            'time_us' : time_us,
+            'registers' : registers,
+            'histograms' : {kind : list(counts) for (kind, counts) in self.histograms.items()},
+        }
@@ -0,0 +1,173 @@
+# -------------------------------------------------
+# HOST INTERRUPTS
+# -------------------------------------------------
+# Host side of the INT1 / INT2 lines: InterruptFlag records edges from any object with a machine.Pin style irq(),
+# EventPin is a Linux stand-in for machine.Pin backed by an eventfd (or a pipe) that can be raised by a GPIO
+# edge watcher, by the simulator or by a test.
+
+try:
+    from machine import Pin    # type: ignore
+except ImportError:
+    Pin = None
+
+try:
+    from time import sleep_ms   # type: ignore
+except ImportError:
+    from time import sleep
+    def sleep_ms(ms : int) -> None:
+        sleep(ms / 1000)
+
+from ticks import ticks_us, ticks_diff
+
+
+class InterruptFlag(object):
+    """
+    Counts interrupt edges on "pin". The handler only increments a small int, so it is safe to run as a hard IRQ.
+    """
+    def __init__(self, pin, active_high : bool = True) -> None:
+        self.pin = pin
+        self.pending : int = 0
+        self.trigger = getattr(pin, 'IRQ_RISING' if active_high else 'IRQ_FALLING', None)
+        self.SetHandler(self.Handler)
+
+        return None
+
+
+    def SetHandler(self, handler) -> None:
+        """
+        (Re)registers "handler" as the pin IRQ with the same edge trigger as the flag's own handler.
+        """
+        if(self.trigger is None):
+            self.pin.irq(handler=handler)
+        else:
+            self.pin.irq(handler=handler, trigger=self.trigger)
+
+        return None
+
+
+    def Handler(self, pin) -> None:
+        self.pending += 1
+        return None
+
+
+    def Ready(self) -> bool:
+        return (self.pending > 0)
+
+
+    def Clear(self) -> int:
+        """
+        Returns the number of edges seen since the last call and resets the count.
+        """
+        pending : int = self.pending
+        self.pending = 0
+        return pending
+
+
+    def Wait(self, timeout_ms : int = None) -> bool:
+        """
+        Sleeps until an edge is pending (or "timeout_ms" elapsed). Returns True when an edge is pending.
+        Pins with a Wait method of their own (EventPin) block on it instead of polling.
+        """
+        if(self.pending):
+            return True
+
+        start : int = ticks_us()
+        while(not self.pending):
+            remaining = None
+            if(timeout_ms is not None):
+                remaining = timeout_ms - (ticks_diff(ticks_us(), start) // 1000)
+                if(remaining <= 0):
+                    return False
+            if(hasattr(self.pin, 'Wait')):
+                self.pin.Wait(remaining)
+            else:
+                sleep_ms(1)
+
+        return True
+
+
+class EventPin(object):
+    """
+    machine.Pin stand-in for Linux hosts. Fire() signals an edge: the registered irq handler runs and the eventfd / pipe
+    becomes readable, so the pin can be used with select / poll through fileno(). With "gpio_path" (a sysfs GPIO value file
+    whose edge is configured) a watcher thread fires the pin on every hardware edge.
+    """
+    IRQ_RISING = 1
+    IRQ_FALLING = 2
+
+    def __init__(self, gpio_path : str = None) -> None:
+        import os
+        self.os = os
+        self.handler = None
+        self.trigger : int = EventPin.IRQ_RISING
+        self.level : int = 0
+
+        if(hasattr(os, 'eventfd')):
+            self.read_fd = self.write_fd = os.eventfd(0, os.EFD_NONBLOCK)
+        else:
+            (self.read_fd, self.write_fd) = os.pipe()
+            os.set_blocking(self.read_fd, False)
+
+        if(gpio_path is not None):
+            import _thread
+            _thread.start_new_thread(self.WatchGPIO, (gpio_path,))
+
+        return None
+
+
+    def irq(self, handler = None, trigger : int = IRQ_RISING) -> None:
+        self.handler = handler
+        self.trigger = trigger
+        return None
+
+
+    def value(self) -> int:
+        return self.level
+
+
+    def fileno(self) -> int:
+        return self.read_fd
+
+
+    def Fire(self) -> None:
+        self.level = 1
+        if(self.handler is not None):
+            self.handler(self)
+        self.os.write(self.write_fd, (1).to_bytes(8, 'little'))
+        self.level = 0
+
+        return None
+
+
+    def Wait(self, timeout_ms : int = None) -> bool:
+        """
+        Blocks until the pin has fired (or "timeout_ms" elapsed) and consumes the pending events. Returns True when it fired.
+        """
+        import select
+        (readable, _, _) = select.select([self.read_fd], [], [], (None if (timeout_ms is None) else (timeout_ms / 1000)))
+        if(not readable):
+            return False
+
+        try:
+            self.os.read(self.read_fd, 8)
+        except BlockingIOError:
+            pass
+
+        return True
+
+
+    def WatchGPIO(self, gpio_path : str) -> None:
+        """
+        Fires on the edge selected by irq(): the value reads 1 after a rising edge (active-high INT), 0 after a falling one (active-low INT).
+        """
+        import select
+        with open(gpio_path, 'rb') as gpio:
+            poller = select.poll()
+            poller.register(gpio, select.POLLPRI | select.POLLERR)
+            gpio.read()
+            while(True):
+                poller.poll()
+                gpio.seek(0)
+                active : bytes = b'0' if (self.trigger == EventPin.IRQ_FALLING) else b'1'
+                if(gpio.read(1) == active):
+                    self.Fire()
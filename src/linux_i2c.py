@@ -0,0 +1,180 @@
+# -------------------------------------------------
+# LINUX USERSPACE I2C
+# -------------------------------------------------
+# machine.I2C compatible transport (readfrom_mem / readfrom_mem_into / writeto_mem) over /dev/i2c-N, so the driver runs
+# unchanged on Linux gateways. With adapters supporting plain I2C every register access is a single I2C_RDWR ioctl
+# (register write + repeated start + read), and writeto_mem_blocks sends several register writes in one ioctl.
+# Adapters limited to SMBus fall back to I2C_SMBUS i2c-block transfers of at most 32 bytes; longer transfers are split,
+# except INIT_DATA writes, which the caller must split itself (every burst needs its own INIT_ADDR, see max_write).
+#
+#   bus = LinuxI2C(1)
+#   sensor = BMI270(serial_device=bus)
+#
+# "fd" and "ioctl" can be injected (see simulator.FakeI2CDev) to run without the kernel driver.
+
+import os
+from array import array
+from struct import pack
+from register_definitions import FIFO_DATA, INIT_DATA
+
+try:
+    from fcntl import ioctl as _ioctl
+except ImportError:
+    _ioctl = None
+
+
+# linux/i2c-dev.h, linux/i2c.h
+I2C_SLAVE                   = 0x0703
+I2C_FUNCS                   = 0x0705
+I2C_RDWR                    = 0x0707
+I2C_SMBUS                   = 0x0720
+I2C_M_RD                    = 0x0001
+I2C_FUNC_I2C                = 0x00000001
+I2C_SMBUS_READ              = 1
+I2C_SMBUS_WRITE             = 0
+I2C_SMBUS_I2C_BLOCK_DATA    = 8
+I2C_SMBUS_BLOCK_MAX         = 32
+I2C_RDWR_MAX_MSGS           = 42
+
+I2C_MSG_FORMAT              = 'HHHP'    # addr, flags, len, buf (native alignment pads before buf)
+I2C_RDWR_FORMAT             = 'PI'      # msgs, nmsgs
+I2C_SMBUS_FORMAT            = 'BBIP'    # read_write, command, size, data
+
+# Data ports that do not auto-increment: chunked SMBus transfers keep addressing the same register
+STREAM_REGISTERS            = (FIFO_DATA,)
+# Data ports whose burst must not be split: a second chunk would neither continue the port nor belong at the next address
+SINGLE_BURST_REGISTERS      = (INIT_DATA,)
+
+
+class LinuxI2C(object):
+    """
+    "combined" selects I2C_RDWR (True) or SMBus (False) transfers; by default it follows the adapter's I2C_FUNCS.
+    "max_write" is the largest write that goes out as one transaction (None when unlimited), BMI270.ConfigurationSteps
+    caps its INIT_DATA bursts to it since every burst needs its own INIT_ADDR.
+    """
+    def __init__(self, bus : int = 1, fd : int = None, ioctl = None, combined : bool = None) -> None:
+        self.owns_fd : bool = (fd is None)
+        if(fd is None):
+            fd = os.open('/dev/i2c-{}'.format(bus), os.O_RDWR)
+        self.fd : int = fd
+        self.ioctl = ioctl if (ioctl is not None) else _ioctl
+        self.slave : int = None
+
+        if(combined is None):
+            combined = bool(self.Functionality() & I2C_FUNC_I2C)
+        self.combined : bool = combined
+        self.max_write : int = None if combined else I2C_SMBUS_BLOCK_MAX
+
+        self.smbus_data = array('B', [0] * (I2C_SMBUS_BLOCK_MAX + 2))
+
+        return None
+
+
+    def close(self) -> None:
+        if(self.owns_fd and (self.fd is not None)):
+            os.close(self.fd)
+        self.fd = None
+
+        return None
+
+
+    def Functionality(self) -> int:
+        funcs = array('L', [0])
+        try:
+            self.ioctl(self.fd, I2C_FUNCS, funcs, True)
+        except OSError:
+            return 0
+
+        return funcs[0]
+
+
+    def Transfer(self, messages : list) -> None:
+        """
+        Sends (address, flags, buffer) messages as one combined transaction; "buffer" must be an array('B') (read into in place for I2C_M_RD).
+        """
+        for first in range(0, len(messages), I2C_RDWR_MAX_MSGS):
+            block : list = messages[first:(first + I2C_RDWR_MAX_MSGS)]
+            packed = array('B', b''.join(pack(I2C_MSG_FORMAT, address, flags, len(buffer), buffer.buffer_info()[0]) for (address, flags, buffer) in block))
+            self.ioctl(self.fd, I2C_RDWR, pack(I2C_RDWR_FORMAT, packed.buffer_info()[0], len(block)))
+
+        return None
+
+
+    def SetSlave(self, address : int) -> None:
+        if(self.slave != address):
+            self.ioctl(self.fd, I2C_SLAVE, address)
+            self.slave = address
+
+        return None
+
+
+    def SMBusBlock(self, address : int, read_write : int, register : int, length : int) -> None:
+        self.SetSlave(address)
+        self.smbus_data[0] = length
+        self.ioctl(self.fd, I2C_SMBUS, pack(I2C_SMBUS_FORMAT, read_write, register, I2C_SMBUS_I2C_BLOCK_DATA, self.smbus_data.buffer_info()[0]))
+
+        return None
+
+
+    def readfrom_mem_into(self, addr : int, memaddr : int, buf, addrsize : int = 8) -> None:
+        length : int = len(buf)
+
+        if(self.combined):
+            received = array('B', bytes(length))
+            self.Transfer([(addr, 0, array('B', (memaddr,))), (addr, I2C_M_RD, received)])
+            buf[:] = received
+            return None
+
+        data = self.smbus_data
+        for offset in range(0, length, I2C_SMBUS_BLOCK_MAX):
+            count : int = min(I2C_SMBUS_BLOCK_MAX, length - offset)
+            register : int = memaddr if (memaddr in STREAM_REGISTERS) else (memaddr + offset)
+            self.SMBusBlock(addr, I2C_SMBUS_READ, register, count)
+            buf[offset:(offset + count)] = data[1:(count + 1)]
+
+        return None
+
+
+    def readfrom_mem(self, addr : int, memaddr : int, nbytes : int, addrsize : int = 8) -> bytes:
+        buf : bytearray = bytearray(nbytes)
+        self.readfrom_mem_into(addr, memaddr, buf)
+        return bytes(buf)
+
+
+    def writeto_mem(self, addr : int, memaddr : int, buf, addrsize : int = 8) -> None:
+        if(self.combined):
+            message = array('B', (memaddr,))
+            message.frombytes(bytes(buf))
+            self.Transfer([(addr, 0, message)])
+            return None
+
+        data = self.smbus_data
+        payload : bytes = bytes(buf)
+        if((memaddr in SINGLE_BURST_REGISTERS) and (len(payload) > I2C_SMBUS_BLOCK_MAX)):
+            raise ValueError("SMBus write to 0x{:02X} exceeds {} bytes: {}".format(memaddr, I2C_SMBUS_BLOCK_MAX, len(payload)))
+        for offset in range(0, len(payload), I2C_SMBUS_BLOCK_MAX):
+            chunk : bytes = payload[offset:(offset + I2C_SMBUS_BLOCK_MAX)]
+            register : int = memaddr if (memaddr in STREAM_REGISTERS) else (memaddr + offset)
+            data[1:(len(chunk) + 1)] = array('B', chunk)
+            self.SMBusBlock(addr, I2C_SMBUS_WRITE, register, len(chunk))
+
+        return None
+
+
+    def writeto_mem_blocks(self, addr : int, blocks : list) -> None:
+        """
+        Writes several (register, data) blocks; with I2C_RDWR they go out as one combined transaction (repeated starts).
+        """
+        if(not self.combined):
+            for (memaddr, buf) in blocks:
+                self.writeto_mem(addr, memaddr, buf)
+            return None
+
+        messages : list = []
+        for (memaddr, buf) in blocks:
+            message = array('B', (memaddr,))
+            message.frombytes(bytes(buf))
+            messages.append((addr, 0, message))
+        self.Transfer(messages)
+
+        return None
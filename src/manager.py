@@ -0,0 +1,255 @@
+# -------------------------------------------------
+# MULTI-DEVICE MANAGER
+# -------------------------------------------------
+# Drives several BMI270s spread over one or more buses (up to two per bus: I2C_PRIM_ADDR / I2C_SEC_ADDR).
+# Configuration uploads are interleaved between the sensors of a bus (the waits of one sensor are spent on the bursts of the
+# others) and run in parallel across buses, one thread per bus when threads are available.
+# Reads run concurrently across buses: the calling thread reads the first bus and one persistent reader thread per other bus
+# reads the rest, so a set is as spread as its busiest bus instead of all sensors together. Without threads (or with
+# parallel=False) the sensors are read on the calling thread in a schedule that alternates between buses. Every sample
+# carries its read offset so the skew of a set is known (see Skew).
+#
+#   manager = SensorManager()
+#   manager.Add(bus_0, I2C_PRIM_ADDR)
+#   manager.Add(bus_0, I2C_SEC_ADDR)
+#   manager.Add(bus_1, I2C_PRIM_ADDR)
+#   manager.Initialise()
+#   samples = manager.ReadAll()
+
+from array import array
+from BMI270 import BMI270
+from register_definitions import *
+from ticks import ticks_us, ticks_diff, ticks_add
+from time import sleep
+
+try:
+    import _thread
+except ImportError:
+    _thread = None
+
+
+class SensorManager(object):
+    def __init__(self) -> None:
+        self.sensors : list = []
+        self.buses : list = []          # [serial_device, [sensor index, ...]] in order of first use
+        self.schedule : list = []       # sensor indices in read order
+        self.acc_data : list = []       # one preallocated array('f') per sensor, updated in place by ReadAll
+        self.gyro_data : list = []
+        self.readers : list = None      # [go lock, done lock] per reader thread (buses 1 ..), see StartReaders
+        self.read_set : list = None     # [samples, start] of the set being read by the reader threads
+        self.read_errors : list = []
+
+        return None
+
+
+    def Add(self, serial_device, address : int = I2C_PRIM_ADDR, shadow : bool = False) -> BMI270:
+        """
+        Registers the sensor at "address" on "serial_device" (created with initialise=False, see Initialise).
+        Returns the BMI270 so that it can be configured individually.
+        """
+        for sensor in self.sensors:
+            if((sensor.serial_device is serial_device) and (sensor.address == address)):
+                raise ValueError("Sensor 0x{:02X} is already registered on this bus".format(address))
+
+        self.StopReaders()      # the bus layout changes, ReadAll starts them again
+        sensor : BMI270 = BMI270(serial_device, shadow=shadow, initialise=False, address=address)
+        index : int = len(self.sensors)
+        self.sensors.append(sensor)
+        self.acc_data.append(array('f', (0, 0, 0)))
+        self.gyro_data.append(array('f', (0, 0, 0)))
+
+        for bus in self.buses:
+            if(bus[0] is serial_device):
+                bus[1].append(index)
+                break
+        else:
+            self.buses.append([serial_device, [index]])
+
+        self.schedule = self.Schedule()
+
+        return sensor
+
+
+    def Schedule(self) -> list:
+        """
+        Sequential read order (ReadAll without reader threads): round robin over the buses, so that consecutive reads go to
+        different buses whenever possible and each bus's reads are spread evenly over the set.
+        """
+        schedule : list = []
+        depth : int = max([len(bus[1]) for bus in self.buses] + [0])
+        for slot in range(depth):
+            for bus in self.buses:
+                if(slot < len(bus[1])):
+                    schedule.append(bus[1][slot])
+
+        return schedule
+
+
+    def Initialise(self, burst_size : int = CONFIG_BURST_SIZE, parallel : bool = True) -> float:
+        """
+        Uploads the configuration to every sensor and applies the default settings. Buses are handled in parallel when
+        threads are available and "parallel" is set. Returns the total time in seconds.
+        """
+        start : int = ticks_us()
+
+        if(parallel and (_thread is not None) and (len(self.buses) > 1)):
+            lock = _thread.allocate_lock()
+            pending : list = [len(self.buses)]
+            errors : list = []
+
+            def Worker(indices : list) -> None:
+                try:
+                    self.UploadBus(indices, burst_size)
+                except Exception as error:
+                    errors.append(error)
+                finally:
+                    with lock:
+                        pending[0] -= 1
+
+            for bus in self.buses:
+                _thread.start_new_thread(Worker, (bus[1],))
+            while(pending[0]):
+                sleep(0.001)
+            if(errors):
+                raise errors[0]
+        else:
+            for bus in self.buses:
+                self.UploadBus(bus[1], burst_size)
+
+        for sensor in self.sensors:
+            sensor.Initialise()
+
+        return (ticks_diff(ticks_us(), start) / 1000000)
+
+
+    def UploadBus(self, indices : list, burst_size : int = CONFIG_BURST_SIZE) -> None:
+        """
+        Runs the BMI270.ConfigurationSteps of the sensors "indices" (sharing one bus) interleaved: each step goes to the sensor whose
+        last wait has expired first, and the host only sleeps when every sensor is waiting.
+        """
+        pending : list = [[self.sensors[index].ConfigurationSteps(burst_size), ticks_us()] for index in indices]
+
+        while(pending):
+            now : int = ticks_us()
+            step = min(pending, key=lambda entry: ticks_diff(entry[1], now))
+            delay : int = ticks_diff(step[1], now)
+            if(delay > 0):
+                sleep(delay / 1000000)
+            try:
+                wait : float = next(step[0])
+            except StopIteration:
+                pending.remove(step)
+                continue
+            step[1] = ticks_add(ticks_us(), int(wait * 1000000))
+
+        return None
+
+
+    def StartReaders(self) -> None:
+        """
+        Starts one reader thread for every bus but the first (read by the caller of ReadAll). No-op when they are running,
+        when threads are not available or with a single bus.
+        """
+        if((self.readers is not None) or (_thread is None) or (len(self.buses) < 2)):
+            return None
+
+        self.readers = []
+        for bus in self.buses[1:]:
+            go = _thread.allocate_lock()
+            done = _thread.allocate_lock()
+            go.acquire()
+            done.acquire()
+            self.readers.append((go, done))
+            _thread.start_new_thread(self.Reader, (bus[1], go, done))
+
+        return None
+
+
+    def StopReaders(self) -> None:
+        readers : list = self.readers
+        if(readers is None):
+            return None
+
+        self.readers = None
+        for (go, done) in readers:
+            go.release()        # wakes the reader, which sees readers is None and exits
+            done.acquire()
+
+        return None
+
+
+    def Reader(self, indices : list, go, done) -> None:
+        """
+        Reader thread body: reads the sensors "indices" (one bus) into the current set each time "go" is released.
+        """
+        while(True):
+            go.acquire()
+            if(self.readers is None):
+                done.release()
+                return None
+            try:
+                self.ReadBus(indices, self.read_set[0], self.read_set[1])
+            except Exception as error:
+                self.read_errors.append(error)
+            done.release()
+
+
+    def ReadBus(self, indices : list, samples : list, start : int) -> None:
+        for index in indices:
+            offset : int = ticks_diff(ticks_us(), start)
+            sensor_time : int = self.sensors[index].ReadAllDataInto(self.acc_data[index], self.gyro_data[index])
+            samples[index] = (self.acc_data[index], self.gyro_data[index], sensor_time, offset)
+
+        return None
+
+
+    def ReadAll(self, parallel : bool = True) -> list:
+        """
+        Reads every sensor once (single-burst accelerometer + gyroscope + sensortime). With "parallel" (and threads, and more
+        than one bus) the buses are read concurrently by the caller and the reader threads (see StartReaders), otherwise
+        sequentially in schedule order.
+        Returns one (acc, gyr, sensor_time, offset_us) entry per sensor, in the order they were added: "acc" / "gyr" are the
+        preallocated per-sensor buffers, "offset_us" is when that sensor was read relative to the start of the set.
+        """
+        samples : list = [None] * len(self.sensors)
+
+        if(parallel):
+            self.StartReaders()
+        if((not parallel) or (self.readers is None)):
+            start : int = ticks_us()
+            for index in self.schedule:
+                self.ReadBus((index,), samples, start)
+            return samples
+
+        self.read_set = [samples, ticks_us()]
+        for (go, _) in self.readers:
+            go.release()
+        try:
+            self.ReadBus(self.buses[0][1], samples, self.read_set[1])
+        finally:
+            for (_, done) in self.readers:
+                done.acquire()
+        if(self.read_errors):
+            error = self.read_errors[0]
+            self.read_errors = []
+            raise error
+
+        return samples
+
+
+    def Skew(self, samples : list) -> int:
+        """
+        Spread in microseconds between the first and last read of a set returned by ReadAll.
+        """
+        offsets : list = [sample[3] for sample in samples]
+        return (max(offsets) - min(offsets)) if offsets else 0
+
+
+    def Configure(self, **fields) -> None:
+        """
+        Applies the same BMI270.Configure fields to every sensor.
+        """
+        for sensor in self.sensors:
+            sensor.Configure(**fields)
+
+        return None
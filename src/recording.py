@@ -0,0 +1,304 @@
+# -------------------------------------------------
+# RAW RECORDINGS
+# -------------------------------------------------
+# Compact capture of raw sensor output for offline reprocessing.
+#
+# File layout (little endian):
+#   file header   : magic b'BMI270RC', version, header size, record size, records per block              (16 bytes)
+#   blocks        : fixed-size, each a block header followed by "block_records" record slots
+#     block header: b'BLK0', record count, reserved, block number, first sensortime,
+#                   acc_range (m/s^2), gyr_range (deg/s), acc_odr (Hz), gyr_odr (Hz)                       (32 bytes)
+#     record      : acc_x, acc_y, acc_z, gyr_x, gyr_y, gyr_z (int16), sensortime (uint32)                  (16 bytes)
+#
+# Blocks have a fixed size so block n starts at a computed offset; their headers double as the periodic index (first sensortime
+# and count) and carry the range / ODR metadata, a settings change closes the current block early.
+#
+#   writer = RecordWriter(open('log.bin', 'wb'), sensor)
+#   sensor_time = sensor.ReadRawInto(raw)
+#   writer.Append(raw, sensor_time)
+#   ...
+#   reader = RecordReader('log.bin')
+#   Replay(reader, Fusion())
+
+from struct import pack_into, unpack_from, calcsize
+from convert import AccelerometerScale, GyroscopeScale, ConvertBatch
+from register_definitions import SENSORTIME_MASK, SENSORTIME_RESOLUTION
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+
+RECORD_MAGIC            = b'BMI270RC'
+RECORD_VERSION          = 1
+FILE_HEADER_FORMAT      = '<8sHHHH'
+BLOCK_HEADER_FORMAT     = '<4sHHIIffff'
+RECORD_FORMAT           = '<6hI'
+BLOCK_TAG               = b'BLK0'
+FILE_HEADER_SIZE        = calcsize(FILE_HEADER_FORMAT)
+BLOCK_HEADER_SIZE       = calcsize(BLOCK_HEADER_FORMAT)
+RECORD_SIZE             = calcsize(RECORD_FORMAT)
+DEFAULT_BLOCK_RECORDS   = 1024
+
+
+class RecordWriter(object):
+    """
+    Appends records to "stream" (a file opened 'wb'). One block is assembled in a preallocated buffer and written when full,
+    so Append does not allocate. Settings default to those of "sensor" (a BMI270) when given.
+    """
+    def __init__(self, stream, sensor = None, block_records : int = DEFAULT_BLOCK_RECORDS) -> None:
+        self.stream = stream
+        self.block_records : int = block_records
+        self.block_size : int = BLOCK_HEADER_SIZE + (block_records * RECORD_SIZE)
+        self.block : bytearray = bytearray(self.block_size)
+        self.count : int = 0
+        self.blocks : int = 0
+        self.records : int = 0
+        self.first_time : int = 0
+        self.settings : tuple = (0.0, 0.0, 0.0, 0.0)
+
+        if(sensor is not None):
+            self.UpdateSettings(sensor)
+
+        header : bytearray = bytearray(FILE_HEADER_SIZE)
+        pack_into(FILE_HEADER_FORMAT, header, 0, RECORD_MAGIC, RECORD_VERSION, FILE_HEADER_SIZE, RECORD_SIZE, block_records)
+        self.stream.write(header)
+
+        return None
+
+
+    def UpdateSettings(self, sensor) -> None:
+        self.SetSettings(sensor.acc_range, sensor.gyr_range, sensor.acc_odr, sensor.gyr_odr)
+        return None
+
+
+    def SetSettings(self, acc_range : float, gyr_range : float, acc_odr : float, gyr_odr : float) -> None:
+        """
+        Records new ranges / ODRs; samples already in the current block keep the old ones (the block is closed early).
+        """
+        settings : tuple = (acc_range, gyr_range, acc_odr, gyr_odr)
+        if(settings == self.settings):
+            return None
+
+        self.Flush()
+        self.settings = settings
+
+        return None
+
+
+    def Append(self, raw, sensor_time : int) -> None:
+        """
+        Appends one sample: "raw" holds the six signed raw axes (e.g. the buffer filled by BMI270.ReadRawInto).
+        """
+        if(self.count == 0):
+            self.first_time = sensor_time
+
+        pack_into(RECORD_FORMAT, self.block, BLOCK_HEADER_SIZE + (self.count * RECORD_SIZE), raw[0], raw[1], raw[2], raw[3], raw[4], raw[5], sensor_time)
+        self.count += 1
+        self.records += 1
+
+        if(self.count == self.block_records):
+            self.Flush()
+
+        return None
+
+
+    def Flush(self) -> None:
+        """
+        Writes the current block (padded to the fixed block size when partially filled).
+        """
+        if(self.count == 0):
+            return None
+
+        (acc_range, gyr_range, acc_odr, gyr_odr) = self.settings
+        pack_into(BLOCK_HEADER_FORMAT, self.block, 0, BLOCK_TAG, self.count, 0, self.blocks, self.first_time, acc_range, gyr_range, acc_odr, gyr_odr)
+        end : int = BLOCK_HEADER_SIZE + (self.count * RECORD_SIZE)
+        if(end < self.block_size):
+            self.block[end:] = bytes(self.block_size - end)
+
+        self.stream.write(self.block)
+        self.blocks += 1
+        self.count = 0
+
+        return None
+
+
+    def Close(self) -> None:
+        self.Flush()
+        self.stream.close()
+
+        return None
+
+
+class RecordReader(object):
+    """
+    Reads a recording through mmap (CPython) or from memory (MicroPython). "blocks" lists one
+    (offset, count, first_time, acc_range, gyr_range, acc_odr, gyr_odr) entry per complete block, "offset" being that of its first record.
+    """
+    def __init__(self, path : str) -> None:
+        self.file = open(path, 'rb')
+        self.map = None
+        if(mmap is not None):
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.data = memoryview(self.map)
+        else:
+            self.data = memoryview(self.file.read())
+
+        (magic, version, header_size, record_size, block_records) = unpack_from(FILE_HEADER_FORMAT, self.data, 0)
+        if((magic != RECORD_MAGIC) or (version != RECORD_VERSION) or (record_size != RECORD_SIZE)):
+            raise ValueError("Not a BMI270 recording (or an unsupported version)")
+
+        self.block_records : int = block_records
+        self.block_size : int = BLOCK_HEADER_SIZE + (block_records * RECORD_SIZE)
+        self.blocks : list = []
+        offset : int = header_size
+        while((offset + self.block_size) <= len(self.data)):
+            (tag, count, _, _, first_time, acc_range, gyr_range, acc_odr, gyr_odr) = unpack_from(BLOCK_HEADER_FORMAT, self.data, offset)
+            if(tag != BLOCK_TAG):
+                break
+            self.blocks.append((offset + BLOCK_HEADER_SIZE, count, first_time, acc_range, gyr_range, acc_odr, gyr_odr))
+            offset += self.block_size
+
+        return None
+
+
+    def __len__(self) -> int:
+        return sum(block[1] for block in self.blocks)
+
+
+    def close(self) -> None:
+        """
+        Arrays returned by Arrays() view the mapping and must be dropped first.
+        """
+        if(self.map is not None):
+            self.data.release()
+            self.map.close()
+        self.file.close()
+
+        return None
+
+
+    def Records(self, index : int) -> memoryview:
+        """
+        The raw records of block "index" (a view into the file, no copy).
+        """
+        (offset, count) = self.blocks[index][:2]
+        return self.data[offset:(offset + (count * RECORD_SIZE))]
+
+
+    def Arrays(self, index : int) -> tuple:
+        """
+        Returns (raw, times) for block "index": with NumPy an (N, 6) int16 array and an (N,) uint32 array viewing the file,
+        without NumPy a list of 6-tuples and a list of sensortimes.
+        """
+        records : memoryview = self.Records(index)
+
+        if(np is not None):
+            table = np.frombuffer(records, dtype=np.dtype([('raw', '<i2', (6,)), ('time', '<u4')]))
+            return (table['raw'], table['time'])
+
+        raw : list = []
+        times : list = []
+        for offset in range(0, len(records), RECORD_SIZE):
+            values : tuple = unpack_from(RECORD_FORMAT, records, offset)
+            raw.append(values[:6])
+            times.append(values[6])
+
+        return (raw, times)
+
+
+    def Samples(self):
+        """
+        Generator over every sample as (raw 6-tuple, sensortime).
+        """
+        for index in range(len(self.blocks)):
+            records : memoryview = self.Records(index)
+            for offset in range(0, len(records), RECORD_SIZE):
+                values : tuple = unpack_from(RECORD_FORMAT, records, offset)
+                yield (values[:6], values[6])
+
+
+    def Find(self, sensor_time : int) -> int:
+        """
+        Index of the last block starting at or before "sensor_time" (sensortime wraparound is not taken into account).
+        """
+        (low, high) = (0, len(self.blocks))
+        while((high - low) > 1):
+            middle : int = (low + high) // 2
+            if(self.blocks[middle][2] <= sensor_time):
+                low = middle
+            else:
+                high = middle
+
+        return low
+
+
+def TimeSteps(times, previous : int = None, default_dt : float = 0.01) -> list:
+    """
+    Per-sample dt in seconds from consecutive sensortimes (24-bit wraparound handled), "previous" being the sensortime before the first one.
+    """
+    if(np is not None):
+        values = np.asarray(times, dtype=np.int64)
+        steps = np.diff(values, prepend=(values[0] if (previous is None) else previous)) & SENSORTIME_MASK
+        dts = steps * SENSORTIME_RESOLUTION
+        if(previous is None):
+            dts[0] = default_dt
+        return dts.tolist()
+
+    dts : list = []
+    for sensor_time in times:
+        dts.append(default_dt if (previous is None) else (((sensor_time - previous) & SENSORTIME_MASK) * SENSORTIME_RESOLUTION))
+        previous = sensor_time
+
+    return dts
+
+
+def Replay(reader : RecordReader, fusion, first_block : int = 0, last_block : int = None) -> tuple:
+    """
+    Runs "fusion" (filter.Fusion) over the recorded blocks as fast as possible, one Fusion.update_batch call per block with the
+    recorded ranges and sensortime steps. Returns (samples processed, last scaled accelerometer, last scaled gyroscope, last sensortime).
+    """
+    blocks : list = reader.blocks[first_block:last_block]
+    previous = None
+    samples : int = 0
+    (acc_last, gyr_last) = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+
+    for (index, block) in enumerate(blocks):
+        (_, count, _, acc_range, gyr_range, acc_odr, gyr_odr) = block
+        if(count == 0):
+            continue
+
+        (raw, times) = reader.Arrays(first_block + index)
+        (acc, gyr) = ConvertBatch(raw, AccelerometerScale(acc_range), GyroscopeScale(gyr_range))
+        if(np is not None):
+            (acc, gyr) = (acc.tolist(), gyr.tolist())
+
+        dts : list = TimeSteps(times, previous, (1 / gyr_odr) if gyr_odr else 0.01)
+        fusion.update_batch(acc, gyr, dts)
+
+        previous = int(times[-1])
+        samples += count
+        (acc_last, gyr_last) = (acc[-1], gyr[-1])
+
+    return (samples, tuple(acc_last), tuple(gyr_last), previous)
+
+
+def ReplayIMU(reader : RecordReader, imu, first_block : int = 0, last_block : int = None) -> int:
+    """
+    Replays a recording through an IMU's filter, leaving acc_data / gyro_data / sensor_time at the last recorded sample.
+    Returns the number of samples processed.
+    """
+    (samples, acc, gyr, sensor_time) = Replay(reader, imu.filter, first_block, last_block)
+    if(samples):
+        for axis in range(3):
+            imu.acc_data[axis] = acc[axis]
+            imu.gyro_data[axis] = gyr[axis]
+        imu.sensor_time = sensor_time
+
+    return samples
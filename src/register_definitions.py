@@ -9,17 +9,50 @@ I2C_SEC_ADDR    = 0x69
 
 # General
 CHIP_ID_ADDRESS = 0x00
+STATUS          = 0x03
+AUX_DATA_0      = 0x04
 SENSORTIME_0    = 0x18
 SENSORTIME_1    = 0x19
 SENSORTIME_2    = 0x1A
+INT_STATUS_0    = 0x1C
+INT_STATUS_1    = 0x1D
 INTERNAL_STATUS = 0x21
 DATA_REG        = 0x0C
+FIFO_LENGTH_0   = 0x24
+FIFO_LENGTH_1   = 0x25
+FIFO_DATA       = 0x26
+FEAT_PAGE       = 0x2F
+FEATURES_0      = 0x30
+AUX_CONF        = 0x44
+FIFO_DOWNS      = 0x45
+FIFO_WTM_0      = 0x46
+FIFO_WTM_1      = 0x47
 FIFO_CONFIG_0   = 0x48
 FIFO_CONFIG_1   = 0x49
+AUX_DEV_ID      = 0x4B
+AUX_IF_CONF     = 0x4C
+AUX_RD_ADDR     = 0x4D
+AUX_WR_ADDR     = 0x4E
+AUX_WR_DATA     = 0x4F
+INT1_IO_CTRL    = 0x53
+INT2_IO_CTRL    = 0x54
+INT_LATCH       = 0x55
+INT1_MAP_FEAT   = 0x56
+INT2_MAP_FEAT   = 0x57
+INT_MAP_DATA    = 0x58
 INIT_CTRL       = 0x59
 INIT_ADDR_0     = 0x5B
 INIT_ADDR_1     = 0x5C
 INIT_DATA       = 0x5E
+IF_CONF         = 0x6B
+NV_CONF         = 0x70
+OFFSET_0        = 0x71
+OFFSET_1        = 0x72
+OFFSET_2        = 0x73
+OFFSET_3        = 0x74
+OFFSET_4        = 0x75
+OFFSET_5        = 0x76
+OFFSET_6        = 0x77
 CMD             = 0x7E
 PWR_CONF        = 0x7C
 PWR_CTRL        = 0x7D
@@ -62,6 +95,8 @@ GRAVITY         = 9.81288
 DEG2RAD         = 3.141592653589793 / 180.0
 HERTZ_100       = 0.01
 HERTZ_200       = 0.005
+DATA_BURST_LENGTH = 15      # ACC_X_7_0 (0x0C) .. SENSORTIME_2 (0x1A)
+AUX_BURST_LENGTH = 23       # AUX_DATA_0 (0x04) .. SENSORTIME_2 (0x1A)
 BINARY          = 'bin'
 HEXADECIMAL     = 'hex'
 BIT_0           = 0b00000001
@@ -83,6 +118,112 @@ FIRST_3_BITS    = 0x07      # 00000111
 FIRST_2_BITS    = 0x04      # 00000011
 
 
+# Identification / status
+CHIP_ID                 = 0x24
+INTERNAL_STATUS_MASK    = 0x0F
+INTERNAL_STATUS_INIT_OK = 0x01
+INTERNAL_STATUS_INIT_ERR = 0x02
+CONFIG_FILE_SIZE        = 8192      # bytes
+CONFIG_BURST_SIZE       = 256       # bytes per INIT_DATA burst, must be even (INIT_ADDR is a word address)
+SENSORTIME_RESOLUTION   = 0.0000390625  # seconds per SENSORTIME LSB
+SENSORTIME_MASK         = 0xFFFFFF
+
+# Configuration registers mirrored by the optional shadow cache, as (first register, count) bursts
+SHADOW_BLOCKS           = ((ACC_CONF, 10), (INT1_IO_CTRL, 6), (PWR_CONF, 2))   # ACC_CONF .. FIFO_CONFIG_1, INT1_IO_CTRL .. INT_MAP_DATA, PWR_CONF .. PWR_CTRL
+
+# Interrupts
+INT_PIN_1               = 1
+INT_PIN_2               = 2
+INT_STATUS_FFULL        = BIT_0 << 8    # INT_STATUS_1 bits, as returned in the upper byte of BMI270.ReadInterruptStatus
+INT_STATUS_FWM          = BIT_1 << 8
+INT_STATUS_ERR          = BIT_2 << 8
+INT_STATUS_AUX_DRDY     = BIT_5 << 8
+INT_STATUS_GYR_DRDY     = BIT_6 << 8
+INT_STATUS_ACC_DRDY     = BIT_7 << 8
+
+# Feature engine (INT_STATUS_0 / INT1_MAP_FEAT / INT2_MAP_FEAT share this bit layout)
+INT_STATUS_SIG_MOTION   = BIT_0
+INT_STATUS_STEP_COUNTER = BIT_1     # step detector / step counter watermark
+INT_STATUS_ACTIVITY     = BIT_2
+INT_STATUS_WRIST_WAKEUP = BIT_3
+INT_STATUS_WRIST_GESTURE = BIT_4
+INT_STATUS_NO_MOTION    = BIT_5
+INT_STATUS_ANY_MOTION   = BIT_6
+FEATURE_PAGE_LENGTH     = 16        # FEATURES_0 .. 0x3F, the window onto the page selected by FEAT_PAGE
+FEATURE_PAGES           = 8
+FEATURE_OUTPUT_PAGE     = 0
+FEATURE_OUT_STEP_COUNT  = 0x00      # uint32
+FEATURE_OUT_ACTIVITY    = 0x04
+FEATURE_OUT_WRIST_GESTURE = 0x06
+MOTION_THRESHOLD_RESOLUTION = 1 / 2048     # g per LSB of any_motion_threshold / no_motion_threshold (0 .. 1 g)
+MOTION_DURATION_RESOLUTION  = 0.02         # seconds per LSB of any_motion_duration / no_motion_duration (50 Hz samples)
+STEP_WATERMARK_RESOLUTION   = 20           # steps per LSB of step_counter_watermark
+ACTIVITY_STILL          = 0x00
+ACTIVITY_WALKING        = 0x01
+ACTIVITY_RUNNING        = 0x02
+ACTIVITY_UNKNOWN        = 0x03
+WRIST_GESTURE_UNKNOWN   = 0x00
+WRIST_GESTURE_PUSH_DOWN = 0x01
+WRIST_GESTURE_PIVOT_UP  = 0x02
+WRIST_GESTURE_SHAKE     = 0x03
+WRIST_GESTURE_FLICK_IN  = 0x04
+WRIST_GESTURE_FLICK_OUT = 0x05
+
+# Offset compensation (OFFSET_0 .. OFFSET_2 int8 accelerometer, OFFSET_3 .. OFFSET_6 10-bit two's complement gyroscope)
+OFFSET_LENGTH           = 7         # OFFSET_0 .. OFFSET_6
+ACC_OFFSET_RESOLUTION   = 0.0039    # g per LSB
+GYR_OFFSET_RESOLUTION   = 0.061     # deg/s per LSB (one LSB of the 2000 deg/s range)
+ACC_OFFSET_MIN          = -128
+ACC_OFFSET_MAX          = 127
+GYR_OFFSET_MIN          = -512
+GYR_OFFSET_MAX          = 511
+FOC_SAMPLES             = 128       # samples averaged by the fast offset compensation
+
+# Auxiliary interface
+AUX_DATA_LENGTH         = 8         # AUX_DATA_0 .. AUX_DATA_7
+AUX_BURST_CODES         = {1 : 0, 2 : 1, 6 : 2, 8 : 3}     # bytes per aux read -> aux_rd_burst / aux_man_rd_burst
+STATUS_AUX_BUSY         = BIT_2
+AUX_ODR_25              = 0x06      # same ODR coding as ACC_CONF: 100 * 2 ** (code - 8) Hz
+AUX_ODR_50              = 0x07
+AUX_ODR_100             = 0x08
+
+# Commands
+CMD_FIFO_FLUSH  = 0xB0
+CMD_SOFT_RESET  = 0xB6
+
+# FIFO
+FIFO_SIZE               = 2048      # bytes
+FIFO_CHUNK_SIZE         = 512       # bytes read per FIFO_DATA burst
+FIFO_LENGTH_MASK        = 0x3FFF
+FIFO_HEADER_MASK        = 0xFC      # fh_mode + fh_parm, drops the interrupt tag bits
+FIFO_HEADER_MODE_MASK   = 0xC0
+FIFO_HEADER_REGULAR     = 0x80
+FIFO_HEADER_CONTROL     = 0x40
+FIFO_HEADER_AUX         = 0x10
+FIFO_HEADER_GYR         = 0x08
+FIFO_HEADER_ACC         = 0x04
+FIFO_HEADER_EMPTY       = 0x80      # regular frame without any sensor, returned on over-read
+FIFO_HEADER_SKIP        = 0x40
+FIFO_HEADER_SENSORTIME  = 0x44
+FIFO_HEADER_CONFIG      = 0x48
+FIFO_AUX_LENGTH         = 8
+FIFO_GYR_LENGTH         = 6
+FIFO_ACC_LENGTH         = 6
+FIFO_SKIP_LENGTH        = 1
+FIFO_SENSORTIME_LENGTH  = 3
+FIFO_CONFIG_LENGTH      = 4
+FIFO_OVER_READ          = 0x8000    # first word of a headerless frame read past the end of the FIFO
+FIFO_ACC_DUMMY          = 0x7F01
+FIFO_GYR_DUMMY          = 0x7F02
+FIFO_AUX_DUMMY          = 0x7F03
+FIFO_FRAME_DATA         = 'data'
+FIFO_FRAME_SKIP         = 'skip'
+FIFO_FRAME_SENSORTIME   = 'sensortime'
+FIFO_FRAME_CONFIG       = 'config'
+FIFO_DOWNS_MAX          = 7         # FIFO rate = data rate / 2 ** downs
+ACC_UNFILTERED_RATE     = 1600      # Hz, rate of the pre-filter data selected with acc_fifo_filt_data = 0
+GYR_UNFILTERED_RATE     = 3200      # Hz, same for gyr_fifo_filt_data = 0
+
 # Device Modes
 LOW_POWER_MODE = 'low_power'
 NORMAL_MODE = 'normal'
@@ -113,6 +254,9 @@ ACC_BWP_RES16   = 0x04      # Reserved
 ACC_BWP_RES32   = 0x05      # Reserved
 ACC_BWP_RES64   = 0x06      # Reserved
 ACC_BWP_RES128  = 0x07      # Reserved
+ACC_RANGE_VALUES = {ACC_RANGE_2G : (2 * GRAVITY), ACC_RANGE_4G : (4 * GRAVITY), ACC_RANGE_8G : (8 * GRAVITY), ACC_RANGE_16G : (16 * GRAVITY)}
+ACC_ODR_VALUES  = {ACC_ODR_1600 : 1600, ACC_ODR_800 : 800, ACC_ODR_400 : 400, ACC_ODR_200 : 200, ACC_ODR_100 : 100, ACC_ODR_50 : 50, ACC_ODR_25 : 25,
+                   ACC_ODR_12P5 : 12.5, ACC_ODR_6P25 : 6.25, ACC_ODR_3P1 : 3.125, ACC_ODR_1P5 : 1.5625, ACC_ODR_0P78 : 0.78125}
 
 
 
@@ -133,3 +277,5 @@ GYR_ODR_25      = 0x06      # 25Hz
 GYR_BWP_OSR4    = 0x00      # OSR4
 GYR_BWP_OSR2    = 0x01      # OSR2
 GYR_BWP_NORMAL  = 0x02      # Normal
+GYR_RANGE_VALUES = {GYR_RANGE_2000 : 2000, GYR_RANGE_1000 : 1000, GYR_RANGE_500 : 500, GYR_RANGE_250 : 250, GYR_RANGE_125 : 125}
+GYR_ODR_VALUES  = {GYR_ODR_3200 : 3200, GYR_ODR_1600 : 1600, GYR_ODR_800 : 800, GYR_ODR_400 : 400, GYR_ODR_200 : 200, GYR_ODR_100 : 100, GYR_ODR_50 : 50, GYR_ODR_25 : 25}
@@ -0,0 +1,238 @@
+# -------------------------------------------------
+# SAMPLE RING BUFFER
+# -------------------------------------------------
+# Fixed-size, array-backed store of raw samples shared between one writer (acquisition.AcquisitionThread) and any number of
+# readers, each with its own cursor so that a slow consumer never holds back a fast one. Storage is allocated once;
+# readers get memoryview snapshots of the slots instead of copies.
+#
+# POLICY_OVERWRITE : the writer never waits, samples a reader has not consumed yet are overwritten and counted in its "dropped".
+# POLICY_BLOCK     : the writer waits (up to "timeout_ms") for the slowest reader, samples that still do not fit are counted in "rejected".
+
+from array import array
+from ticks import ticks_us, ticks_diff
+
+try:
+    from _thread import allocate_lock
+except ImportError:
+    allocate_lock = None
+
+try:
+    from time import sleep_ms   # type: ignore
+except ImportError:
+    from time import sleep
+    def sleep_ms(ms : int) -> None:
+        sleep(ms / 1000)
+
+
+POLICY_OVERWRITE = 'overwrite'
+POLICY_BLOCK = 'block'
+
+
+class _NoLock(object):
+    """
+    Stand-in for ports built without threads (the buffer is then only shared with IRQ / asyncio code).
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> bool:
+        return False
+
+
+class RingBuffer(object):
+    """
+    "capacity" samples of "width" values (typecode "typecode") plus one sensortime per sample.
+    Sample n (counted from the start) lives in slot n % capacity; "head" is the number of samples written so far.
+    """
+    def __init__(self, capacity : int = 256, width : int = 6, typecode : str = 'h', policy : str = POLICY_OVERWRITE, timeout_ms : int = None) -> None:
+        if(policy not in (POLICY_OVERWRITE, POLICY_BLOCK)):
+            raise ValueError("Unknown ring buffer policy: {}".format(policy))
+
+        self.capacity : int = capacity
+        self.width : int = width
+        self.policy : str = policy
+        self.timeout_ms = timeout_ms
+
+        self.data = array(typecode, [0] * (capacity * width))
+        self.times = array('L', [0] * capacity)
+        self.data_view = memoryview(self.data)
+        self.times_view = memoryview(self.times)
+
+        self.lock = allocate_lock() if (allocate_lock is not None) else _NoLock()
+        self.readers : list = []
+        self.head : int = 0
+
+        self.written : int = 0
+        self.overwritten : int = 0
+        self.rejected : int = 0
+        self.blocked : int = 0
+
+        return None
+
+
+    def AddReader(self) -> 'RingReader':
+        """
+        Returns a new reader positioned at the current head (it only sees samples written from now on).
+        """
+        with self.lock:
+            reader = RingReader(self, self.head)
+            self.readers.append(reader)
+
+        return reader
+
+
+    def RemoveReader(self, reader : 'RingReader') -> None:
+        with self.lock:
+            if(reader in self.readers):
+                self.readers.remove(reader)
+
+        return None
+
+
+    def Tail(self) -> int:
+        """
+        Position of the slowest reader (the head when there are no readers). Call with the lock held.
+        """
+        tail : int = self.head
+        for reader in self.readers:
+            if(reader.position < tail):
+                tail = reader.position
+
+        return tail
+
+
+    def Full(self) -> bool:
+        return ((self.head - self.Tail()) >= self.capacity)
+
+
+    def Put(self, values, sensor_time : int = 0) -> bool:
+        """
+        Stores one sample ("width" values) and its sensortime. Returns False when the sample was rejected (POLICY_BLOCK timeout).
+        """
+        if((self.policy == POLICY_BLOCK) and (not self.WaitForSpace())):
+            with self.lock:
+                self.rejected += 1
+            return False
+
+        with self.lock:
+            if(self.Full()):
+                self.overwritten += 1
+
+            slot : int = self.head % self.capacity
+            start : int = slot * self.width
+            data = self.data
+            for index in range(self.width):
+                data[start + index] = values[index]
+            self.times[slot] = sensor_time
+
+            self.head += 1
+            self.written += 1
+
+        return True
+
+
+    def WaitForSpace(self) -> bool:
+        """
+        Sleeps until the slowest reader has freed a slot (or "timeout_ms" elapsed). Returns True when there is space.
+        """
+        with self.lock:
+            if(not self.Full()):
+                return True
+            self.blocked += 1
+
+        start : int = ticks_us()
+        while(True):
+            sleep_ms(1)
+            with self.lock:
+                if(not self.Full()):
+                    return True
+            if((self.timeout_ms is not None) and ((ticks_diff(ticks_us(), start) // 1000) >= self.timeout_ms)):
+                return False
+
+
+    def Stats(self) -> dict:
+        with self.lock:
+            stats : dict = {
+                'capacity' : self.capacity,
+                'written' : self.written,
+                'overwritten' : self.overwritten,
+                'rejected' : self.rejected,
+                'blocked' : self.blocked,
+                'dropped' : sum(reader.dropped for reader in self.readers),
+                'readers' : len(self.readers),
+            }
+
+        return stats
+
+
+class RingReader(object):
+    """
+    Independent cursor into a RingBuffer. Snapshot() exposes the unread samples as memoryviews of the buffer itself,
+    Release() then advances the cursor and reports how many of them were still intact (POLICY_OVERWRITE may recycle
+    slots while a snapshot is being processed).
+    """
+    def __init__(self, ring : RingBuffer, position : int) -> None:
+        self.ring : RingBuffer = ring
+        self.position : int = position
+        self.dropped : int = 0
+
+        return None
+
+
+    def Catch(self) -> None:
+        """
+        Moves a reader that was lapped by the writer to the oldest sample still stored. Call with the lock held.
+        """
+        oldest : int = self.ring.head - self.ring.capacity
+        if(self.position < oldest):
+            self.dropped += oldest - self.position
+            self.position = oldest
+
+        return None
+
+
+    def Available(self) -> int:
+        with self.ring.lock:
+            self.Catch()
+            available : int = self.ring.head - self.position
+
+        return available
+
+
+    def Snapshot(self, max_samples : int = None) -> list:
+        """
+        Returns the unread samples as up to two (data, times) segments in write order, without copying:
+        "data" is a memoryview of count * width values (sample after sample), "times" a memoryview of count sensortimes.
+        """
+        ring : RingBuffer = self.ring
+        with ring.lock:
+            self.Catch()
+            count : int = ring.head - self.position
+            if((max_samples is not None) and (count > max_samples)):
+                count = max_samples
+            slot : int = self.position % ring.capacity
+
+        segments : list = []
+        while(count > 0):
+            length : int = min(count, ring.capacity - slot)
+            segments.append((ring.data_view[(slot * ring.width):((slot + length) * ring.width)], ring.times_view[slot:(slot + length)]))
+            count -= length
+            slot = 0
+
+        return segments
+
+
+    def Release(self, count : int) -> int:
+        """
+        Marks "count" snapshot samples as consumed, clamped to the samples written so far (the reader never moves past the head).
+        Returns how many of them were not overwritten before the call; the others are added to "dropped".
+        """
+        ring : RingBuffer = self.ring
+        with ring.lock:
+            count = min(max(count, 0), ring.head - self.position)
+            lost : int = (ring.head - ring.capacity) - self.position
+            lost = min(max(lost, 0), count)
+            self.dropped += lost
+            self.position += count
+
+        return (count - lost)
@@ -0,0 +1,919 @@
+# -------------------------------------------------
+# SIMULATED BMI270 + I2C BUS
+# -------------------------------------------------
+# Pure-Python stand-in for machine.I2C / machine.SPI and a BMI270 so the driver can be run, tested and timed off the board.
+#
+#   bus = VirtualI2C(VirtualBMI270(), latency=0.0001)
+#   sensor = BMI270(serial_device=bus)
+#
+#   spi = VirtualSPI(VirtualBMI270(), frequency=10000000)
+#   sensor = BMI270(serial_device=SPITransport(spi, spi.cs))
+
+try:
+    from time import perf_counter as _clock
+except ImportError:
+    from time import ticks_us, ticks_diff   # type: ignore
+    _T0 = ticks_us()
+    def _clock() -> float:
+        return ticks_diff(ticks_us(), _T0) / 1000000
+
+from math import sin, pi
+from time import sleep
+from struct import pack, pack_into
+from register_definitions import *
+
+
+ENODEV = 19
+
+# Register values after power-on / soft reset (datasheet defaults)
+RESET_VALUES : dict = {
+    CHIP_ID_ADDRESS : CHIP_ID,
+    ACC_CONF        : 0xA8,
+    ACC_RANGE       : 0x02,
+    GYR_CONF        : 0xA9,
+    GYR_RANGE       : 0x00,
+    FIFO_DOWNS      : 0x88,
+    FIFO_WTM_0      : 0x00,
+    FIFO_WTM_1      : 0x02,
+    FIFO_CONFIG_0   : 0x02,
+    FIFO_CONFIG_1   : 0x10,
+    PWR_CONF        : 0x03,
+    PWR_CTRL        : 0x00,
+}
+
+ACC_RANGE_G : tuple = (2, 4, 8, 16)
+GYR_RANGE_DPS : tuple = (2000, 1000, 500, 250, 125)
+
+
+def DefaultMotion(t : float) -> tuple:
+    """
+    Default signal: the sensor lies flat (1 g on Z) and slowly rocks around Z.
+    Returns ((acc_x, acc_y, acc_z) in g, (gyr_x, gyr_y, gyr_z) in deg/s).
+    """
+    wobble : float = sin(2 * pi * 0.5 * t)
+    return ((0.01 * wobble, 0.0, 1.0), (0.0, 0.0, 10.0 * wobble))
+
+
+def ODRToHertz(odr : int) -> float:
+    """
+    Converts an ACC_CONF / GYR_CONF ODR code (lower nibble) to its rate in Hz.
+    """
+    return 100 * (2 ** ((odr & LSB_MASK_8BIT) - 8))
+
+
+class VirtualBMI270(object):
+    """
+    Register-level model of a BMI270: register map, config upload handshake (INIT_CTRL / INTERNAL_STATUS),
+    ODR-paced accelerometer / gyroscope data and sensortime, and the FIFO (headered and headerless).
+    """
+    def __init__(self, address : int = I2C_PRIM_ADDR, motion = DefaultMotion, clock = _clock, configured : bool = False, aux_device = None) -> None:
+        self.address : int = address
+        self.motion = motion
+        self.aux_device = aux_device        # e.g. VirtualBMM150 on the aux port
+        self.clock = clock
+        self.pins : dict = {}
+        self.acc_bias : tuple = (0.0, 0.0, 0.0)     # zero-rate / zero-g errors (g, deg/s) added to "motion", removed again by the OFFSET registers
+        self.gyr_bias : tuple = (0.0, 0.0, 0.0)
+
+        self.Reset()
+        if(configured):
+            self.registers[INTERNAL_STATUS] = INTERNAL_STATUS_INIT_OK
+
+        return None
+
+
+    def Reset(self) -> None:
+        """
+        Power-on / soft reset: restores register defaults, clears the config memory and empties the FIFO.
+        """
+        self.registers : bytearray = bytearray(128)
+        for (register, value) in RESET_VALUES.items():
+            self.registers[register] = value
+
+        self.config_memory : bytearray = bytearray(CONFIG_FILE_SIZE)
+        self.fifo : bytearray = bytearray()
+        self.fifo_frames : list = []
+        self.start_time : float = self.clock()
+        self.last_update : float = 0.0
+        self.watermark_active : bool = False
+        self.full_active : bool = False
+        self.spi_mode : bool = False      # primary interface is I2C until the first rising edge of CSB
+        self.feature_pages : list = [bytearray(FEATURE_PAGE_LENGTH) for _ in range(FEATURE_PAGES)]
+        self.motion_reference = None      # accelerometer sample (g) the any / no-motion detectors compare against
+        self.reference_age : float = 0.0
+        self.moving_time : float = 0.0    # how long the current motion / stillness has lasted (s)
+        self.still_time : float = 0.0
+        self.moving = None
+
+        return None
+
+
+    @property
+    def configured(self) -> bool:
+        return ((self.registers[INTERNAL_STATUS] & INTERNAL_STATUS_MASK) == INTERNAL_STATUS_INIT_OK)
+
+
+    def SensorTime(self, now : float) -> int:
+        return int((now - self.start_time) / SENSORTIME_RESOLUTION) & SENSORTIME_MASK
+
+
+    # ---------------------------------------------
+    # Register access
+    # ---------------------------------------------
+
+    def ReadRegisters(self, register : int, length : int) -> bytes:
+        self.Update()
+
+        if(register == FIFO_DATA):
+            return self.ReadFIFO(length)
+
+        end : int = register + length
+        if(end > len(self.registers)):
+            return bytes(self.registers[register:]) + bytes(end - len(self.registers))
+
+        if((register < (FEATURES_0 + FEATURE_PAGE_LENGTH)) and (end > FEATURES_0)):
+            page : int = self.registers[FEAT_PAGE] & FIRST_3_BITS
+            self.registers[FEATURES_0:(FEATURES_0 + FEATURE_PAGE_LENGTH)] = self.feature_pages[page]
+
+        data : bytes = bytes(self.registers[register:end])
+        for status in (INT_STATUS_0, INT_STATUS_1):
+            if(register <= status < end):
+                self.registers[status] = 0x00       # interrupt status is cleared on read
+
+        return data
+
+
+    def WriteRegisters(self, register : int, data) -> None:
+        self.Update()
+
+        if(register == INIT_DATA):
+            # INIT_DATA does not auto-increment, the whole burst goes to the config memory at INIT_ADDR
+            if(self.registers[PWR_CONF] & BIT_0):
+                return None     # upload is ignored while advanced power save is enabled
+            offset : int = 2 * ((self.registers[INIT_ADDR_1] << 4) | (self.registers[INIT_ADDR_0] & LSB_MASK_8BIT))
+            self.config_memory[offset:(offset + len(data))] = data
+            return None
+
+        for (index, value) in enumerate(data):
+            self.WriteRegister(register + index, value)
+
+        return None
+
+
+    def WriteRegister(self, register : int, value : int) -> None:
+        if(register == CMD):
+            self.Command(value)
+            return None
+
+        self.registers[register] = value
+
+        if(FEATURES_0 <= register < (FEATURES_0 + FEATURE_PAGE_LENGTH)):
+            page : int = self.registers[FEAT_PAGE] & FIRST_3_BITS
+            if(page != FEATURE_OUTPUT_PAGE):
+                self.feature_pages[page][register - FEATURES_0] = value
+                if(self.FeatureField('step_counter_reset')):
+                    self.SetFeatureField('step_counter_reset', 0)
+                    self.SetStepCount(0)
+            return None
+
+        if((register in (AUX_WR_ADDR, AUX_RD_ADDR)) and self.AuxManual()):
+            if(register == AUX_WR_ADDR):
+                self.aux_device.WriteRegisters(value, bytes((self.registers[AUX_WR_DATA],)))
+            else:
+                length : int = (1, 2, 6, 8)[(self.registers[AUX_IF_CONF] >> 2) & 0x03]
+                self.registers[AUX_DATA_0:(AUX_DATA_0 + length)] = self.aux_device.ReadRegisters(value, length, self.clock() - self.start_time)
+            return None
+
+        if((register == INIT_CTRL) and (value == 0x01)):
+            from config_file import bmi270_config_file
+            if(self.config_memory == bmi270_config_file):
+                self.registers[INTERNAL_STATUS] = INTERNAL_STATUS_INIT_OK
+            else:
+                self.registers[INTERNAL_STATUS] = INTERNAL_STATUS_INIT_ERR
+
+        return None
+
+
+    def AuxConnected(self) -> bool:
+        """
+        True when the aux interface is enabled and AUX_DEV_ID addresses the attached aux device.
+        """
+        return ((self.aux_device is not None) and bool(self.registers[PWR_CTRL] & BIT_0) and bool(self.registers[IF_CONF] & BIT_5)
+                and ((self.registers[AUX_DEV_ID] >> 1) == self.aux_device.address))
+
+
+    def AuxManual(self) -> bool:
+        return (self.AuxConnected() and bool(self.registers[AUX_IF_CONF] & BIT_7))
+
+
+    def Command(self, command : int) -> None:
+        if(command == CMD_FIFO_FLUSH):
+            self.fifo = bytearray()
+            self.fifo_frames = []
+            self.RaiseInterrupts()
+        elif(command == CMD_SOFT_RESET):
+            self.Reset()
+
+        return None
+
+
+    # ---------------------------------------------
+    # Data generation
+    # ---------------------------------------------
+
+    def Update(self) -> None:
+        """
+        Advances the model to the current clock: refreshes the data and sensortime registers and queues the FIFO frames produced since the last update.
+        """
+        now : float = self.clock()
+        self.registers[SENSORTIME_0:(SENSORTIME_2 + 1)] = self.SensorTime(now).to_bytes(3, 'little')
+
+        acc_enabled : bool = self.configured and bool(self.registers[PWR_CTRL] & BIT_2)
+        gyr_enabled : bool = self.configured and bool(self.registers[PWR_CTRL] & BIT_1)
+        elapsed : float = now - self.start_time
+        if(not (acc_enabled or gyr_enabled)):
+            self.last_update = elapsed
+            return None
+
+        acc_odr : float = ODRToHertz(self.registers[ACC_CONF])
+        gyr_odr : float = ODRToHertz(self.registers[GYR_CONF])
+        (acc_fifo_rate, gyr_fifo_rate) = self.FIFORates(acc_odr, gyr_odr)
+        base_odr : float = max((max(acc_odr, acc_fifo_rate) if acc_enabled else 0), (max(gyr_odr, gyr_fifo_rate) if gyr_enabled else 0))
+
+        tick : int = int(elapsed * base_odr)
+        last_tick : int = int(self.last_update * base_odr)
+        self.last_update = elapsed
+        if(tick <= last_tick):
+            return None
+
+        acc_step : int = max(1, int(base_odr / acc_odr))
+        gyr_step : int = max(1, int(base_odr / gyr_odr))
+        acc_fifo_step : int = max(1, int(base_odr / acc_fifo_rate))
+        gyr_fifo_step : int = max(1, int(base_odr / gyr_fifo_rate))
+        # Only the frames that can still be held in the FIFO need to be generated
+        frame_step : int = min((acc_fifo_step if acc_enabled else gyr_fifo_step), (gyr_fifo_step if gyr_enabled else acc_fifo_step))
+        first_tick : int = max(last_tick + 1, tick - ((FIFO_SIZE // (FIFO_ACC_LENGTH + FIFO_GYR_LENGTH + 1)) * frame_step))
+        aux_enabled : bool = self.AuxConnected() and (not (self.registers[AUX_IF_CONF] & BIT_7))
+        aux_step : int = max(1, int(base_odr / ODRToHertz(self.registers[AUX_CONF])))
+        aux_length : int = (1, 2, 6, 8)[self.registers[AUX_IF_CONF] & 0x03]
+        features : int = 0
+
+        for t in range(first_tick, tick + 1):
+            (acc, gyr) = self.motion(t / base_odr)
+            new_acc : bool = acc_enabled and ((t % acc_step) == 0)
+            new_gyr : bool = gyr_enabled and ((t % gyr_step) == 0)
+            raw_acc : bytes = self.EncodeAccelerometer(acc)
+            raw_gyr : bytes = self.EncodeGyroscope(gyr)
+
+            if(new_acc):
+                self.registers[ACC_X_7_0:(ACC_X_7_0 + 6)] = raw_acc
+                self.registers[INT_STATUS_1] |= BIT_7
+            if(new_gyr):
+                self.registers[GYR_X_7_0:(GYR_X_7_0 + 6)] = raw_gyr
+                self.registers[INT_STATUS_1] |= BIT_6
+            raw_aux = None
+            if(aux_enabled and ((t % aux_step) == 0)):
+                # data mode: the BMI270 reads the aux device by itself
+                raw_aux = bytes(self.aux_device.ReadRegisters(self.registers[AUX_RD_ADDR], aux_length, t / base_odr)) + bytes(AUX_DATA_LENGTH - aux_length)
+                self.registers[AUX_DATA_0:(AUX_DATA_0 + AUX_DATA_LENGTH)] = raw_aux
+                self.registers[INT_STATUS_1] |= BIT_5
+            fifo_acc : bool = acc_enabled and ((t % acc_fifo_step) == 0)
+            fifo_gyr : bool = gyr_enabled and ((t % gyr_fifo_step) == 0)
+            if(fifo_acc or fifo_gyr or (raw_aux is not None)):
+                self.QueueFIFOFrame((raw_acc if fifo_acc else None), (raw_gyr if fifo_gyr else None), raw_aux)
+            if(new_acc):
+                features |= self.DetectMotion(acc, acc_step / base_odr)
+
+        self.registers[INT_STATUS_0] |= features
+        self.RaiseInterrupts(data_ready=True, features=features)
+
+        return None
+
+
+    def FIFORates(self, acc_odr : float, gyr_odr : float) -> tuple:
+        """
+        (accelerometer, gyroscope) FIFO rates in Hz after FIFO_DOWNS: filtered data at the ODR, unfiltered data at the pre-filter rate
+        (not filtered differently here), divided by 2 ** downs.
+        """
+        downs : int = self.registers[FIFO_DOWNS]
+        acc_rate : float = acc_odr if (downs & BIT_7) else ACC_UNFILTERED_RATE
+        gyr_rate : float = gyr_odr if (downs & BIT_3) else GYR_UNFILTERED_RATE
+        return ((acc_rate / (1 << ((downs >> 4) & FIRST_3_BITS))), (gyr_rate / (1 << (downs & FIRST_3_BITS))))
+
+
+    def Offsets(self) -> tuple:
+        """
+        The compensation currently applied to the output: ((acc in g), (gyr in deg/s)), zero while disabled in NV_CONF / OFFSET_6.
+        """
+        acc_offsets : tuple = (0.0, 0.0, 0.0)
+        gyr_offsets : tuple = (0.0, 0.0, 0.0)
+        registers : bytearray = self.registers
+
+        if(registers[NV_CONF] & BIT_3):
+            acc_offsets = tuple((((registers[OFFSET_0 + axis] + 128) & 0xFF) - 128) * ACC_OFFSET_RESOLUTION for axis in range(3))
+        if(registers[OFFSET_6] & BIT_6):
+            values : list = [registers[OFFSET_3 + axis] | (((registers[OFFSET_6] >> (2 * axis)) & 0x03) << 8) for axis in range(3)]
+            gyr_offsets = tuple((((value + 512) & 0x3FF) - 512) * GYR_OFFSET_RESOLUTION for value in values)
+
+        return (acc_offsets, gyr_offsets)
+
+
+    def EncodeAccelerometer(self, acc : tuple) -> bytes:
+        scale : float = 32768 / ACC_RANGE_G[self.registers[ACC_RANGE] & 0x03]
+        offsets : tuple = self.Offsets()[0]
+        values : tuple = tuple(acc[axis] + self.acc_bias[axis] + offsets[axis] for axis in range(3))
+        return pack('<3h', *(max(-32768, min(32767, int(a * scale))) for a in values))
+
+
+    def EncodeGyroscope(self, gyr : tuple) -> bytes:
+        scale : float = 32768 / GYR_RANGE_DPS[min(self.registers[GYR_RANGE] & 0x07, 4)]
+        offsets : tuple = self.Offsets()[1]
+        values : tuple = tuple(gyr[axis] + self.gyr_bias[axis] + offsets[axis] for axis in range(3))
+        return pack('<3h', *(max(-32768, min(32767, int(g * scale))) for g in values))
+
+
+    # ---------------------------------------------
+    # Feature engine
+    # ---------------------------------------------
+
+    def FeatureField(self, name : str) -> int:
+        from features import FEATURE_FIELDS, ReadFeatureField
+        return ReadFeatureField(self.feature_pages[FEATURE_FIELDS[name][0]], name)
+
+
+    def SetFeatureField(self, name : str, value : int) -> None:
+        from features import FEATURE_FIELDS, ApplyFeatureFields
+        page : int = FEATURE_FIELDS[name][0]
+        self.feature_pages[page] = ApplyFeatureFields(page, self.feature_pages[page], {name : value})
+        return None
+
+
+    def DetectMotion(self, acc : tuple, dt : float) -> int:
+        """
+        Any / no-motion model on the 50 Hz slope: a sample is moving when one of the selected axes changed by more than the threshold
+        since the reference, refreshed every MOTION_DURATION_RESOLUTION. Any-motion fires (once) after "duration" of moving samples
+        (pauses shorter than "duration" do not restart it, e.g. at the turning points of a swing), no-motion (once) after "duration"
+        of consecutive still ones; with both enabled the any-motion threshold and axes are used for both.
+        Returns the INT_STATUS_0 bits raised.
+        """
+        any_enabled : bool = bool(self.FeatureField('any_motion_en'))
+        no_enabled : bool = bool(self.FeatureField('no_motion_en'))
+        if(not (any_enabled or no_enabled)):
+            self.motion_reference = None
+            return 0
+        if(self.motion_reference is None):
+            (self.motion_reference, self.reference_age, self.moving_time, self.still_time, self.moving) = (acc, 0.0, 0.0, 0.0, None)
+            return 0
+
+        prefix : str = 'any_motion_' if any_enabled else 'no_motion_'
+        threshold : float = self.FeatureField(prefix + 'threshold') * MOTION_THRESHOLD_RESOLUTION
+        axes : tuple = tuple(axis for (axis, name) in enumerate('xyz') if self.FeatureField(prefix + name))
+        if(any(abs(acc[axis] - self.motion_reference[axis]) > threshold for axis in axes)):
+            self.moving_time += dt
+            self.still_time = 0.0
+        else:
+            self.still_time += dt
+            if(self.still_time > (self.FeatureField('any_motion_duration') * MOTION_DURATION_RESOLUTION)):
+                self.moving_time = 0.0
+
+        self.reference_age += dt
+        if(self.reference_age >= MOTION_DURATION_RESOLUTION):
+            (self.motion_reference, self.reference_age) = (acc, 0.0)
+
+        status : int = 0
+        if(any_enabled and (self.moving is not True) and self.moving_time
+           and (self.moving_time >= (self.FeatureField('any_motion_duration') * MOTION_DURATION_RESOLUTION))):
+            self.moving = True
+            status = INT_STATUS_ANY_MOTION
+        elif(no_enabled and (self.moving is not False) and self.still_time
+             and (self.still_time >= (self.FeatureField('no_motion_duration') * MOTION_DURATION_RESOLUTION))):
+            self.moving = False
+            status = INT_STATUS_NO_MOTION
+
+        return status
+
+
+    def SetStepCount(self, steps : int) -> None:
+        pack_into('<I', self.feature_pages[FEATURE_OUTPUT_PAGE], FEATURE_OUT_STEP_COUNT, steps)
+        return None
+
+
+    def AddSteps(self, count : int = 1) -> None:
+        """
+        Test hook: "count" steps were taken. Raises the step counter interrupt per step (step detector) or when a watermark multiple was crossed.
+        """
+        if(not self.FeatureField('step_counter_en')):
+            return None
+
+        output : bytearray = self.feature_pages[FEATURE_OUTPUT_PAGE]
+        steps : int = int.from_bytes(output[FEATURE_OUT_STEP_COUNT:(FEATURE_OUT_STEP_COUNT + 4)], 'little')
+        self.SetStepCount(steps + count)
+        if(self.FeatureField('step_activity_en')):
+            output[FEATURE_OUT_ACTIVITY] = ACTIVITY_WALKING
+
+        watermark : int = self.FeatureField('step_counter_watermark') * STEP_WATERMARK_RESOLUTION
+        if(self.FeatureField('step_detector_en') or (watermark and (((steps + count) // watermark) > (steps // watermark)))):
+            self.registers[INT_STATUS_0] |= INT_STATUS_STEP_COUNTER
+            self.RaiseInterrupts(features=INT_STATUS_STEP_COUNTER)
+
+        return None
+
+
+    def PerformGesture(self, gesture : int) -> None:
+        """
+        Test hook: the wearer performed "gesture" (WRIST_GESTURE_*), reported when wrist_gesture_en is set.
+        """
+        if(not self.FeatureField('wrist_gesture_en')):
+            return None
+
+        self.feature_pages[FEATURE_OUTPUT_PAGE][FEATURE_OUT_WRIST_GESTURE] = gesture
+        self.registers[INT_STATUS_0] |= INT_STATUS_WRIST_GESTURE
+        self.RaiseInterrupts(features=INT_STATUS_WRIST_GESTURE)
+
+        return None
+
+
+    # ---------------------------------------------
+    # FIFO
+    # ---------------------------------------------
+
+    def QueueFIFOFrame(self, raw_acc : bytes, raw_gyr : bytes, raw_aux : bytes = None) -> None:
+        fifo_config_1 : int = self.registers[FIFO_CONFIG_1]
+        use_aux : bool = bool(fifo_config_1 & BIT_5)
+        use_acc : bool = bool(fifo_config_1 & BIT_6)
+        use_gyr : bool = bool(fifo_config_1 & BIT_7)
+
+        if(fifo_config_1 & BIT_4):
+            header : int = FIFO_HEADER_REGULAR
+            frame : bytes = b''
+            if(use_aux and (raw_aux is not None)):
+                header |= FIFO_HEADER_AUX
+                frame += raw_aux
+            if(use_gyr and (raw_gyr is not None)):
+                header |= FIFO_HEADER_GYR
+                frame += raw_gyr
+            if(use_acc and (raw_acc is not None)):
+                header |= FIFO_HEADER_ACC
+                frame += raw_acc
+            if(header == FIFO_HEADER_REGULAR):
+                return None
+            frame = bytes((header,)) + frame
+        else:
+            if(not (use_acc or use_gyr or use_aux)):
+                return None
+            frame : bytes = b''
+            if(use_aux):
+                frame += raw_aux if (raw_aux is not None) else pack('<H6x', FIFO_AUX_DUMMY)
+            if(use_gyr):
+                frame += raw_gyr if (raw_gyr is not None) else pack('<Hhh', FIFO_GYR_DUMMY, 0, 0)
+            if(use_acc):
+                frame += raw_acc if (raw_acc is not None) else pack('<Hhh', FIFO_ACC_DUMMY, 0, 0)
+
+        if((len(self.fifo) + len(frame)) > FIFO_SIZE):
+            if(self.registers[FIFO_CONFIG_0] & BIT_0):
+                return None     # stop-on-full, newest frames are dropped
+            while(self.fifo_frames and ((len(self.fifo) + len(frame)) > FIFO_SIZE)):
+                del self.fifo[:self.fifo_frames.pop(0)]
+
+        self.fifo += frame
+        self.fifo_frames.append(len(frame))
+        pack_into('<H', self.registers, FIFO_LENGTH_0, len(self.fifo))
+
+        return None
+
+
+    def ReadFIFO(self, length : int) -> bytes:
+        data : bytes = bytes(self.fifo[:length])
+        consumed : int = len(data)
+        del self.fifo[:consumed]
+
+        while(self.fifo_frames and (consumed >= self.fifo_frames[0])):
+            consumed -= self.fifo_frames.pop(0)
+        if(self.fifo_frames):
+            self.fifo_frames[0] -= consumed
+
+        pack_into('<H', self.registers, FIFO_LENGTH_0, len(self.fifo))
+        self.RaiseInterrupts()     # re-arms the watermark / full edges once the level dropped
+
+        if(len(data) < length):
+            # Reading past the last frame returns the sensortime frame (if enabled) then over-read frames
+            padding : bytearray = bytearray()
+            header : bool = bool(self.registers[FIFO_CONFIG_1] & BIT_4)
+            if(header and (self.registers[FIFO_CONFIG_0] & BIT_1)):
+                padding += bytes((FIFO_HEADER_SENSORTIME,)) + bytes(self.registers[SENSORTIME_0:(SENSORTIME_2 + 1)])
+            while((len(data) + len(padding)) < length):
+                padding += bytes((FIFO_HEADER_EMPTY, 0x00)) if header else pack('<H', FIFO_OVER_READ)
+            data += bytes(padding[:(length - len(data))])
+
+        return data
+
+
+    # ---------------------------------------------
+    # Interrupt pins
+    # ---------------------------------------------
+
+    def ConnectPin(self, number : int, pin) -> None:
+        """
+        Wires the INT1 / INT2 output ("number") to a host pin object with a Fire() method (SimulatedPin, interrupts.EventPin).
+        """
+        self.pins[number] = pin
+        return None
+
+
+    def RaiseInterrupts(self, data_ready : bool = False, features : int = 0) -> None:
+        """
+        Fires the connected pins whose mapped interrupts became active: data-ready on every new sample,
+        FIFO watermark / full when the FIFO level crosses them (the pin output is level-based, so only the rising edge fires)
+        and the feature interrupts in "features" (INT_STATUS_0 bits) through INT1_MAP_FEAT / INT2_MAP_FEAT.
+        """
+        wtm : int = ((self.registers[FIFO_WTM_1] & 0x1F) << 8) | self.registers[FIFO_WTM_0]
+        watermark : bool = (wtm > 0) and (len(self.fifo) >= wtm)
+        full : bool = len(self.fifo) >= (FIFO_SIZE - (1 + FIFO_ACC_LENGTH + FIFO_GYR_LENGTH))
+        new_watermark : bool = watermark and (not self.watermark_active)
+        new_full : bool = full and (not self.full_active)
+        self.watermark_active = watermark
+        self.full_active = full
+        if(watermark):
+            self.registers[INT_STATUS_1] |= BIT_1
+        if(full):
+            self.registers[INT_STATUS_1] |= BIT_0
+
+        mapping : int = self.registers[INT_MAP_DATA]
+        for (number, io_ctrl, shift, feature_map) in ((1, INT1_IO_CTRL, 0, INT1_MAP_FEAT), (2, INT2_IO_CTRL, 4, INT2_MAP_FEAT)):
+            pin = self.pins.get(number)
+            if((pin is None) or (not (self.registers[io_ctrl] & BIT_3))):
+                continue
+            pin_map : int = mapping >> shift
+            if((data_ready and (pin_map & BIT_2)) or (new_watermark and (pin_map & BIT_1)) or (new_full and (pin_map & BIT_0))
+               or (features & self.registers[feature_map])):
+                pin.Fire()
+
+        return None
+
+
+def DefaultField(t : float) -> tuple:
+    """
+    Default magnetic field in uT: horizontal component along X, pointing down (northern hemisphere).
+    """
+    return (20.0, 0.0, -40.0)
+
+
+class VirtualBMM150(object):
+    """
+    Register-level BMM150 for the aux port: DATAX .. RHALL (0x42 .. 0x49) encode "field(t)" (in the BMI270 frame, rotated
+    into the BMM150's own axes by "axes" / "signs" as in auxiliary.Magnetometer) with the nominal resolution,
+    every other register is plain memory.
+    """
+    def __init__(self, address : int = 0x10, field = DefaultField, axes : tuple = None, signs : tuple = None) -> None:
+        from auxiliary import BMM150_DATA_X, BMM150_RESOLUTION, BMM150_AXES, BMM150_SIGNS
+
+        self.address : int = address
+        self.field = field
+        self.axes : tuple = axes if (axes is not None) else BMM150_AXES
+        self.signs : tuple = signs if (signs is not None) else BMM150_SIGNS
+        self.data_register : int = BMM150_DATA_X
+        self.resolution : float = BMM150_RESOLUTION
+        self.registers : bytearray = bytearray(0x80)
+        self.registers[0x40] = 0x32     # chip id
+
+        return None
+
+
+    def ReadRegisters(self, register : int, length : int, t : float = 0.0) -> bytes:
+        data : bytearray = bytearray(self.registers)
+        if(self.registers[0x4B] & BIT_0):
+            field : tuple = self.field(t)
+            raw : list = [0, 0, 0]
+            for axis in range(3):
+                raw[self.axes[axis]] = self.signs[axis] * field[axis]
+            (x, y, z) = (int(value / self.resolution) for value in raw)
+            x = max(-4096, min(4095, x))
+            y = max(-4096, min(4095, y))
+            z = max(-16384, min(16383, z))
+            pack_into('<3hH', data, self.data_register, x << 3, y << 3, z << 1, 0)
+        return bytes(data[register:(register + length)])
+
+
+    def WriteRegisters(self, register : int, data : bytes) -> None:
+        self.registers[register:(register + len(data))] = data
+        return None
+
+
+class SimulatedPin(object):
+    """
+    machine.Pin stand-in driven by VirtualBMI270.ConnectPin: Fire() calls the handler registered with irq().
+    """
+    IRQ_RISING = 1
+    IRQ_FALLING = 2
+
+    def __init__(self) -> None:
+        self.handler = None
+        self.edges : int = 0
+
+        return None
+
+
+    def irq(self, handler = None, trigger : int = IRQ_RISING) -> None:
+        self.handler = handler
+        return None
+
+
+    def value(self) -> int:
+        return 0
+
+
+    def Fire(self) -> None:
+        self.edges += 1
+        if(self.handler is not None):
+            self.handler(self)
+
+        return None
+
+
+class VirtualI2C(object):
+    """
+    machine.I2C compatible bus (readfrom_mem / readfrom_mem_into / writeto_mem) carrying one or more virtual devices.
+    Every transaction costs "latency" seconds plus 9 bit times per byte when a bus "frequency" is given (yielding to other
+    threads meanwhile), and is counted in "transactions", "bytes_read" and "bytes_written".
+    """
+    def __init__(self, *devices, latency : float = 0.0, frequency : int = None) -> None:
+        self.devices : dict = {}
+        for device in devices:
+            self.Attach(device)
+
+        self.latency : float = latency
+        self.frequency : int = frequency
+        self.ResetCounters()
+
+        return None
+
+
+    def Attach(self, device) -> None:
+        self.devices[device.address] = device
+        return None
+
+
+    def ResetCounters(self) -> None:
+        self.transactions : int = 0
+        self.bytes_read : int = 0
+        self.bytes_written : int = 0
+
+        return None
+
+
+    def _Transaction(self, address : int, length : int):
+        device = self.devices.get(address)
+        if(device is None):
+            raise OSError(ENODEV)
+
+        self.transactions += 1
+
+        delay : float = self.latency
+        if(self.frequency):
+            delay += (9 * (length + 2)) / self.frequency    # address + register byte + payload
+        if(delay > 0):
+            deadline : float = _clock() + delay
+            while(_clock() < deadline):
+                sleep(0)        # like a real transfer blocked in the driver, other threads (other buses) run meanwhile
+
+        return device
+
+
+    def scan(self) -> list:
+        return sorted(self.devices)
+
+
+    def readfrom_mem(self, addr : int, memaddr : int, nbytes : int, addrsize : int = 8) -> bytes:
+        device = self._Transaction(addr, nbytes)
+        self.bytes_read += nbytes
+        return device.ReadRegisters(memaddr, nbytes)
+
+
+    def readfrom_mem_into(self, addr : int, memaddr : int, buf, addrsize : int = 8) -> None:
+        device = self._Transaction(addr, len(buf))
+        self.bytes_read += len(buf)
+        buf[:] = device.ReadRegisters(memaddr, len(buf))
+        return None
+
+
+    def writeto_mem(self, addr : int, memaddr : int, buf, addrsize : int = 8) -> None:
+        device = self._Transaction(addr, len(buf))
+        self.bytes_written += len(buf)
+        device.WriteRegisters(memaddr, bytes(buf))
+        return None
+
+
+class FakeI2CDev(object):
+    """
+    Kernel side of /dev/i2c-N for linux_i2c.LinuxI2C: pass "fd" and "ioctl" to it to run the Linux backend against a VirtualI2C.
+    The I2C_RDWR / I2C_SMBUS argument structures are decoded from memory with ctypes (CPython only).
+    "functionality" is what I2C_FUNCS reports (clear I2C_FUNC_I2C to exercise the SMBus fallback). Every ioctl is counted in "calls".
+    """
+    def __init__(self, bus : VirtualI2C, functionality : int = 0x0EFF000D) -> None:
+        self.bus : VirtualI2C = bus
+        self.functionality : int = functionality
+        self.fd : int = -1
+        self.slave : int = None
+        self.calls : dict = {}
+
+        return None
+
+
+    def ioctl(self, fd : int, request : int, arg = 0, mutate : bool = False):
+        import ctypes
+        from struct import unpack, calcsize
+        from linux_i2c import (I2C_SLAVE, I2C_FUNCS, I2C_RDWR, I2C_SMBUS, I2C_M_RD, I2C_FUNC_I2C, I2C_SMBUS_READ,
+                               I2C_SMBUS_I2C_BLOCK_DATA, I2C_MSG_FORMAT, I2C_RDWR_FORMAT, I2C_SMBUS_FORMAT)
+
+        self.calls[request] = self.calls.get(request, 0) + 1
+
+        if(request == I2C_FUNCS):
+            arg[0] = self.functionality
+            return 0
+
+        if(request == I2C_SLAVE):
+            if(arg not in self.bus.devices):
+                raise OSError(ENODEV)
+            self.slave = arg
+            return 0
+
+        if(request == I2C_RDWR):
+            if(not (self.functionality & I2C_FUNC_I2C)):
+                raise OSError(95)    # EOPNOTSUPP
+            (messages, count) = unpack(I2C_RDWR_FORMAT, arg)
+            size : int = calcsize(I2C_MSG_FORMAT)
+            decoded : list = [unpack(I2C_MSG_FORMAT, ctypes.string_at(messages + (index * size), size)) for index in range(count)]
+            index : int = 0
+            while(index < count):
+                (address, flags, length, buffer) = decoded[index]
+                payload : bytes = ctypes.string_at(buffer, length)
+                if((index + 1 < count) and (decoded[index + 1][1] & I2C_M_RD) and (length == 1)):
+                    # register address write + repeated start + read
+                    (_, _, read_length, read_buffer) = decoded[index + 1]
+                    data : bytes = self.bus.readfrom_mem(address, payload[0], read_length)
+                    ctypes.memmove(read_buffer, data, read_length)
+                    index += 2
+                else:
+                    self.bus.writeto_mem(address, payload[0], payload[1:])
+                    index += 1
+            return count
+
+        if(request == I2C_SMBUS):
+            (read_write, command, size, data) = unpack(I2C_SMBUS_FORMAT, arg)
+            if((size != I2C_SMBUS_I2C_BLOCK_DATA) or (self.slave is None)):
+                raise OSError(22)    # EINVAL
+            length : int = ctypes.string_at(data, 1)[0]
+            if(read_write == I2C_SMBUS_READ):
+                ctypes.memmove(data + 1, self.bus.readfrom_mem(self.slave, command, length), length)
+            else:
+                self.bus.writeto_mem(self.slave, command, ctypes.string_at(data + 1, length))
+            return 0
+
+        raise OSError(25)    # ENOTTY
+
+
+class VirtualChipSelect(object):
+    """
+    machine.Pin style CSB line of a VirtualSPI.
+    """
+    def __init__(self, bus) -> None:
+        self.bus = bus
+        self.level : int = 1
+
+        return None
+
+
+    def value(self, level : int = None) -> int:
+        if(level is None):
+            return self.level
+
+        if(self.level and (not level)):
+            self.bus.Select()
+        elif((not self.level) and level):
+            self.bus.Deselect()
+        self.level = 1 if level else 0
+
+        return self.level
+
+
+    def __call__(self, level : int = None) -> int:
+        return self.value(level)
+
+
+class VirtualSPI(object):
+    """
+    machine.SPI compatible bus (write / readinto / read / write_readinto) wired to a single virtual device through "cs".
+    A transaction runs from the falling to the rising edge of "cs": the first byte is the register address with bit 7 set for reads,
+    reads return one dummy byte before the data, writes are committed when "cs" rises. While the device is still in I2C mode
+    reads return 0xFF and writes are ignored; the first rising edge of "cs" switches it to SPI.
+    Every transaction costs "latency" seconds plus 8 bit times per byte when a bus "frequency" is given and is counted in
+    "transactions", "bytes_read" and "bytes_written".
+    """
+    def __init__(self, device, latency : float = 0.0, frequency : int = None) -> None:
+        self.device = device
+        self.cs : VirtualChipSelect = VirtualChipSelect(self)
+        self.latency : float = latency
+        self.frequency : int = frequency
+        self.selected : bool = False
+        self.ResetCounters()
+
+        return None
+
+
+    def ResetCounters(self) -> None:
+        self.transactions : int = 0
+        self.bytes_read : int = 0
+        self.bytes_written : int = 0
+
+        return None
+
+
+    def Select(self) -> None:
+        self.selected = True
+        self.command = None
+        self.dummy_pending : bool = True
+        self.offset : int = 0
+        self.write_data : bytearray = bytearray()
+        self.length : int = 0
+
+        return None
+
+
+    def Deselect(self) -> None:
+        if(not self.selected):
+            return None
+        self.selected = False
+
+        if(self.device.spi_mode and (self.command is not None) and (not (self.command & 0x80)) and self.write_data):
+            self.device.WriteRegisters(self.command & 0x7F, bytes(self.write_data))
+            self.bytes_written += len(self.write_data)
+
+        if(self.command is not None):
+            self.transactions += 1
+            delay : float = self.latency
+            if(self.frequency):
+                delay += (8 * self.length) / self.frequency
+            if(delay > 0):
+                deadline : float = _clock() + delay
+                while(_clock() < deadline):
+                    sleep(0)
+
+        self.device.spi_mode = True
+
+        return None
+
+
+    def Exchange(self, data) -> bytes:
+        """
+        Clocks "data" out and returns the bytes clocked in.
+        """
+        if(not self.selected):
+            raise OSError("SPI transfer without chip select")
+
+        self.length += len(data)
+        received : bytearray = bytearray(b'\xff' * len(data))
+        index : int = 0
+        if((self.command is None) and len(data)):
+            self.command = data[0]
+            index = 1
+
+        if(self.command is None):
+            return bytes(received)
+
+        if(not (self.command & 0x80)):
+            self.write_data.extend(bytes(data[index:]))
+            return bytes(received)
+
+        if(self.dummy_pending and (index < len(data))):
+            self.dummy_pending = False
+            index += 1
+
+        count : int = len(data) - index
+        if(count and self.device.spi_mode):
+            register : int = self.command & 0x7F
+            if(register != FIFO_DATA):
+                register += self.offset
+            received[index:] = self.device.ReadRegisters(register, count)
+            self.offset += count
+            self.bytes_read += count
+
+        return bytes(received)
+
+
+    def write(self, buf) -> None:
+        self.Exchange(buf)
+        return None
+
+
+    def readinto(self, buf, write : int = 0x00) -> None:
+        buf[:] = self.Exchange(bytes((write,)) * len(buf))
+        return None
+
+
+    def read(self, nbytes : int, write : int = 0x00) -> bytes:
+        return self.Exchange(bytes((write,)) * nbytes)
+
+
+    def write_readinto(self, write_buf, read_buf) -> None:
+        read_buf[:] = self.Exchange(write_buf)
+        return None
@@ -0,0 +1,95 @@
+# -------------------------------------------------
+# SPI TRANSPORT
+# -------------------------------------------------
+# Presents a machine.SPI bus + chip-select pin through the machine.I2C subset the driver uses (readfrom_mem / readfrom_mem_into /
+# writeto_mem), so BMI270 runs over SPI (up to 10 MHz) unchanged:
+#
+#   spi = SPI(1, baudrate=10000000, polarity=0, phase=0)
+#   sensor = BMI270(serial_device=SPITransport(spi, Pin(5, Pin.OUT, value=1)))
+#
+# Reads send the register address with bit 7 set and discard the dummy byte the BMI270 returns before the data.
+# The device powers up (and comes back from a soft reset) in I2C mode and switches to SPI on the first rising edge of CSB,
+# so a dummy read of CHIP_ID is issued before the first real transaction.
+
+from register_definitions import CMD, CMD_SOFT_RESET, CHIP_ID_ADDRESS
+
+try:
+    from time import sleep_us   # type: ignore
+except ImportError:
+    from time import sleep
+    def sleep_us(us : int) -> None:
+        sleep(us / 1000000)
+
+
+SPI_READ_BIT = 0x80
+SPI_ADDRESS_MASK = 0x7F
+SOFT_RESET_DELAY_US = 2000
+
+
+class SPITransport(object):
+    """
+    The "addr" arguments are ignored (the chip select picks the device). Transfers are allocation-free for readfrom_mem_into / writeto_mem:
+    the header and dummy byte use preallocated buffers and the payload is read into / written from the caller's buffer directly.
+    """
+    def __init__(self, spi, cs) -> None:
+        self.spi = spi
+        self.cs = cs
+        self.header : bytearray = bytearray(1)
+        self.dummy : bytearray = bytearray(1)
+        self.spi_mode : bool = False
+
+        self.cs.value(1)
+
+        return None
+
+
+    def EnableSPI(self) -> None:
+        """
+        Dummy read: the rising edge of CSB at its end latches the interface into SPI mode.
+        """
+        self.spi_mode = True
+        self.readfrom_mem_into(0, CHIP_ID_ADDRESS, self.dummy)
+
+        return None
+
+
+    def readfrom_mem_into(self, addr : int, memaddr : int, buf, addrsize : int = 8) -> None:
+        if(not self.spi_mode):
+            self.EnableSPI()
+
+        self.header[0] = (memaddr & SPI_ADDRESS_MASK) | SPI_READ_BIT
+        self.cs.value(0)
+        try:
+            self.spi.write(self.header)
+            self.spi.readinto(self.dummy)
+            self.spi.readinto(buf)
+        finally:
+            self.cs.value(1)
+
+        return None
+
+
+    def readfrom_mem(self, addr : int, memaddr : int, nbytes : int, addrsize : int = 8) -> bytes:
+        buf : bytearray = bytearray(nbytes)
+        self.readfrom_mem_into(addr, memaddr, buf)
+        return bytes(buf)
+
+
+    def writeto_mem(self, addr : int, memaddr : int, buf, addrsize : int = 8) -> None:
+        if(not self.spi_mode):
+            self.EnableSPI()
+
+        self.header[0] = memaddr & SPI_ADDRESS_MASK
+        self.cs.value(0)
+        try:
+            self.spi.write(self.header)
+            self.spi.write(buf)
+        finally:
+            self.cs.value(1)
+
+        if((memaddr == CMD) and len(buf) and (buf[0] == CMD_SOFT_RESET)):
+            # back in I2C mode after the reset, switch again on the next access
+            self.spi_mode = False
+            sleep_us(SOFT_RESET_DELAY_US)
+
+        return None
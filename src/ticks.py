@@ -0,0 +1,18 @@
+# -------------------------------------------------
+# MICROSECOND TICKS
+# -------------------------------------------------
+# time.ticks_us / time.ticks_diff / time.ticks_add on MicroPython, perf_counter based equivalents on CPython.
+
+try:
+    from time import ticks_us, ticks_diff, ticks_add   # type: ignore
+except ImportError:
+    from time import perf_counter_ns
+
+    def ticks_us() -> int:
+        return perf_counter_ns() // 1000
+
+    def ticks_diff(new : int, old : int) -> int:
+        return new - old
+
+    def ticks_add(ticks : int, delta : int) -> int:
+        return ticks + delta
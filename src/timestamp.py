@@ -0,0 +1,48 @@
+# -------------------------------------------------
+# SENSOR TIME
+# -------------------------------------------------
+
+from register_definitions import SENSORTIME_MASK, SENSORTIME_RESOLUTION
+
+
+class SensorClock(object):
+    """
+    Turns successive readings of the 24-bit SENSORTIME counter (39.0625 us per LSB, wraps every ~655 s) into the real
+    time step between them. A single wraparound between two readings is handled, longer gaps cannot be told apart.
+    """
+    def __init__(self, default_dt : float = 0.01) -> None:
+        self.default_dt : float = default_dt
+        self.Reset()
+
+        return None
+
+
+    def Reset(self) -> None:
+        self.last_time = None
+        self.dt : float = self.default_dt
+        self.elapsed : float = 0.0
+
+        return None
+
+
+    def Ticks(self, new_time : int, old_time : int) -> int:
+        """
+        Returns the number of SENSORTIME ticks from "old_time" to "new_time", accounting for the 24-bit wraparound.
+        """
+        return ((new_time - old_time) & SENSORTIME_MASK)
+
+
+    def Update(self, sensor_time : int) -> float:
+        """
+        Records a new SENSORTIME reading and returns the time in seconds since the previous one ("default_dt" for the first reading).
+        """
+        if(self.last_time is None):
+            self.last_time = sensor_time
+            self.dt = self.default_dt
+            return self.dt
+
+        self.dt = self.Ticks(sensor_time, self.last_time) * SENSORTIME_RESOLUTION
+        self.last_time = sensor_time
+        self.elapsed += self.dt
+
+        return self.dt
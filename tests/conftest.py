@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pytest
+
+# The driver modules import each other flat (as they do on the board), so the tests run against src/ directly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from simulator import VirtualI2C, VirtualBMI270      # noqa: E402
+from BMI270 import BMI270                           # noqa: E402
+
+
+class ManualClock(object):
+    """
+    Clock for VirtualBMI270: time only moves when a test advances it, so the number of FIFO frames is exact.
+    """
+    def __init__(self) -> None:
+        self.t : float = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+    def Advance(self, seconds : float) -> None:
+        self.t += seconds
+
+
+def StillMotion(t : float) -> tuple:
+    # slightly tilted and turning slowly, so every axis carries a distinct non-zero value
+    return ((0.02, 0.03, 1.0), (1.0, -2.0, 3.0))
+
+
+@pytest.fixture
+def clock() -> ManualClock:
+    return ManualClock()
+
+
+@pytest.fixture
+def device(clock) -> VirtualBMI270:
+    return VirtualBMI270(configured=True, motion=StillMotion, clock=clock)
+
+
+@pytest.fixture
+def bus(device) -> VirtualI2C:
+    return VirtualI2C(device)
+
+
+@pytest.fixture
+def sensor(bus) -> BMI270:
+    sensor = BMI270(bus)
+    bus.ResetCounters()
+    return sensor
+
+
+@pytest.fixture
+def shadowed(bus) -> BMI270:
+    sensor = BMI270(bus, shadow=True)
+    bus.ResetCounters()
+    return sensor
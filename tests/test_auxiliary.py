@@ -0,0 +1,54 @@
+from array import array
+from struct import pack
+
+import pytest
+
+from auxiliary import Magnetometer, BMM150, BMM150_RESOLUTION, BMM150_SETUP, BMM150_DATA_X
+from simulator import VirtualI2C, VirtualBMI270, VirtualBMM150
+from IMU import IMU
+from register_definitions import *
+from conftest import StillMotion
+
+
+FIELD = (20.0, -7.5, -40.0)     # uT, BMI270 frame
+
+
+def Decode(magnetometer, x : int, y : int, z : int) -> tuple:
+    """
+    Decodes raw BMM150 axis values (13 / 13 / 15-bit) through "magnetometer".
+    """
+    mag_data = array('f', (0, 0, 0))
+    magnetometer.DecodeInto(pack('<3hH', x << 3, y << 3, z << 1, 0), 0, mag_data)
+    return tuple(mag_data)
+
+
+def test_bmm150_default_mounting_flips_y_and_z():
+    assert Decode(BMM150(), 100, 200, -300) == pytest.approx((100 * BMM150_RESOLUTION, -200 * BMM150_RESOLUTION, 300 * BMM150_RESOLUTION))
+
+
+def test_custom_axes_and_signs():
+    magnetometer = BMM150(axes=(1, 0, 2), signs=(1, -1, 1))
+
+    assert Decode(magnetometer, 100, 200, -300) == pytest.approx((200 * BMM150_RESOLUTION, -100 * BMM150_RESOLUTION, -300 * BMM150_RESOLUTION))
+
+
+@pytest.mark.parametrize('axes, signs', (((0, 1, 1), (1, 1, 1)), ((0, 1, 2), (1, 0, 1))))
+def test_invalid_mounting_is_rejected(axes, signs):
+    with pytest.raises(ValueError):
+        Magnetometer('BMM150', 0x10, BMM150_SETUP, BMM150_DATA_X, 8, BMM150_RESOLUTION, axes, signs)
+
+
+@pytest.mark.parametrize('axes, signs', ((None, None), ((2, 0, 1), (-1, 1, -1))))
+def test_imu_reads_the_field_in_the_bmi270_frame(clock, axes, signs):
+    magnetometer = VirtualBMM150(field=(lambda t: FIELD), axes=axes, signs=signs)
+    device = VirtualBMI270(configured=True, motion=StillMotion, clock=clock, aux_device=magnetometer)
+    imu = IMU(serial_device=VirtualI2C(device))
+    if(axes is None):
+        imu.EnableMagnetometer()
+    else:
+        imu.EnableMagnetometer(BMM150(axes=axes, signs=signs))
+
+    clock.Advance(0.1)
+    imu.UpdateAccelerometer()
+
+    assert tuple(imu.mag_data) == pytest.approx(FIELD, abs=BMM150_RESOLUTION)
@@ -0,0 +1,100 @@
+from itertools import count
+
+import pytest
+
+import calibration
+from calibration import PerformFOC, ApplyCalibration, SaveCalibration, LoadCalibration
+from simulator import VirtualI2C, VirtualBMI270
+from BMI270 import BMI270
+from register_definitions import *
+
+
+ACC_BIAS = (0.05, -0.03, 0.02)      # g
+GYR_BIAS = (3.0, -1.5, 0.7)         # deg/s
+
+
+def Level(t : float) -> tuple:
+    return ((0.0, 0.0, 1.0), (0.0, 0.0, 0.0))
+
+
+def Biased(clock) -> BMI270:
+    """
+    A sensor lying level (Z up) on a device with zero-g / zero-rate errors, both sensors enabled.
+    """
+    device = VirtualBMI270(configured=True, motion=Level, clock=clock)
+    device.acc_bias = ACC_BIAS
+    device.gyr_bias = GYR_BIAS
+    sensor = BMI270(VirtualI2C(device))
+    sensor.WriteRegister(PWR_CTRL, BIT_1 | BIT_2)
+    return sensor
+
+
+@pytest.fixture
+def calibrated(clock, monkeypatch) -> BMI270:
+    monkeypatch.setattr(calibration, 'sleep_ms', lambda ms: clock.Advance(ms / 1000))      # the FIFO fills while CollectStationary waits
+    return Biased(clock)
+
+
+def Corrected(sensor, clock) -> tuple:
+    clock.Advance(0.02)
+    (acc, gyr) = sensor.ReadAllData()[:2]
+    return (tuple(value / GRAVITY for value in acc), tuple(gyr))
+
+
+def test_foc_cancels_the_bias(calibrated, clock):
+    assert all((abs(value) > 0.5) for value in Corrected(calibrated, clock)[1])      # biased before the FOC
+    result = PerformFOC(calibrated)
+
+    assert result['acc_offset'] == [round(-bias / ACC_OFFSET_RESOLUTION) for bias in ACC_BIAS]
+    assert result['gyr_offset'] == [round(-bias / GYR_OFFSET_RESOLUTION) for bias in GYR_BIAS]
+    assert calibrated.ReadOffsets() == (tuple(result['acc_offset']), tuple(result['gyr_offset']))
+    (acc, gyr) = Corrected(calibrated, clock)
+    assert acc == pytest.approx((0.0, 0.0, 1.0), abs=2 * ACC_OFFSET_RESOLUTION)
+    assert gyr == pytest.approx((0.0, 0.0, 0.0), abs=2 * GYR_OFFSET_RESOLUTION)
+
+
+def test_foc_restores_the_fifo_configuration(calibrated):
+    fifo_config = calibrated.ReadRegisters(FIFO_CONFIG_0, 2)
+    PerformFOC(calibrated)
+
+    assert calibrated.ReadRegisters(FIFO_CONFIG_0, 2) == fifo_config
+    assert calibrated.ReadFIFOLength() == 0
+
+
+def test_saved_calibration_survives_a_reset(calibrated, clock, tmp_path):
+    path = str(tmp_path / 'bmi270.json')
+    SaveCalibration(PerformFOC(calibrated), path)
+    reset = Biased(clock)
+
+    ApplyCalibration(reset, LoadCalibration(path))
+
+    (acc, gyr) = Corrected(reset, clock)
+    assert acc == pytest.approx((0.0, 0.0, 1.0), abs=2 * ACC_OFFSET_RESOLUTION)
+    assert gyr == pytest.approx((0.0, 0.0, 0.0), abs=2 * GYR_OFFSET_RESOLUTION)
+
+
+def test_invalid_calibration_file(tmp_path):
+    (tmp_path / 'bad.json').write_text('{"acc_offset": [1, 2]}')
+
+    with pytest.raises(ValueError):
+        LoadCalibration(str(tmp_path / 'bad.json'))
+
+
+@pytest.mark.parametrize('fixture', ('sensor', 'shadowed'))
+def test_failed_foc_restores_the_previous_offsets(request, fixture, monkeypatch):
+    sensor = request.getfixturevalue(fixture)
+    ApplyCalibration(sensor, {'acc_offset' : [1, -2, 3], 'gyr_offset' : [-4, 5, 300]})
+    sensor.Configure(gyr_gain_en=1)
+    before = (sensor.ReadRegisters(OFFSET_0, OFFSET_LENGTH), sensor.ReadRegister(NV_CONF))
+    ticks = count(0, 1000)      # 1 ms per poll
+    monkeypatch.setattr(calibration, 'sleep_ms', lambda ms: None)       # the FIFO never fills
+    monkeypatch.setattr(calibration, 'ticks_us', lambda: next(ticks))
+
+    with pytest.raises(OSError):
+        PerformFOC(sensor, timeout_ms=50)
+
+    sensor.InvalidateShadow()
+    assert (sensor.ReadRegisters(OFFSET_0, OFFSET_LENGTH), sensor.ReadRegister(NV_CONF)) == before
+    assert sensor.ReadOffsets() == ((1, -2, 3), (-4, 5, 300))
+    assert before[0][6] & (BIT_6 | BIT_7) == (BIT_6 | BIT_7)
+    assert before[1] & BIT_3
@@ -0,0 +1,61 @@
+import pytest
+
+from simulator import SimulatedPin
+from register_definitions import *
+
+
+@pytest.fixture
+def pin(device) -> SimulatedPin:
+    pin = SimulatedPin()
+    device.ConnectPin(1, pin)
+    return pin
+
+
+def test_step_watermark_raises_the_interrupt_per_multiple(sensor, device, pin):
+    sensor.EnableStepCounter(watermark=(2 * STEP_WATERMARK_RESOLUTION))
+    sensor.MapFeatureInterrupt(INT_PIN_1, step_counter=True)
+
+    device.AddSteps(39)
+    assert pin.edges == 0
+    assert not (sensor.ReadInterruptStatus() & INT_STATUS_STEP_COUNTER)
+
+    device.AddSteps(1)
+    assert pin.edges == 1
+    assert sensor.ReadInterruptStatus() & INT_STATUS_STEP_COUNTER
+
+    device.AddSteps(45)         # crosses 80 once
+    assert pin.edges == 2
+    assert sensor.ReadStepCount() == 85
+
+
+def test_step_detector_raises_the_interrupt_per_step(sensor, device, pin):
+    sensor.EnableStepCounter(detector=True)
+    sensor.MapFeatureInterrupt(INT_PIN_1, step_counter=True)
+
+    for _ in range(3):
+        device.AddSteps(1)
+
+    assert pin.edges == 3
+    assert sensor.ReadStepCount() == 3
+
+
+def test_step_watermark_must_be_a_multiple_of_the_resolution(sensor):
+    with pytest.raises(ValueError):
+        sensor.EnableStepCounter(watermark=(STEP_WATERMARK_RESOLUTION + 1))
+
+
+def test_step_counter_reset(sensor, device):
+    sensor.EnableStepCounter()
+    device.AddSteps(12)
+    assert sensor.ReadStepCount() == 12
+
+    sensor.ResetStepCounter()
+    assert sensor.ReadStepCount() == 0
+
+
+def test_unmapped_steps_do_not_fire_the_pin(sensor, device, pin):
+    sensor.EnableStepCounter(watermark=STEP_WATERMARK_RESOLUTION)
+    device.AddSteps(STEP_WATERMARK_RESOLUTION)
+
+    assert pin.edges == 0
+    assert sensor.ReadInterruptStatus() & INT_STATUS_STEP_COUNTER
@@ -0,0 +1,150 @@
+from struct import pack
+
+import pytest
+
+from fifo import ParseFIFO, AssignFrameTimes
+from register_definitions import *
+
+
+def Vector(x : int, y : int, z : int) -> bytes:
+    return pack('<3h', x, y, z)
+
+
+def test_headered_round_trip_stops_at_over_read():
+    data = (bytes((FIFO_HEADER_REGULAR | FIFO_HEADER_GYR | FIFO_HEADER_ACC,)) + Vector(1, 2, 3) + Vector(4, 5, 6)
+            + bytes((FIFO_HEADER_REGULAR | FIFO_HEADER_ACC,)) + Vector(7, 8, 9)
+            + bytes((FIFO_HEADER_SKIP, 2))
+            + bytes((FIFO_HEADER_SENSORTIME, 0x01, 0x02, 0x03))
+            + bytes((FIFO_HEADER_CONFIG, 1, 2, 3, 4))
+            + bytes((FIFO_HEADER_EMPTY, 0x00))
+            + bytes((FIFO_HEADER_REGULAR | FIFO_HEADER_ACC,)) + Vector(-1, -1, -1))     # past the over-read frame, never parsed
+
+    frames = list(ParseFIFO(data))
+
+    assert [frame.kind for frame in frames] == [FIFO_FRAME_DATA, FIFO_FRAME_DATA, FIFO_FRAME_SKIP, FIFO_FRAME_SENSORTIME, FIFO_FRAME_CONFIG]
+    assert (frames[0].gyr, frames[0].acc) == ((1, 2, 3), (4, 5, 6))
+    assert (frames[1].gyr, frames[1].acc) == (None, (7, 8, 9))
+    assert frames[2].value == 2
+    assert frames[3].value == 0x030201
+    assert frames[4].value == bytes((1, 2, 3, 4))
+
+
+def test_headered_truncated_frame_is_dropped():
+    data = bytes((FIFO_HEADER_REGULAR | FIFO_HEADER_ACC,)) + Vector(1, 2, 3) + bytes((FIFO_HEADER_REGULAR | FIFO_HEADER_ACC, 0x01))
+
+    frames = list(ParseFIFO(data))
+
+    assert len(frames) == 1
+    assert frames[0].acc == (1, 2, 3)
+
+
+def test_interrupt_tag_bits_are_ignored():
+    data = bytes((FIFO_HEADER_REGULAR | FIFO_HEADER_ACC | 0x03,)) + Vector(1, 2, 3)
+
+    assert list(ParseFIFO(data))[0].acc == (1, 2, 3)
+
+
+def test_headerless_dummy_and_over_read_frames():
+    data = (Vector(1, 2, 3) + Vector(4, 5, 6)
+            + pack('<Hhh', FIFO_GYR_DUMMY, 0, 0) + Vector(7, 8, 9)
+            + pack('<H', FIFO_OVER_READ) + bytes(10))
+
+    frames = list(ParseFIFO(data, header=False, acc=True, gyr=True))
+
+    assert len(frames) == 2
+    assert (frames[0].gyr, frames[0].acc) == ((1, 2, 3), (4, 5, 6))
+    assert (frames[1].gyr, frames[1].acc) == (None, (7, 8, 9))
+
+
+def test_simulated_fifo_round_trip(shadowed, device, clock):
+    shadowed.Configure(acc_odr=ACC_ODR_100, gyr_odr=GYR_ODR_100)
+    shadowed.ConfigureFIFO()
+    shadowed.FlushFIFO()
+    device.Update()
+    clock.Advance(0.1)
+
+    frames = shadowed.ReadFIFOBatch()
+    data = [frame for frame in frames if(frame.kind == FIFO_FRAME_DATA)]
+    (acc, gyr) = device.motion(0.0)
+
+    assert len(data) == 10
+    assert frames[-1].kind == FIFO_FRAME_SENSORTIME
+    assert all(pack('<3h', *frame.acc) == device.EncodeAccelerometer(acc) for frame in data)
+    assert all(pack('<3h', *frame.gyr) == device.EncodeGyroscope(gyr) for frame in data)
+    assert shadowed.ReadFIFOLength() == 0
+
+
+def test_simulated_over_read_is_padded_and_ignored(shadowed, device, clock):
+    shadowed.Configure(acc_odr=ACC_ODR_100, gyr_odr=GYR_ODR_100)
+    shadowed.ConfigureFIFO(sensortime=False)
+    shadowed.FlushFIFO()
+    device.Update()
+    clock.Advance(0.05)
+    device.Update()
+
+    length = shadowed.ReadFIFOLength()
+    data = shadowed.ReadFIFOData(length + 8)
+
+    assert data[length:] == bytes((FIFO_HEADER_EMPTY, 0x00)) * 4
+    assert len(list(ParseFIFO(data))) == 5
+
+
+def test_downsampled_frame_times(shadowed, device, clock):
+    shadowed.Configure(acc_odr=ACC_ODR_1600, gyr_odr=GYR_ODR_1600)
+    shadowed.ConfigureFIFO(acc_downsampling=4, gyr_downsampling=4)
+    shadowed.FlushFIFO()
+    device.Update()
+    clock.Advance(0.1)
+
+    frames = shadowed.ReadFIFOBatch(timestamps=True)
+    data = [frame for frame in frames if(frame.kind == FIFO_FRAME_DATA)]
+    ticks_per_frame = round(1 / (400 * SENSORTIME_RESOLUTION))
+
+    assert shadowed.FIFORates() == (400, 400)
+    assert len(data) == 40
+    assert data[-1].time == frames[-1].value
+    assert all((((later.time - earlier.time) & SENSORTIME_MASK) == ticks_per_frame) for (earlier, later) in zip(data, data[1:]))
+
+
+def test_frame_times_need_a_sensortime_frame():
+    frames = list(ParseFIFO(bytes((FIFO_HEADER_REGULAR | FIFO_HEADER_ACC,)) + Vector(1, 2, 3)))
+
+    assert AssignFrameTimes(frames, 100.0) == 0
+    assert frames[0].time is None
+
+
+def FIFOImu(bus, sensortime : bool = True):
+    from IMU import IMU
+
+    imu = IMU(serial_device=bus)
+    imu.BMI270.Configure(acc_odr=ACC_ODR_100, gyr_odr=GYR_ODR_100)
+    imu.BMI270.ConfigureFIFO(sensortime=sensortime)
+    imu.BMI270.FlushFIFO()
+    return imu
+
+
+def test_fifo_drain_time_step_follows_sensortime(bus, device, clock, monkeypatch):
+    imu = FIFOImu(bus)
+    # sensor oscillator 2 % fast: 100 Hz in host time is 98 Hz in sensortime
+    monkeypatch.setattr(device, 'SensorTime', lambda now: int(1.02 * (now - device.start_time) / SENSORTIME_RESOLUTION) & SENSORTIME_MASK)
+    device.Update()
+
+    clock.Advance(0.1)
+    assert imu.UpdateFIFO() == 10
+    assert imu.dt == 0.01       # first drain: nominal rate
+
+    clock.Advance(0.2)
+    assert imu.UpdateFIFO() == 20
+    assert imu.dt == pytest.approx(0.0102, abs=SENSORTIME_RESOLUTION)
+    assert imu.sensor_time == imu.clock.last_time
+
+
+def test_fifo_drain_without_sensortime_uses_the_nominal_rate(bus, device, clock):
+    imu = FIFOImu(bus, sensortime=False)
+    device.Update()
+
+    for seconds in (0.1, 0.2):
+        clock.Advance(seconds)
+        imu.UpdateFIFO()
+        assert imu.dt == 0.01
+    assert imu.clock.last_time is None
@@ -0,0 +1,94 @@
+import math
+import pytest
+from array import array
+
+from filter import Fusion
+from IMU import IMU
+
+
+ACC = (0.02, 0.03, 1.0)
+GYR = (1.0, -2.0, 3.0)
+
+
+def test_yaw_starts_at_zero():
+    assert Fusion().yaw == 0
+    assert Fusion(allocation_free=True).yaw == 0
+
+
+def test_update_into_refreshes_yaw_like_update():
+    reference = Fusion()
+    fusion = Fusion(allocation_free=True)
+    for _ in range(50):
+        reference.update(ACC, GYR, 0.01)
+        fusion.update_into(array('f', ACC), array('f', GYR), 0.01)
+
+    assert fusion.yaw != 0
+    assert fusion.yaw == pytest.approx(reference.yaw, abs=1e-5)
+
+
+def test_imu_keeps_filter_yaw_current(bus, clock):
+    imu = IMU(serial_device=bus)
+    for _ in range(20):
+        clock.Advance(0.01)
+        imu.UpdateAccelerometer()
+
+    assert imu.filter.yaw == pytest.approx(imu.filter.update_yaw())
+
+
+def test_update_into_keeps_double_precision():
+    reference = Fusion()
+    fusion = Fusion(allocation_free=True)
+    (acc, gyr) = (array('d', ACC), array('d', GYR))
+    for _ in range(200):
+        reference.update(ACC, GYR, 0.01)
+        fusion.update_into(acc, gyr, 0.01)
+
+    assert fusion.q.typecode == 'd'
+    assert tuple(fusion.q) == pytest.approx(reference.q, abs=1e-12)
+
+
+def test_update_into_after_update_converts_once():
+    fusion = Fusion()
+    fusion.update(ACC, GYR, 0.01)
+    fusion.update_into(array('f', ACC), array('f', GYR), 0.01)
+    q = fusion.q
+    fusion.update_into(array('f', ACC), array('f', GYR), 0.01)
+
+    assert (q.typecode == 'd') and (fusion.q is q)
+
+
+def Motion(count : int) -> tuple:
+    acc = [(0.1 * math.sin(n / 9), 0.05 * math.cos(n / 13), 1.0) for n in range(count)]
+    gyr = [(10 * math.sin(n / 7), -5.0, 20 * math.cos(n / 11)) for n in range(count)]
+    acc[count // 2] = (0.0, 0.0, 0.0)       # skipped sample
+    return (acc, gyr)
+
+
+@pytest.mark.parametrize('allocation_free', (False, True))
+def test_update_batch_matches_a_sequence_of_updates(allocation_free):
+    (acc, gyr) = Motion(100)
+    dts = [0.01 + 0.0001 * (n % 5) for n in range(100)]
+    reference = Fusion()
+    for (a, g, dt) in zip(acc, gyr, dts):
+        reference.update(a, g, dt)
+
+    fusion = Fusion(allocation_free=allocation_free)
+    (q, path) = fusion.update_batch(acc, gyr, dts, trajectory=True)
+
+    assert tuple(q) == pytest.approx(reference.q, abs=1e-12)
+    assert fusion.yaw == pytest.approx(reference.yaw, abs=1e-12)
+    assert len(path) == 100
+    assert path[50] == path[49]
+    assert tuple(path[-1]) == pytest.approx(reference.q, abs=1e-12)
+
+
+def test_update_batch_accepts_numpy_blocks_and_a_scalar_dt():
+    np = pytest.importorskip('numpy')
+    (acc, gyr) = Motion(64)
+    reference = Fusion()
+    for (a, g) in zip(acc, gyr):
+        reference.update(a, g, 0.005)
+
+    q = Fusion().update_batch(np.array(acc), np.array(gyr), 0.005)
+
+    assert tuple(q) == pytest.approx(reference.q, abs=1e-12)
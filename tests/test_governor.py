@@ -0,0 +1,102 @@
+import pytest
+
+import governor
+from governor import SOURCE_FEATURES, MOTION_STATUS
+from simulator import SimulatedPin
+from IMU import IMU
+from register_definitions import *
+
+
+@pytest.fixture
+def imu(bus, clock, monkeypatch):
+    monkeypatch.setattr(governor, 'ticks_us', lambda: int(clock.t * 1000000))
+    return IMU(serial_device=bus)
+
+
+def Step(imu, clock, rate : float, seconds : float = 0.01) -> str:
+    """
+    One governor update "seconds" after the last one, with the IMU's latest sample turning at "rate" deg/s.
+    """
+    clock.Advance(seconds)
+    imu.acc_data = (0.0, 0.0, GRAVITY)
+    imu.gyro_data = (0.0, 0.0, rate)
+    return imu.governor.Update()
+
+
+def Hold(imu, clock, rate : float, seconds : float) -> str:
+    for _ in range(round(seconds / 0.01)):
+        mode = Step(imu, clock, rate)
+    return mode
+
+
+def test_performance_is_left_below_the_exit_level(imu, clock):
+    imu.EnableGovernor(smoothing=1.0, active_level=60.0, hysteresis=0.5, dwell_time=0.0)
+
+    assert Step(imu, clock, 70.0) == PERFORMANCE_MODE
+    assert Hold(imu, clock, 40.0, 1.0) == PERFORMANCE_MODE      # between the exit (30) and enter (60) levels
+    assert Step(imu, clock, 20.0) == NORMAL_MODE
+    assert Step(imu, clock, 40.0) == NORMAL_MODE
+
+
+def test_low_power_is_left_above_the_exit_level(imu, clock):
+    imu.EnableGovernor(smoothing=1.0, idle_level=3.0, hysteresis=0.5, idle_time=0.5, dwell_time=0.0)
+
+    assert Hold(imu, clock, 0.5, 0.4) == NORMAL_MODE
+    assert Hold(imu, clock, 0.5, 0.2) == LOW_POWER_MODE
+    assert Hold(imu, clock, 5.0, 1.0) == LOW_POWER_MODE          # between the enter (3) and exit (6) levels
+    assert Step(imu, clock, 7.0) == NORMAL_MODE
+
+
+def test_stepping_down_waits_for_the_dwell_time(imu, clock):
+    gov = imu.EnableGovernor(smoothing=1.0, dwell_time=1.0)
+
+    assert Step(imu, clock, 70.0) == PERFORMANCE_MODE
+    assert Hold(imu, clock, 10.0, 0.9) == PERFORMANCE_MODE
+    assert Hold(imu, clock, 10.0, 0.2) == NORMAL_MODE
+    assert gov.transitions == 2
+
+
+def test_waking_up_ignores_the_dwell_time(imu, clock):
+    gov = imu.EnableGovernor(smoothing=1.0, dwell_time=10.0)
+    gov.SetMode(LOW_POWER_MODE)
+
+    assert Step(imu, clock, 70.0) == PERFORMANCE_MODE
+    assert imu.sample_rate == gov.profiles[PERFORMANCE_MODE]['sample_rate']
+
+
+def test_motion_status_is_rate_limited_without_a_pin(imu, clock, monkeypatch):
+    gov = imu.EnableGovernor(source=SOURCE_FEATURES, status_period=0.5)
+    reads = []
+    take = imu.BMI270.TakeInterruptStatus
+    monkeypatch.setattr(imu.BMI270, 'TakeInterruptStatus', lambda mask: reads.append(mask) or take(mask))
+
+    Hold(imu, clock, 0.0, 2.0)
+
+    assert reads == [MOTION_STATUS] * 4
+    assert gov.mode == NORMAL_MODE
+
+
+def test_motion_status_follows_the_feature_pin(imu, device, clock, monkeypatch):
+    pin = SimulatedPin()
+    device.ConnectPin(2, pin)
+    imu.EnableGovernor(source=SOURCE_FEATURES, pin=pin, interrupt_pin=INT_PIN_2)
+    reads = []
+    take = imu.BMI270.TakeInterruptStatus
+    monkeypatch.setattr(imu.BMI270, 'TakeInterruptStatus', lambda mask: reads.append(mask) or take(mask))
+
+    Hold(imu, clock, 0.0, 1.0)
+    assert reads == []
+
+    device.registers[INT_STATUS_0] |= INT_STATUS_NO_MOTION
+    pin.Fire()
+    assert Step(imu, clock, 0.0) == LOW_POWER_MODE
+    assert len(reads) == 1
+
+
+def test_take_interrupt_status_keeps_the_other_bits(sensor, device):
+    device.registers[INT_STATUS_0] |= INT_STATUS_NO_MOTION | INT_STATUS_STEP_COUNTER
+    device.registers[INT_STATUS_1] |= BIT_7
+
+    assert sensor.TakeInterruptStatus(MOTION_STATUS) == INT_STATUS_NO_MOTION
+    assert sensor.TakeInterruptStatus(MOTION_STATUS) == 0
+    assert sensor.ReadInterruptStatus() == (INT_STATUS_STEP_COUNTER | (BIT_7 << 8))
@@ -0,0 +1,112 @@
+import select
+
+import pytest
+
+from simulator import SimulatedPin
+from interrupts import InterruptFlag, EventPin
+from IMU import IMU
+from register_definitions import *
+
+
+@pytest.fixture
+def imu(bus):
+    return IMU(serial_device=bus)
+
+
+@pytest.fixture
+def pin(device) -> SimulatedPin:
+    pin = SimulatedPin()
+    device.ConnectPin(1, pin)
+    return pin
+
+
+def test_data_ready_polls_once_per_edge(imu, device, clock, pin):
+    imu.EnableInterrupt(pin)
+    device.Update()
+    imu.Poll()
+
+    clock.Advance(0.01)
+    device.Update()
+
+    assert pin.edges > 0
+    assert imu.Poll()
+    assert not imu.Poll()
+
+
+def test_no_edge_no_read(imu, device, bus, pin):
+    imu.EnableInterrupt(pin)
+    imu.Poll()
+    bus.ResetCounters()
+
+    assert not imu.Poll()
+    assert bus.transactions == 0
+
+
+def test_watermark_drains_the_fifo(imu, device, clock, pin):
+    frame = 1 + FIFO_ACC_LENGTH + FIFO_GYR_LENGTH
+    imu.EnableInterrupt(pin, watermark=(10 * frame))
+    device.Update()
+    imu.Poll()
+
+    clock.Advance(0.05)         # 5 frames at 100 Hz: below the watermark
+    device.Update()
+    assert not imu.Poll()
+
+    clock.Advance(0.06)
+    device.Update()
+    assert imu.Poll()
+    assert imu.BMI270.ReadFIFOLength() == 0
+    assert not imu.Poll()
+
+
+def test_active_low_flag_registers_a_falling_edge():
+    pin = EventPin()
+    flag = InterruptFlag(pin, active_high=False)
+
+    assert pin.trigger == EventPin.IRQ_FALLING
+    pin.Fire()
+    assert flag.Clear() == 1
+
+
+def test_set_handler_keeps_the_trigger():
+    pin = EventPin()
+    flag = InterruptFlag(pin, active_high=False)
+    flag.SetHandler(lambda source: None)
+
+    assert pin.trigger == EventPin.IRQ_FALLING
+
+
+class Stop(Exception):
+    pass
+
+
+class OnePoll(object):
+    """
+    select.poll stand-in reporting one GPIO edge, then stopping the watcher loop.
+    """
+    def __init__(self) -> None:
+        self.polls : int = 0
+
+    def register(self, source, events) -> None:
+        pass
+
+    def poll(self, timeout = None) -> list:
+        self.polls += 1
+        if(self.polls > 1):
+            raise Stop()
+        return [(0, select.POLLPRI)]
+
+
+@pytest.mark.parametrize('level, trigger, fires', ((b'0', EventPin.IRQ_FALLING, True), (b'1', EventPin.IRQ_FALLING, False),
+                                                   (b'1', EventPin.IRQ_RISING, True), (b'0', EventPin.IRQ_RISING, False)))
+def test_gpio_watcher_follows_the_trigger(tmp_path, monkeypatch, level, trigger, fires):
+    gpio = tmp_path / 'value'
+    gpio.write_bytes(level + b'\n')
+    monkeypatch.setattr(select, 'poll', OnePoll)
+    pin = EventPin()
+    flag = InterruptFlag(pin, active_high=(trigger == EventPin.IRQ_RISING))
+
+    with pytest.raises(Stop):
+        pin.WatchGPIO(str(gpio))
+
+    assert flag.Clear() == int(fires)
@@ -0,0 +1,110 @@
+import pytest
+
+from simulator import FakeI2CDev
+from linux_i2c import LinuxI2C, I2C_FUNCS, I2C_RDWR, I2C_SMBUS, I2C_SLAVE, I2C_FUNC_I2C, I2C_SMBUS_BLOCK_MAX
+from BMI270 import BMI270
+from register_definitions import *
+
+
+SMBUS_ONLY = 0x0EFF000D & ~I2C_FUNC_I2C     # adapter without plain I2C transfers
+
+
+@pytest.fixture
+def combined(bus):
+    kernel = FakeI2CDev(bus)
+    return (LinuxI2C(fd=kernel.fd, ioctl=kernel.ioctl), kernel)
+
+
+@pytest.fixture
+def smbus(bus):
+    kernel = FakeI2CDev(bus, SMBUS_ONLY)
+    return (LinuxI2C(fd=kernel.fd, ioctl=kernel.ioctl), kernel)
+
+
+def test_functionality_selects_the_transfer(combined, smbus):
+    assert combined[0].combined and (combined[0].max_write is None)
+    assert (not smbus[0].combined) and (smbus[0].max_write == I2C_SMBUS_BLOCK_MAX)
+    assert combined[1].calls == {I2C_FUNCS : 1}
+
+
+def test_register_read_is_one_rdwr_ioctl(combined, bus, device):
+    (linux, kernel) = combined
+    bus.ResetCounters()
+
+    data = linux.readfrom_mem(I2C_PRIM_ADDR, DATA_REG, DATA_BURST_LENGTH)
+
+    assert data == device.ReadRegisters(DATA_REG, DATA_BURST_LENGTH)
+    assert kernel.calls[I2C_RDWR] == 1
+    assert bus.transactions == 1
+
+
+def test_read_into_fills_the_callers_buffer(combined, device):
+    (linux, _) = combined
+    buf = bytearray(2)
+
+    linux.readfrom_mem_into(I2C_PRIM_ADDR, CHIP_ID_ADDRESS, buf)
+
+    assert buf == device.ReadRegisters(CHIP_ID_ADDRESS, 2)
+
+
+def test_write_blocks_share_one_ioctl(combined, device):
+    (linux, kernel) = combined
+
+    linux.writeto_mem_blocks(I2C_PRIM_ADDR, ((FIFO_WTM_0, bytes((0x34, 0x01))), (ACC_RANGE, bytes((ACC_RANGE_8G,)))))
+
+    assert kernel.calls[I2C_RDWR] == 1
+    assert device.registers[FIFO_WTM_0:(FIFO_WTM_1 + 1)] == bytes((0x34, 0x01))
+    assert device.registers[ACC_RANGE] == ACC_RANGE_8G
+
+
+def test_smbus_read_is_split_into_blocks(smbus, device):
+    (linux, kernel) = smbus
+    length = I2C_SMBUS_BLOCK_MAX + 8
+
+    data = linux.readfrom_mem(I2C_PRIM_ADDR, CHIP_ID_ADDRESS, length)
+
+    assert data == device.ReadRegisters(CHIP_ID_ADDRESS, length)
+    assert kernel.calls[I2C_SMBUS] == 2
+    assert kernel.calls[I2C_SLAVE] == 1
+    assert I2C_RDWR not in kernel.calls
+
+
+def test_smbus_fifo_read_keeps_the_data_port(smbus, shadowed, device, clock):
+    (linux, kernel) = smbus
+    shadowed.Configure(acc_odr=ACC_ODR_100, gyr_odr=GYR_ODR_100)
+    shadowed.ConfigureFIFO(sensortime=False)
+    shadowed.FlushFIFO()
+    device.Update()
+    clock.Advance(0.1)
+    device.Update()
+    expected = bytes(device.fifo)
+    assert len(expected) > I2C_SMBUS_BLOCK_MAX
+
+    data = linux.readfrom_mem(I2C_PRIM_ADDR, FIFO_DATA, len(expected))
+
+    assert data == expected
+    assert kernel.calls[I2C_SMBUS] == -(-len(expected) // I2C_SMBUS_BLOCK_MAX)
+
+
+def test_smbus_write_continues_at_the_next_register(smbus, device):
+    (linux, _) = smbus
+    payload = bytes(range(1, I2C_SMBUS_BLOCK_MAX + 5))
+
+    linux.writeto_mem(I2C_PRIM_ADDR, ACC_CONF, payload)
+
+    assert device.registers[ACC_CONF:(ACC_CONF + len(payload))] == payload
+
+
+def test_smbus_refuses_to_split_init_data(smbus, device):
+    (linux, kernel) = smbus
+
+    with pytest.raises(ValueError):
+        linux.writeto_mem(I2C_PRIM_ADDR, INIT_DATA, bytes(I2C_SMBUS_BLOCK_MAX + 2))
+    assert I2C_SMBUS not in kernel.calls
+
+
+def test_driver_runs_over_both_transfers(combined, smbus):
+    for (linux, _) in (combined, smbus):
+        sensor = BMI270(linux)
+        assert sensor.ReadRegister(CHIP_ID_ADDRESS) == CHIP_ID
+        assert sensor.ReadRegister(INTERNAL_STATUS) & FIRST_3_BITS == 0x01
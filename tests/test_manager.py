@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from simulator import VirtualI2C, VirtualBMI270
+from manager import SensorManager
+from register_definitions import *
+from conftest import ManualClock, StillMotion
+
+
+class BarrierBus(VirtualI2C):
+    """
+    Every read waits until the other bus is in a read as well: sequential reads across buses time out.
+    """
+    def __init__(self, barrier, *devices) -> None:
+        VirtualI2C.__init__(self, *devices)
+        self.barrier = barrier
+
+    def readfrom_mem_into(self, addr, memaddr, buf, addrsize=8):
+        self.barrier.wait()
+        VirtualI2C.readfrom_mem_into(self, addr, memaddr, buf, addrsize)
+
+
+def Manager(buses) -> SensorManager:
+    manager = SensorManager()
+    for bus in buses:
+        for address in sorted(bus.devices):
+            manager.Add(bus, address).WriteRegister(PWR_CTRL, BIT_1 | BIT_2)
+        bus.devices[I2C_PRIM_ADDR].clock.Advance(0.1)      # samples available on the first read (one clock per bus)
+    return manager
+
+
+def Devices() -> tuple:
+    clock = ManualClock()
+    return tuple(VirtualBMI270(address, motion=StillMotion, clock=clock, configured=True) for address in (I2C_PRIM_ADDR, I2C_SEC_ADDR))
+
+
+@pytest.fixture
+def manager():
+    manager = Manager((VirtualI2C(*Devices()), VirtualI2C(*Devices())))
+    yield manager
+    manager.StopReaders()
+
+
+def test_buses_are_read_concurrently():
+    barrier = threading.Barrier(2, timeout=2.0)
+    manager = Manager((BarrierBus(barrier, *Devices()), BarrierBus(barrier, *Devices())))
+    try:
+        samples = manager.ReadAll()
+    finally:
+        manager.StopReaders()
+
+    assert all(sample is not None for sample in samples)
+    assert not barrier.broken
+
+
+def test_sequential_read_follows_the_schedule(manager):
+    samples = manager.ReadAll(parallel=False)
+
+    assert manager.readers is None
+    assert manager.schedule == [0, 2, 1, 3]
+    assert [samples[index][3] for index in manager.schedule] == sorted(sample[3] for sample in samples)
+
+
+def test_parallel_and_sequential_sets_match(manager):
+    sequential = [(tuple(acc), tuple(gyr)) for (acc, gyr, _, _) in manager.ReadAll(parallel=False)]
+    parallel = [(tuple(acc), tuple(gyr)) for (acc, gyr, _, _) in manager.ReadAll()]
+
+    assert manager.readers is not None
+    assert parallel == sequential
+    assert all((acc[2] > 0) for (acc, _) in parallel)
+
+
+def test_reader_errors_reach_the_caller(manager):
+    manager.ReadAll()
+    devices = manager.buses[1][0].devices
+    device = devices.pop(I2C_SEC_ADDR)
+
+    with pytest.raises(OSError):
+        manager.ReadAll()
+
+    devices[I2C_SEC_ADDR] = device      # the reader survived the error
+    assert all(sample is not None for sample in manager.ReadAll())
+
+
+def test_adding_a_sensor_restarts_the_readers(manager):
+    manager.ReadAll()
+    bus = VirtualI2C(VirtualBMI270(I2C_PRIM_ADDR, configured=True))
+    manager.Add(bus, I2C_PRIM_ADDR)
+
+    assert manager.readers is None
+    assert len(manager.ReadAll()) == 5
+    assert len(manager.readers) == 2
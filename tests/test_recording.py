@@ -0,0 +1,125 @@
+import math
+from array import array
+
+import pytest
+
+import convert
+import recording
+from recording import RecordWriter, RecordReader, Replay, ReplayIMU, TimeSteps
+from convert import AccelerometerScale, GyroscopeScale
+from filter import Fusion
+from IMU import IMU
+from register_definitions import *
+
+
+ACC_RANGE = 19.6133
+GYR_RANGE = 1000.0
+
+
+def Samples(count : int, first_time : int = SENSORTIME_MASK - 1000) -> list:
+    """
+    Synthetic raw samples 5 ms apart, crossing the sensortime wraparound.
+    """
+    samples = []
+    for n in range(count):
+        raw = (int(1000 * math.sin(n / 50)), 50 + (n % 7), 16384, 0, 0, int(300 * math.cos(n / 70)))
+        samples.append((raw, (first_time + (n * 128)) & SENSORTIME_MASK))
+    return samples
+
+
+def Write(path, samples : list, block_records : int = 16, change_at : int = None) -> None:
+    writer = RecordWriter(open(path, 'wb'), block_records=block_records)
+    writer.SetSettings(ACC_RANGE, GYR_RANGE, 100.0, 200.0)
+    raw = array('h', [0] * 6)
+    for (n, (values, sensor_time)) in enumerate(samples):
+        if(n == change_at):
+            writer.SetSettings(ACC_RANGE, 2 * GYR_RANGE, 100.0, 200.0)
+        raw[:] = array('h', values)
+        writer.Append(raw, sensor_time)
+    writer.Close()
+
+
+@pytest.fixture(params=('numpy', 'python'))
+def backend(request, monkeypatch):
+    if(request.param == 'python'):
+        monkeypatch.setattr(recording, 'np', None)
+        monkeypatch.setattr(convert, 'np', None)
+    elif(recording.np is None):
+        pytest.skip("NumPy not installed")
+    return request.param
+
+
+def test_records_round_trip(tmp_path, backend):
+    samples = Samples(100)
+    Write(tmp_path / 'log.bin', samples)
+
+    reader = RecordReader(str(tmp_path / 'log.bin'))
+    try:
+        assert len(reader) == 100
+        assert len(reader.blocks) == 7          # 6 full blocks of 16 and one partial block of 4
+        assert [(tuple(raw), time) for (raw, time) in reader.Samples()] == samples
+        assert reader.blocks[3][2] == samples[48][1]
+        assert reader.Find(samples[50][1]) == 3
+    finally:
+        reader.close()
+
+
+def test_settings_change_closes_the_block(tmp_path, backend):
+    Write(tmp_path / 'log.bin', Samples(40), change_at=20)
+
+    reader = RecordReader(str(tmp_path / 'log.bin'))
+    try:
+        assert [block[1] for block in reader.blocks] == [16, 4, 16, 4]
+        assert [block[4] for block in reader.blocks] == [GYR_RANGE, GYR_RANGE, 2 * GYR_RANGE, 2 * GYR_RANGE]
+    finally:
+        reader.close()
+
+
+def test_replay_matches_live_updates(tmp_path, backend):
+    samples = Samples(100)
+    Write(tmp_path / 'log.bin', samples, change_at=30)
+
+    reference = Fusion()
+    previous = None
+    for (n, (raw, sensor_time)) in enumerate(samples):
+        gyr_scale = GyroscopeScale(GYR_RANGE if (n < 30) else (2 * GYR_RANGE))
+        dt = TimeSteps((sensor_time,), previous, 1 / 200)[0]
+        reference.update(tuple(value * AccelerometerScale(ACC_RANGE) for value in raw[:3]), tuple(value * gyr_scale for value in raw[3:]), dt)
+        previous = sensor_time
+
+    reader = RecordReader(str(tmp_path / 'log.bin'))
+    try:
+        fusion = Fusion()
+        (count, acc, gyr, last_time) = Replay(reader, fusion)
+    finally:
+        reader.close()
+
+    assert count == 100
+    assert last_time == samples[-1][1]
+    assert gyr[2] == pytest.approx(samples[-1][0][5] * GyroscopeScale(2 * GYR_RANGE))
+    assert tuple(fusion.q) == pytest.approx(tuple(reference.q), abs=1e-9)
+
+
+def test_time_steps_across_the_wrap():
+    assert TimeSteps((SENSORTIME_MASK - 63, 64), default_dt=0.5) == pytest.approx([0.5, 128 * SENSORTIME_RESOLUTION])
+
+
+def test_replay_into_imu(tmp_path, bus):
+    samples = Samples(20)
+    Write(tmp_path / 'log.bin', samples)
+    imu = IMU(serial_device=bus)
+
+    reader = RecordReader(str(tmp_path / 'log.bin'))
+    try:
+        assert ReplayIMU(reader, imu) == 20
+    finally:
+        reader.close()
+    assert imu.sensor_time == samples[-1][1]
+    assert imu.acc_data[2] == pytest.approx(16384 * AccelerometerScale(ACC_RANGE), rel=1e-6)
+
+
+def test_foreign_file_is_rejected(tmp_path):
+    (tmp_path / 'other.bin').write_bytes(bytes(64))
+
+    with pytest.raises(ValueError):
+        RecordReader(str(tmp_path / 'other.bin'))
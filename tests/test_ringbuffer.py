@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+
+from ringbuffer import RingBuffer, POLICY_OVERWRITE, POLICY_BLOCK
+
+
+def Fill(ring : RingBuffer, first : int, count : int) -> None:
+    for n in range(first, first + count):
+        ring.Put((n,), n)
+
+
+def Unread(reader) -> list:
+    return [value for (data, _) in reader.Snapshot() for value in data]
+
+
+def test_overwrite_keeps_the_newest_samples():
+    ring = RingBuffer(capacity=4, width=1)
+    reader = ring.AddReader()
+    Fill(ring, 0, 6)
+
+    assert ring.Stats()['overwritten'] == 2
+    assert Unread(reader) == [2, 3, 4, 5]       # wraps: two segments
+    assert len(reader.Snapshot()) == 2
+    assert reader.dropped == 2
+
+
+def test_release_reports_samples_overwritten_during_processing():
+    ring = RingBuffer(capacity=4, width=1)
+    reader = ring.AddReader()
+    Fill(ring, 0, 4)
+    snapshot = reader.Snapshot()
+    Fill(ring, 4, 1)        # recycles the slot of sample 0 while the snapshot is in use
+
+    assert sum(len(times) for (_, times) in snapshot) == 4
+    assert reader.Release(4) == 3
+    assert reader.dropped == 1
+
+
+def test_release_is_clamped_to_the_unread_samples():
+    ring = RingBuffer(capacity=8, width=1)
+    reader = ring.AddReader()
+    Fill(ring, 0, 3)
+
+    assert reader.Release(10) == 3
+    assert reader.Available() == 0
+    assert reader.Release(-1) == 0
+    Fill(ring, 3, 2)
+    assert Unread(reader) == [3, 4]
+
+
+def test_readers_are_independent():
+    ring = RingBuffer(capacity=8, width=1)
+    fast = ring.AddReader()
+    slow = ring.AddReader()
+    Fill(ring, 0, 4)
+    fast.Release(4)
+
+    assert fast.Available() == 0
+    assert Unread(slow) == [0, 1, 2, 3]
+
+
+def test_block_rejects_after_the_timeout():
+    ring = RingBuffer(capacity=2, width=1, policy=POLICY_BLOCK, timeout_ms=5)
+    ring.AddReader()
+    Fill(ring, 0, 2)
+
+    assert not ring.Put((2,), 2)
+    stats = ring.Stats()
+    assert (stats['rejected'], stats['blocked'], stats['overwritten']) == (1, 1, 0)
+
+
+def test_block_waits_for_the_slowest_reader():
+    ring = RingBuffer(capacity=2, width=1, policy=POLICY_BLOCK, timeout_ms=2000)
+    reader = ring.AddReader()
+    Fill(ring, 0, 2)
+
+    def Consume():
+        time.sleep(0.02)
+        reader.Release(1)
+
+    consumer = threading.Thread(target=Consume)
+    consumer.start()
+    assert ring.Put((2,), 2)
+    consumer.join()
+
+    assert Unread(reader) == [1, 2]
+    assert ring.Stats()['blocked'] == 1
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        RingBuffer(policy='drop')
@@ -0,0 +1,75 @@
+import pytest
+
+from simulator import VirtualSPI, VirtualBMI270
+from spi import SPITransport, SPI_READ_BIT
+from BMI270 import BMI270
+from register_definitions import *
+
+
+class RecordingSPI(object):
+    """
+    Wraps a VirtualSPI and logs every write / readinto with the chip select level at the time.
+    """
+    def __init__(self, spi : VirtualSPI) -> None:
+        self.spi = spi
+        self.log : list = []
+
+    def write(self, buf) -> None:
+        self.log.append(('write', bytes(buf), self.spi.cs.value()))
+        self.spi.write(buf)
+
+    def readinto(self, buf, write : int = 0x00) -> None:
+        self.spi.readinto(buf, write)
+        self.log.append(('readinto', bytes(buf), self.spi.cs.value()))
+
+
+@pytest.fixture
+def spi(device) -> VirtualSPI:
+    return VirtualSPI(device)
+
+
+def test_read_discards_the_dummy_byte(spi, device):
+    recorder = RecordingSPI(spi)
+    transport = SPITransport(recorder, spi.cs)
+    transport.EnableSPI()
+    recorder.log.clear()
+
+    data = transport.readfrom_mem(0, DATA_REG, DATA_BURST_LENGTH)
+
+    assert data == device.ReadRegisters(DATA_REG, DATA_BURST_LENGTH)
+    assert [entry[0] for entry in recorder.log] == ['write', 'readinto', 'readinto']
+    assert recorder.log[0][1] == bytes((DATA_REG | SPI_READ_BIT,))
+    assert len(recorder.log[1][1]) == 1     # the dummy byte, read on its own
+    assert all(entry[2] == 0 for entry in recorder.log)
+    assert spi.cs.value() == 1
+
+
+def test_first_access_switches_to_spi(spi):
+    transport = SPITransport(spi, spi.cs)
+
+    assert transport.readfrom_mem(0, CHIP_ID_ADDRESS, 1) == bytes((CHIP_ID,))
+    assert spi.transactions == 2       # dummy CHIP_ID read latching SPI mode, then the real read
+
+
+def test_write_has_no_dummy_byte(spi, device):
+    transport = SPITransport(spi, spi.cs)
+    transport.EnableSPI()
+
+    transport.writeto_mem(0, FIFO_WTM_0, bytes((0x34, 0x01)))
+
+    assert device.registers[FIFO_WTM_0:(FIFO_WTM_1 + 1)] == bytes((0x34, 0x01))
+
+
+def test_soft_reset_goes_back_to_i2c_mode(spi, device):
+    transport = SPITransport(spi, spi.cs)
+    transport.writeto_mem(0, CMD, bytes((CMD_SOFT_RESET,)))
+
+    assert not transport.spi_mode
+    assert transport.readfrom_mem(0, CHIP_ID_ADDRESS, 1) == bytes((CHIP_ID,))
+
+
+def test_driver_over_spi_matches_i2c(spi, device, bus):
+    over_spi = BMI270(SPITransport(spi, spi.cs))
+    over_i2c = BMI270(bus)
+
+    assert over_spi.ReadAllData() == over_i2c.ReadAllData()
@@ -0,0 +1,51 @@
+import pytest
+
+from timestamp import SensorClock
+from IMU import IMU
+from register_definitions import *
+
+
+SENSORTIME_PERIOD = (SENSORTIME_MASK + 1) * SENSORTIME_RESOLUTION      # ~655.36 s
+
+
+def test_first_reading_uses_the_default_step():
+    clock = SensorClock(default_dt=0.005)
+
+    assert clock.Update(1234) == 0.005
+    assert clock.Update(1234 + 256) == pytest.approx(256 * SENSORTIME_RESOLUTION)
+
+
+def test_wraparound_between_two_readings():
+    clock = SensorClock()
+    clock.Update(SENSORTIME_MASK - 9)
+
+    assert clock.Update(6) == pytest.approx(16 * SENSORTIME_RESOLUTION)
+    assert clock.elapsed == pytest.approx(16 * SENSORTIME_RESOLUTION)
+
+
+def test_imu_step_across_the_counter_wrap(bus, clock):
+    imu = IMU(serial_device=bus)
+    clock.Advance(SENSORTIME_PERIOD - 0.005)
+    imu.UpdateAccelerometer()
+    before = imu.sensor_time
+    clock.Advance(0.01)
+    imu.UpdateAccelerometer()
+
+    assert imu.sensor_time < before
+    assert imu.dt == pytest.approx(0.01, abs=2 * SENSORTIME_RESOLUTION)
+
+
+def test_psi_has_its_own_clock(bus, clock):
+    imu = IMU(serial_device=bus)
+    imu.UpdateAccelerometer()
+    imu.UpdatePsi()
+    angle = imu.angle
+
+    clock.Advance(0.1)
+    imu.UpdateAccelerometer()
+    clock.Advance(0.1)
+    imu.UpdatePsi()
+
+    assert imu.psi_clock.dt == pytest.approx(0.2, abs=2 * SENSORTIME_RESOLUTION)
+    assert imu.dt == pytest.approx(0.1, abs=2 * SENSORTIME_RESOLUTION)
+    assert (imu.angle - angle) == pytest.approx(imu.gyro_data[2] * imu.psi_clock.dt)
@@ -0,0 +1,138 @@
+import pytest
+
+from register_definitions import *
+
+
+def Transactions(bus, call) -> int:
+    bus.ResetCounters()
+    call()
+    return bus.transactions
+
+
+@pytest.mark.parametrize('fixture', ('sensor', 'shadowed'))
+def test_read_all_data_is_one_burst(request, bus, fixture):
+    sensor = request.getfixturevalue(fixture)
+
+    assert Transactions(bus, sensor.ReadAllData) == 1
+    assert bus.bytes_read == DATA_BURST_LENGTH
+
+
+@pytest.mark.parametrize('fixture', ('sensor', 'shadowed'))
+def test_read_all_data_into_is_one_burst(request, bus, fixture):
+    from array import array
+
+    sensor = request.getfixturevalue(fixture)
+    acc = array('f', (0, 0, 0))
+    gyr = array('f', (0, 0, 0))
+
+    assert Transactions(bus, lambda: sensor.ReadAllDataInto(acc, gyr)) == 1
+    assert tuple(acc) == pytest.approx(sensor.ReadAllData()[0], rel=1e-6)
+
+
+@pytest.mark.parametrize('sensor_name', ('Accelerometer', 'Gyroscope'))
+def test_single_axis_reads_match_the_burst(sensor, bus, clock, sensor_name):
+    sensor.WriteRegister(PWR_CTRL, BIT_1 | BIT_2)
+    clock.Advance(0.1)
+    burst = getattr(sensor, 'Raw{}Data'.format(sensor_name))()
+
+    for (axis, value) in zip('XYZ', burst):
+        read = getattr(sensor, 'Raw{}_{}Data'.format(sensor_name, axis))
+        assert Transactions(bus, read) == 1
+        assert read() == value
+
+
+@pytest.mark.parametrize('name', ('EnableAccelerometer', 'EnableGyroscope', 'EnableTemperature', 'EnableFIFOHeader',
+                                  'EnableFIFOSensorTime', 'EnableAccelFilterPeformance', 'EnableGyroNoisePerformance'))
+def test_enable_is_one_write_with_shadow(shadowed, bus, name):
+    assert Transactions(bus, getattr(shadowed, name)) == 1
+    assert bus.bytes_read == 0
+
+
+def test_enable_reads_then_writes_without_shadow(sensor, bus, device):
+    device.registers[PWR_CTRL] = 0x00
+
+    assert Transactions(bus, sensor.EnableGyroscope) == 2
+    assert device.registers[PWR_CTRL] == BIT_1
+
+
+def test_configure_is_one_write_with_shadow(shadowed, bus, device):
+    assert Transactions(bus, lambda: shadowed.Configure(acc_odr=ACC_ODR_1600, acc_range=ACC_RANGE_8G)) == 1
+    assert (device.registers[ACC_CONF] & LSB_MASK_8BIT) == ACC_ODR_1600
+    assert device.registers[ACC_RANGE] == ACC_RANGE_8G
+    assert shadowed.acc_range == ACC_RANGE_VALUES[ACC_RANGE_8G]
+
+
+def test_configure_is_one_read_and_one_write_burst(sensor, bus, device):
+    assert Transactions(bus, lambda: sensor.Configure(acc_odr=ACC_ODR_1600, gyr_odr=GYR_ODR_3200)) == 2
+    assert (device.registers[ACC_CONF] & LSB_MASK_8BIT) == ACC_ODR_1600
+    assert (device.registers[GYR_CONF] & LSB_MASK_8BIT) == GYR_ODR_3200
+
+
+def test_configure_without_change_does_not_write(shadowed, bus):
+    shadowed.Configure(acc_odr=ACC_ODR_1600)
+
+    assert Transactions(bus, lambda: shadowed.Configure(acc_odr=ACC_ODR_1600)) == 0
+
+
+def test_configure_fifo_is_one_write_per_register_block(shadowed, bus, device):
+    # FIFO_DOWNS and FIFO_CONFIG_0 / 1 are two bursts: the watermark registers between them are not touched
+    assert Transactions(bus, lambda: shadowed.ConfigureFIFO(gyr_downsampling=4)) == 2
+    assert Transactions(bus, lambda: shadowed.ConfigureFIFO(gyr_downsampling=4, sensortime=False)) == 1
+    assert (device.registers[FIFO_DOWNS] & FIRST_3_BITS) == 2
+    assert device.registers[FIFO_CONFIG_1] & (BIT_4 | BIT_6 | BIT_7) == (BIT_4 | BIT_6 | BIT_7)
+
+
+def test_configure_rejects_unknown_fields(shadowed, bus, capsys):
+    assert Transactions(bus, lambda: shadowed.Configure(not_a_field=1)) == 0
+    assert "Invalid command / setting!" in capsys.readouterr().out
+
+
+@pytest.fixture
+def unconfigured():
+    from simulator import VirtualI2C, VirtualBMI270
+    from BMI270 import BMI270
+
+    bus = VirtualI2C(VirtualBMI270())
+    sensor = BMI270(serial_device=bus, initialise=False)
+    bus.ResetCounters()
+    return (sensor, bus)
+
+
+@pytest.mark.parametrize('max_write', (0, 1))
+def test_upload_rejects_a_bus_without_room_for_a_burst(unconfigured, max_write):
+    (sensor, bus) = unconfigured
+    bus.max_write = max_write
+
+    with pytest.raises(ValueError, match='max_write'):
+        sensor.LoadConfiguration()
+    assert bus.transactions == 1       # only INTERNAL_STATUS was read
+
+
+def test_upload_bursts_are_limited_to_max_write(unconfigured):
+    (sensor, bus) = unconfigured
+    bus.max_write = 33
+
+    sensor.LoadConfiguration(burst_size=256)
+
+    assert sensor.ReadRegister(INTERNAL_STATUS) & INTERNAL_STATUS_MASK == INTERNAL_STATUS_INIT_OK
+    assert bus.bytes_written >= CONFIG_FILE_SIZE + 2 * (CONFIG_FILE_SIZE // 32)
+
+
+def test_upload_time_excludes_the_pauses_between_steps(unconfigured, monkeypatch):
+    import BMI270
+
+    (sensor, bus) = unconfigured
+    now = [0]
+    monkeypatch.setattr(BMI270, 'ticks_us', lambda: now[0])
+    original = bus.writeto_mem
+
+    def TimedWrite(*args, **kwargs):
+        now[0] += 10        # 10 us on the bus per write
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(bus, 'writeto_mem', TimedWrite)
+    for _ in sensor.ConfigurationSteps(256):
+        now[0] += 5000      # the scheduler runs other work between the steps
+
+    writes = 2 * (CONFIG_FILE_SIZE // 256)     # INIT_ADDR + INIT_DATA per burst
+    assert sensor.config_upload_time == pytest.approx(writes * 10 / 1000000)